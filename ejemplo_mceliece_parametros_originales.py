@@ -1,4 +1,4 @@
-import mceliece, goppa, f_q, random, time
+import mceliece, goppa, f_q, f_q_m_tab, random, time
 
 random.seed(14)
 
@@ -11,6 +11,9 @@ q = 2
 h = [[1], [], [], [1], [], [], [], [], [], [], [1]]
 m = 10
 
+# Tablas de logaritmos de F2^10 (1024 elementos) para acelerar la aritmética del cuerpo
+f_q_m_tab.activar(p, f, h)
+
 
 g = [ [[1]] ] # irreducible en F2^10[x], t = 50
 
@@ -42,7 +45,7 @@ for i in range(dim):
 ct = mceliece.enc(r, pk[0], pk[1], p, f)
 
 # Dec:
-r_recuperado = mceliece.dec(ct,sk[1],sk[2],sk[4],sk[3],p,f,h)
+r_recuperado = mceliece.dec(ct,sk[1],sk[2],sk[4],sk[3],p,f,h,codigo=sk[5])
 print(f'El mensaje enviado era {r}')
 print(f'El mensaje recuperado es {r_recuperado}\n')
 print(f'¿Es r=r_recuperado? : {r==r_recuperado}\n')
@@ -24,7 +24,7 @@ r = [[1],[1]]
 ct = mceliece.enc(r, pk[0], pk[1], p, f)
 
 # Dec:
-r_recuperado = mceliece.dec(ct,sk[1],sk[2],sk[4],sk[3],p,f,h)
+r_recuperado = mceliece.dec(ct,sk[1],sk[2],sk[4],sk[3],p,f,h,codigo=sk[5])
 print('\n')
 print(f'El mensaje enviado era {r}')
 print(f'El mensaje recuperado es {r_recuperado}')
\ No newline at end of file
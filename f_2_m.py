@@ -0,0 +1,297 @@
+# -*- coding: utf-8 -*-
+"""
+Diana Gómez Moreno
+
+Representación binaria (enteros de Python) del anillo F2[x] y de los cuerpos F2^m
+
+Un polinomio de F2[x] se guarda como un único entero, cuyo bit i es el
+coeficiente de x^i. Así, la suma es el XOR de los enteros y el producto es una
+multiplicación sin acarreo (desplazamientos y XOR). El cuerpo F2^m se define como
+F2[x]/<h>, h irreducible de grado m, y sus elementos son enteros < 2^m.
+
+Es la representación que usan internamente f_q, f_q_m, f_q_m_pol y goppa cuando
+p = 2 (y f = [1,1] para Fq^m), convirtiendo las listas de entrada y de salida.
+
+Contiene las siguientes funciones:
+    es_binario(p,f)
+    a_int(a)
+    de_int(a)
+    elem_a_int(a)
+    elem_de_int(a)
+    mult_pol(a,b)
+    div_pol(a,b)
+    resto(a,h)
+    mult(a,b,h)
+    inv_mult(a,h)
+    inv_mult_batch(a,h)
+    pot(a,k,h)
+"""
+
+def es_binario(p,f):
+    '''
+    Parameters
+    ----------
+    p : INT
+        número primo >= 2
+    f : LIST
+        polinomio mónico, irreducible, de grado n >= 1, perteneciente
+        al anillo (Z/pZ)[t]
+
+    Returns
+    -------
+    True si Fq = (Z/pZ)[t]/<f> es el cuerpo F2, es decir, si p = 2 y f = t + 1
+    '''
+    return(p == 2 and f == [1,1])
+
+
+def a_int(a):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        polinomio del anillo (Z/2Z)[x], como en z_pz_pol
+
+    Returns
+    -------
+    El entero cuyo bit i es el coeficiente de x^i de a
+    '''
+    sol = 0
+    for i in range(len(a)-1,-1,-1):
+        sol = (sol << 1) | (a[i] & 1)
+
+    return(sol)
+
+
+def de_int(a):
+    '''
+    Parameters
+    ----------
+    a : INT
+        entero que representa un polinomio de F2[x]
+
+    Returns
+    -------
+    Lista que representa el polinomio a del anillo (Z/2Z)[x], como en z_pz_pol
+    '''
+    return([(a >> i) & 1 for i in range(a.bit_length())])
+
+
+def elem_a_int(a):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        lista de listas que representa un polinomio con coeficientes en F2,
+        con F2 = (Z/2Z)[t]/<t+1> como en f_q (cada coeficiente es [] o [1]).
+        Por ejemplo, un elemento de F2^m como en f_q_m, o el polinomio h
+
+    Returns
+    -------
+    El entero cuyo bit i es el coeficiente de x^i de a
+    '''
+    sol = 0
+    for i in range(len(a)-1,-1,-1):
+        sol = sol << 1
+        if a[i]:
+            sol = sol | (a[i][0] & 1)
+
+    return(sol)
+
+
+def elem_de_int(a):
+    '''
+    Parameters
+    ----------
+    a : INT
+        entero que representa un elemento de F2^m
+
+    Returns
+    -------
+    Lista de listas que representa el elemento a de F2^m como en f_q_m,
+    con f = [1,1]
+    '''
+    return([[1] if (a >> i) & 1 else [] for i in range(a.bit_length())])
+
+
+def mult_pol(a,b):
+    '''
+    Parameters
+    ----------
+    a : INT
+        entero que representa un polinomio de F2[x]
+    b : INT
+        entero que representa un polinomio de F2[x]
+
+    Returns
+    -------
+    El entero que representa el producto de a y b en F2[x]
+    (multiplicación sin acarreo)
+    '''
+    if a < b:
+        a, b = b, a
+
+    sol = 0
+    while b:
+        if b & 1:
+            sol ^= a
+        a <<= 1
+        b >>= 1
+
+    return(sol)
+
+
+def div_pol(a,b):
+    '''
+    Parameters
+    ----------
+    a : INT
+        entero que representa un polinomio de F2[x]
+    b : INT
+        entero no nulo que representa un polinomio de F2[x]
+
+    Returns
+    -------
+    q y r, enteros que representan los polinomios de F2[x] tales que
+    a = q*b + r, con deg(r) < deg(b)
+    '''
+    db = b.bit_length()
+    q = 0
+
+    dif = a.bit_length() - db
+    while dif >= 0:
+        q ^= 1 << dif
+        a ^= b << dif
+        dif = a.bit_length() - db
+
+    return(q,a)
+
+
+def resto(a,h):
+    '''
+    Parameters
+    ----------
+    a : INT
+        entero que representa un polinomio de F2[x]
+    h : INT
+        entero no nulo que representa un polinomio de F2[x]
+
+    Returns
+    -------
+    El entero que representa a (mod h)
+    '''
+    dh = h.bit_length()
+
+    dif = a.bit_length() - dh
+    while dif >= 0:
+        a ^= h << dif
+        dif = a.bit_length() - dh
+
+    return(a)
+
+
+def mult(a,b,h):
+    '''
+    Parameters
+    ----------
+    a : INT
+        entero que representa un elemento de F2^m = F2[x]/<h>
+    b : INT
+        entero que representa un elemento de F2^m = F2[x]/<h>
+    h : INT
+        entero que representa un polinomio irreducible de grado m de F2[x]
+
+    Returns
+    -------
+    El entero que representa el producto de a y b en F2^m
+    '''
+    return(resto(mult_pol(a,b),h))
+
+
+def inv_mult(a,h):
+    '''
+    Parameters
+    ----------
+    a : INT
+        entero que representa un elemento de F2^m = F2[x]/<h>
+    h : INT
+        entero que representa un polinomio irreducible de grado m de F2[x]
+
+    Returns
+    -------
+    El entero que representa el inverso multiplicativo de a en F2^m,
+    calculado con el algoritmo de Euclides extendido en F2[x]. Si a es el 
+    cero, se devuelve 0, como en f_q_m.inv_mult para cualquier otro cuerpo
+    '''
+    r0, r1 = h, resto(a,h)
+    y0, y1 = 0, 1 # r_i = y_i * a (mod h)
+    while r1 > 1:
+        q, r = div_pol(r0, r1)
+        r0, r1 = r1, r
+        y0, y1 = y1, y0 ^ mult_pol(q, y1)
+
+    if r1 == 0: # a = 0, que no tiene inverso
+        return(0)
+
+    return(resto(y1,h))
+
+
+def inv_mult_batch(a,h):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        lista de enteros que representan elementos de F2^m = F2[x]/<h>
+    h : INT
+        entero que representa un polinomio irreducible de grado m de F2[x]
+
+    Returns
+    -------
+    Lista con los inversos multiplicativos de los elementos de a, calculados con 
+    el truco de Montgomery: un único inverso y 3(l-1) productos. Los elementos 
+    nulos, que no tienen inverso, se devuelven como 0
+    '''
+    pref = [0]*len(a) # pref[i] = producto de los elementos no nulos de a[0..i]
+    acc = 1
+    for i in range(len(a)):
+        if a[i]:
+            acc = mult(acc,a[i],h)
+        pref[i] = acc
+
+    inv = inv_mult(acc,h) # inverso de pref[i] en cada paso del bucle
+    sol = [0]*len(a)
+    for i in range(len(a)-1,-1,-1):
+        if a[i]:
+            sol[i] = mult(inv, pref[i-1], h) if i > 0 else inv
+            inv = mult(inv,a[i],h)
+
+    return(sol)
+
+
+def pot(a,k,h):
+    '''
+    Parameters
+    ----------
+    a : INT
+        entero que representa un elemento de F2^m = F2[x]/<h>
+    k : INT
+        número entero
+    h : INT
+        entero que representa un polinomio irreducible de grado m de F2[x]
+
+    Returns
+    -------
+    El entero que representa a^k en F2^m
+    '''
+    if k < 0:
+        a = inv_mult(a,h)
+        k = -k
+
+    sol = 1
+    a = resto(a,h)
+    while k:
+        if k & 1:
+            sol = mult(sol,a,h)
+        a = mult(a,a,h)
+        k >>= 1
+
+    return(sol)
@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+"""
+Diana Gómez Moreno
+
+Representación por planos de bits de vectores de elementos de F2^m
+
+Un vector de l elementos de F2^m = F2[s]/<h> (enteros, véase f_2_m) se guarda
+como una lista de m enteros de l bits: el plano k tiene en su bit i el
+coeficiente de s^k del elemento i. Así, una operación del cuerpo se aplica a
+los l elementos a la vez con operaciones AND y XOR sobre enteros grandes: la
+suma son m XOR y el producto unas m^2 operaciones, sea cual sea l.
+
+Es la representación que usan goppa.decode y mat_f_q_m.mat_h cuando q = 2 y
+hay al menos UMBRAL_PLANOS ai's, para evaluar polinomios en todos los ai de una vez.
+
+Contiene las siguientes funciones:
+    a_planos(u,m)
+    de_planos(a,l)
+    constante(c,m,l)
+    suma(a,b)
+    mult(a,b,h)
+    cuadrado(a,h)
+    inv_mult(a,h)
+    eval_pol(a,u,h,l)
+    ceros(a,l)
+
+Funciones auxiliares:
+    reduce(c,h)
+"""
+
+UMBRAL_PLANOS = 64 # número mínimo de elementos para trabajar con planos de bits
+
+def a_planos(u,m):
+    '''
+    Parameters
+    ----------
+    u : LIST
+        lista de l enteros que representan elementos de F2^m
+    m : INT
+        grado del polinomio h que define F2^m
+
+    Returns
+    -------
+    Lista de m enteros, los planos de bits del vector u: el bit i del plano k
+    es el bit k de u[i]
+    '''
+    if u == []:
+        return([0]*m)
+
+    formato = '0' + str(m) + 'b'
+    columnas = zip(*[format(x, formato) for x in u]) # del bit m-1 al bit 0
+    sol = [int(''.join(c)[::-1], 2) for c in columnas]
+    return(sol[::-1])
+
+
+def de_planos(a,l):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        lista de m enteros, los planos de bits de un vector de l elementos de F2^m
+    l : INT
+        número de elementos del vector
+
+    Returns
+    -------
+    Lista de l enteros que representan los elementos del vector a
+    '''
+    if l == 0:
+        return([])
+
+    formato = '0' + str(l) + 'b'
+    filas = [format(a[k], formato)[::-1] for k in range(len(a)-1,-1,-1)] # el carácter i es el bit i
+    return([int(''.join(c), 2) for c in zip(*filas)])
+
+
+def constante(c,m,l):
+    '''
+    Parameters
+    ----------
+    c : INT
+        entero que representa un elemento de F2^m
+    m : INT
+        grado del polinomio h que define F2^m
+    l : INT
+        número de elementos del vector
+
+    Returns
+    -------
+    Lista de m enteros, los planos de bits del vector de l elementos iguales a c
+    '''
+    uno = (1 << l) - 1
+    return([uno if (c >> k) & 1 else 0 for k in range(m)])
+
+
+def suma(a,b):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        planos de bits de un vector de elementos de F2^m
+    b : LIST
+        planos de bits de un vector de elementos de F2^m, de la misma longitud
+
+    Returns
+    -------
+    Lista con los planos de bits del vector a + b, elemento a elemento
+    '''
+    return([a[k] ^ b[k] for k in range(len(a))])
+
+
+def mult(a,b,h):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        planos de bits de un vector de elementos de F2^m
+    b : LIST
+        planos de bits de un vector de elementos de F2^m, de la misma longitud
+    h : INT
+        entero que representa el polinomio irreducible que define F2^m
+
+    Returns
+    -------
+    Lista con los planos de bits del vector a * b, elemento a elemento: el
+    producto escolar de los planos (un AND y un XOR por cada par) y la
+    reducción módulo h
+    '''
+    m = len(a)
+    c = [0]*(2*m - 1)
+    for i in range(m):
+        ai = a[i]
+        if ai:
+            for j in range(m):
+                c[i+j] ^= ai & b[j]
+
+    return(reduce(c,h))
+
+
+def cuadrado(a,h):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        planos de bits de un vector de elementos de F2^m
+    h : INT
+        entero que representa el polinomio irreducible que define F2^m
+
+    Returns
+    -------
+    Lista con los planos de bits del vector a^2, elemento a elemento. En
+    característica 2 el cuadrado es lineal: el plano i pasa al 2i y se reduce
+    '''
+    m = len(a)
+    c = [0]*(2*m - 1)
+    for i in range(m):
+        c[2*i] = a[i]
+
+    return(reduce(c,h))
+
+
+def inv_mult(a,h):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        planos de bits de un vector de elementos de F2^m
+    h : INT
+        entero que representa el polinomio irreducible que define F2^m
+
+    Returns
+    -------
+    Lista con los planos de bits del vector de los inversos multiplicativos de
+    los elementos de a, calculados como a^(2^m - 2) con m - 1 cuadrados y m - 2
+    productos. Los elementos nulos, que no tienen inverso, se devuelven como 0
+    '''
+    m = len(a)
+    if m == 1: # en F2, el inverso de 1 es 1
+        return(a + [])
+
+    sol = a # a^(2^k - 1), con k = 1
+    for k in range(m - 2):
+        sol = mult(cuadrado(sol,h), a, h)
+
+    return(cuadrado(sol,h))
+
+
+def eval_pol(a,u,h,l):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        lista de enteros que representa un polinomio de F2^m[x] (véase f_2_m_pol)
+    u : LIST
+        planos de bits de un vector de l elementos de F2^m
+    h : INT
+        entero que representa el polinomio irreducible que define F2^m
+    l : INT
+        número de elementos del vector u
+
+    Returns
+    -------
+    Lista con los planos de bits del vector de los a(u[i]), calculados a la vez
+    con la regla de Horner
+    '''
+    m = len(u)
+    uno = (1 << l) - 1
+    sol = [0]*m
+    for i in range(len(a)-1,-1,-1):
+        if i < len(a) - 1:
+            sol = mult(sol,u,h)
+        c = a[i]
+        for k in range(m):
+            if (c >> k) & 1:
+                sol[k] ^= uno
+
+    return(sol)
+
+
+def ceros(a,l):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        planos de bits de un vector de l elementos de F2^m
+    l : INT
+        número de elementos del vector a
+
+    Returns
+    -------
+    Entero de l bits cuyo bit i es 1 si y solo si el elemento i de a es nulo
+    '''
+    sol = 0
+    for ak in a:
+        sol |= ak
+
+    return(~sol & ((1 << l) - 1))
+
+
+#  Funciones auxiliares:
+def reduce(c,h):
+    '''
+    Parameters
+    ----------
+    c : LIST
+        lista de 2m - 1 enteros, los planos de bits de un vector de polinomios de
+        F2[s] de grado < 2m - 1
+    h : INT
+        entero que representa el polinomio irreducible, de grado m, que define F2^m
+
+    Returns
+    -------
+    Lista con los m planos de bits del vector de los restos módulo h: el plano
+    k >= m, que es el coeficiente de s^k = s^(k-m) * (h - s^m), se suma a los
+    planos k - m + b para cada término s^b de h con b < m
+    '''
+    m = h.bit_length() - 1
+    bits = [b for b in range(m) if (h >> b) & 1]
+    for k in range(len(c)-1, m-1, -1):
+        ck = c[k]
+        if ck:
+            for b in bits:
+                c[k - m + b] ^= ck
+
+    return(c[:m])
@@ -0,0 +1,805 @@
+# -*- coding: utf-8 -*-
+"""
+Diana Gómez Moreno
+
+Anillo de polinomios con coeficientes en el cuerpo F2^m, con representación binaria
+
+Cada coeficiente es un entero que representa un elemento de F2^m = F2[s]/<h>
+(véase f_2_m), y un polinomio es una lista de enteros, sin ceros a la derecha.
+h es el entero que representa el polinomio irreducible que define F2^m.
+
+mult acumula los productos sin reducir módulo h y reduce cada coeficiente una 
+única vez; si ambos factores tienen al menos UMBRAL_KARATSUBA coeficientes, usa 
+el algoritmo de Karatsuba.
+
+Contiene las siguientes funciones:
+    suma(a,b)
+    mult(a,b,h)
+    cuadrado(a,h)
+    div_pol(a,b,h,cb_i=None)
+    gcd_ext(a,b,h)
+    pot_mod(a,k,h,g)
+    raiz_mod(a,h,g)
+    eval_pol(a,u,h)
+    eval_pol_multi(a,u,h)
+    eval_fft(a,h)
+    busqueda_chien(a,u,h)
+    raices(a,h)
+    div_lineal(a,u,h)
+    deriv(a)
+
+Funciones auxiliares:
+    vd_len(a)
+    mult_escuela(a,b)
+    mult_karatsuba(a,b)
+    arbol_subproductos(u,h)
+    niveles_fft(h)
+    fft_aditiva(a,L,d,h)
+    desarrollo_taylor(a)
+    separa_raices(a,j,h,sol)
+    gcd_ext_no_mon(a,b,h)
+    a_int(a)
+    de_int(a)
+"""
+import f_2_m
+
+UMBRAL_KARATSUBA = 16 # longitud mínima de los factores para usar Karatsuba
+UMBRAL_MULTIPUNTO = 128 # longitud mínima del polinomio y de los puntos para usar el árbol de subproductos
+BLOQUE_MULTIPUNTO = 16 # puntos por cada árbol de subproductos
+
+_niveles_fft = {} # niveles de la FFT aditiva ya calculados para cada h
+
+def suma(a,b):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        lista de enteros que representa un polinomio de F2^m[x]
+    b : LIST
+        lista de enteros que representa un polinomio de F2^m[x]
+
+    Returns
+    -------
+    Lista de enteros que representa el polinomio a + b (que coincide con a - b)
+    '''
+    if len(a) < len(b):
+        a, b = b, a
+
+    sol = a + []
+    for i in range(len(b)):
+        sol[i] ^= b[i]
+
+    return(vd_len(sol))
+
+
+def mult(a,b,h):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        lista de enteros que representa un polinomio de F2^m[x]
+    b : LIST
+        lista de enteros que representa un polinomio de F2^m[x]
+    h : INT
+        entero que representa el polinomio irreducible que define F2^m
+
+    Returns
+    -------
+    Lista de enteros que representa el polinomio a*b. Los productos se
+    acumulan sin reducir y cada coeficiente se reduce módulo h una única vez.
+    '''
+    if a == [] or b == []:
+        return([])
+
+    sol = mult_karatsuba(a,b)
+    return(vd_len([f_2_m.resto(c, h) for c in sol]))
+
+
+def cuadrado(a,h):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        lista de enteros que representa un polinomio de F2^m[x]
+    h : INT
+        entero que representa el polinomio irreducible que define F2^m
+
+    Returns
+    -------
+    Lista de enteros que representa el polinomio a*a = sum(ai^2 * x^(2i)), pues 
+    la característica es 2
+    '''
+    if a == []:
+        return([])
+
+    sol = [0]*(2*len(a) - 1)
+    for i in range(len(a)):
+        if a[i]:
+            sol[2*i] = f_2_m.mult(a[i], a[i], h)
+
+    return(vd_len(sol))
+
+
+def div_pol(a,b,h,cb_i=None):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        lista de enteros que representa un polinomio de F2^m[x]
+    b : LIST
+        lista de enteros que representa un polinomio no nulo de F2^m[x]
+    h : INT
+        entero que representa el polinomio irreducible que define F2^m
+    cb_i : INT, opcional
+        inverso del coeficiente principal de b, si ya se conoce
+
+    Returns
+    -------
+    q y r, listas de enteros que representan los polinomios de F2^m[x]
+    tales que a = q*b + r, con deg(r) < deg(b)
+    '''
+    r = vd_len(a + [])
+    db = len(b) - 1
+
+    if len(r) <= db:
+        return([],r)
+
+    q = [0]*(len(r) - db)
+    if cb_i is None:
+        cb_i = f_2_m.inv_mult(b[-1], h) # inverso del coeficiente principal de b
+
+    for i in range(len(r)-1, db-1, -1):
+        c = r[i]
+        if c == 0:
+            continue
+        if cb_i != 1:
+            c = f_2_m.mult(c, cb_i, h)
+        q[i-db] = c
+        # restamos c * x^(i-db) * b
+        for j in range(db):
+            if b[j]:
+                r[i-db+j] ^= f_2_m.mult(c, b[j], h)
+        r[i] = 0
+
+    return(vd_len(q),vd_len(r))
+
+
+def gcd_ext(a,b,h):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        lista de enteros que representa un polinomio de F2^m[x]
+    b : LIST
+        lista de enteros que representa un polinomio de F2^m[x]
+    h : INT
+        entero que representa el polinomio irreducible que define F2^m
+
+    Returns
+    -------
+    g,x,y listas de enteros que representan los polinomios de F2^m[x] tales que
+    gcd(a,b) = g, con g mónico, y a*x + b*y = g
+    '''
+    g,x,y = gcd_ext_no_mon(a,b,h)
+
+    if g[-1] != 1:
+        coef = [f_2_m.inv_mult(g[-1], h)]
+        g = mult(g,coef,h)
+        x = mult(x,coef,h)
+        y = mult(y,coef,h)
+
+    return(g,x,y)
+
+
+def pot_mod(a,k,h,g):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        lista de enteros que representa un polinomio de F2^m[x]
+    k : INT
+        número entero, exponente de la potencia
+    h : INT
+        entero que representa el polinomio irreducible que define F2^m
+    g : LIST
+        lista de enteros que representa un polinomio mónico de F2^m[x]
+
+    Returns
+    -------
+    Lista de enteros que representa el polinomio a^k (mod g)
+    '''
+    if k < 0: # solo existe si a tiene inverso módulo g
+        a = div_pol(gcd_ext(a,g,h)[1], g, h)[1]
+        k = -k
+
+    cg_i = f_2_m.inv_mult(g[-1], h) # se reduce siempre módulo g
+    sol = [1]
+    a = div_pol(a,g,h,cg_i)[1]
+    while k:
+        if k & 1:
+            sol = div_pol(mult(sol,a,h), g, h, cg_i)[1]
+        k >>= 1
+        if k:
+            a = div_pol(cuadrado(a,h), g, h, cg_i)[1]
+
+    return(div_pol(sol,g,h,cg_i)[1])
+
+
+def raiz_mod(a,h,g):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        lista de enteros que representa un polinomio de F2^m[x]
+    h : INT
+        entero que representa el polinomio irreducible que define F2^m
+    g : LIST
+        lista de enteros que representa un polinomio de F2^m[x] libre de cuadrados
+
+    Returns
+    -------
+    Lista de enteros que representa la raíz cuadrada de a módulo g, el único 
+    polinomio r de grado < deg(g) con r^2 = a (mod g). Si a = a0^2 + x*a1^2, 
+    r = a0 + sqrt(x)*a1, donde las raíces de los coeficientes son c^(2^(m-1)) y 
+    sqrt(x) = g0/g1 (mod g), con g = g0^2 + x*g1^2. Lanza ValueError si g1 no es 
+    invertible módulo g, es decir, si g no es libre de cuadrados
+    '''
+    m = h.bit_length() - 1
+    k = 1 << (m - 1) # c^k es la raíz cuadrada de c en F2^m
+    g0 = vd_len([f_2_m.pot(c, k, h) for c in g[0::2]])
+    g1 = vd_len([f_2_m.pot(c, k, h) for c in g[1::2]])
+    d, g1_inv = gcd_ext(g1,g,h)[:2]
+    if d != [1]:
+        raise ValueError('El polinomio g no es libre de cuadrados')
+    rx = div_pol(mult(g0,g1_inv,h), g, h)[1] # sqrt(x) (mod g)
+
+    a = div_pol(a,g,h)[1]
+    a0 = vd_len([f_2_m.pot(c, k, h) for c in a[0::2]])
+    a1 = vd_len([f_2_m.pot(c, k, h) for c in a[1::2]])
+    return(div_pol(suma(a0, mult(rx,a1,h)), g, h)[1])
+
+
+def eval_pol(a,u,h):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        lista de enteros que representa un polinomio de F2^m[x]
+    u : INT
+        entero que representa un elemento de F2^m
+    h : INT
+        entero que representa el polinomio irreducible que define F2^m
+
+    Returns
+    -------
+    El entero que representa a(u), calculado mediante la regla de Horner
+    '''
+    sol = 0
+    for i in range(len(a)-1,-1,-1):
+        sol = f_2_m.mult(sol, u, h) ^ a[i]
+
+    return(sol)
+
+
+def eval_pol_multi(a,u,h):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        lista de enteros que representa un polinomio de F2^m[x]
+    u : LIST
+        lista de enteros que representan elementos de F2^m
+    h : INT
+        entero que representa el polinomio irreducible que define F2^m
+
+    Returns
+    -------
+    Lista de enteros con a(u[i]) para cada i. Si a y u tienen al menos 
+    UMBRAL_MULTIPUNTO elementos, se evalúa con el árbol de subproductos de cada 
+    bloque de BLOQUE_MULTIPUNTO puntos: a se reduce módulo el producto de los 
+    (x - u[i]) del bloque y el resto se reduce después por las dos mitades del 
+    bloque, hasta llegar a los (x - u[i]). En otro caso, con la regla de Horner
+    '''
+    if len(a) < UMBRAL_MULTIPUNTO or len(u) < UMBRAL_MULTIPUNTO:
+        return([eval_pol(a,x,h) for x in u])
+
+    sol = []
+    for s in range(0, len(u), BLOQUE_MULTIPUNTO):
+        arbol = arbol_subproductos(u[s:s+BLOQUE_MULTIPUNTO],h)
+        restos = [div_pol(a,arbol[-1][0],h)[1]]
+        for k in range(len(arbol)-2,-1,-1):
+            restos = [div_pol(restos[j//2],arbol[k][j],h)[1] for j in range(len(arbol[k]))]
+        sol += [r[0] if r else 0 for r in restos]
+
+    return(sol)
+
+
+def eval_fft(a,h):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        lista de enteros que representa un polinomio de F2^m[x]
+    h : INT
+        entero que representa el polinomio irreducible que define F2^m
+
+    Returns
+    -------
+    Lista de 2^m enteros con a(u) en la posición u, para todos los elementos u 
+    de F2^m, calculada con la FFT aditiva de Gao-Mateer en la base 1, s, ..., s^(m-1)
+    '''
+    return(fft_aditiva(a, niveles_fft(h), 0, h))
+
+
+def busqueda_chien(a,u,h):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        lista de enteros que representa un polinomio de F2^m[x]
+    u : LIST
+        lista de enteros que representan elementos no nulos de F2^m que son 
+        potencias consecutivas de un mismo elemento: u[i] = u[0] * alfa^i
+    h : INT
+        entero que representa el polinomio irreducible que define F2^m
+
+    Returns
+    -------
+    Lista ordenada de las posiciones i tales que a(u[i]) = 0, por búsqueda de 
+    Chien: cada término a[j]*u[i]^j se obtiene del anterior multiplicándolo 
+    por alfa^j, con deg(a) productos por punto, y la búsqueda termina al 
+    encontrar deg(a) raíces. Lanza ValueError si los u[i] no son de esa forma
+    '''
+    a = vd_len(a + [])
+    t = len(a) - 1
+    sol = []
+    if t <= 0 or u == []:
+        return(sol)
+    if u[0] == 0:
+        raise ValueError('Los puntos de la búsqueda de Chien deben ser no nulos')
+
+    alfa = f_2_m.mult(u[1], f_2_m.inv_mult(u[0],h), h) if len(u) > 1 else 1
+    paso = [1]*(t+1) # alfa^j
+    term = a + [] # a[j] * u[i]^j
+    y = 1
+    for j in range(1,t+1):
+        paso[j] = f_2_m.mult(paso[j-1], alfa, h)
+        y = f_2_m.mult(y, u[0], h)
+        term[j] = f_2_m.mult(a[j], y, h)
+
+    x = u[0]
+    for i in range(len(u)):
+        if i > 0:
+            x = f_2_m.mult(x, alfa, h)
+            if x != u[i]:
+                raise ValueError('Los puntos de la búsqueda de Chien no son potencias consecutivas')
+            for j in range(1,t+1):
+                term[j] = f_2_m.mult(term[j], paso[j], h)
+
+        s = 0
+        for c in term:
+            s ^= c
+        if s == 0:
+            sol.append(i)
+            if len(sol) == t: # a no tiene más raíces
+                break
+
+    return(sol)
+
+
+def raices(a,h):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        lista de enteros que representa un polinomio de F2^m[x]
+    h : INT
+        entero que representa el polinomio irreducible que define F2^m
+
+    Returns
+    -------
+    Lista ordenada de los enteros que representan las raíces distintas de a en 
+    F2^m. Se toma s = gcd(a, x^(2^m) - x), producto de los (x - u) con u raíz de 
+    a, y se separan sus factores con el algoritmo de la traza de Berlekamp 
+    (separa_raices), con un coste que depende de deg(a) y de m, pero no del 
+    número de elementos de F2^m
+    '''
+    a = vd_len(a + [])
+    if len(a) <= 1:
+        return([])
+
+    m = h.bit_length() - 1
+    a = gcd_ext(a,[],h)[0] # mónico
+    xq = pot_mod([0,1], 1 << m, h, a) # x^(2^m) (mod a)
+    s = gcd_ext(a, suma(xq,[0,1]), h)[0]
+
+    sol = []
+    separa_raices(s,0,h,sol)
+    return(sorted(sol))
+
+
+def div_lineal(a,u,h):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        lista de enteros que representa un polinomio de F2^m[x]
+    u : INT
+        entero que representa un elemento de F2^m
+    h : INT
+        entero que representa el polinomio irreducible que define F2^m
+
+    Returns
+    -------
+    q y r tales que a = q*(x + u) + r, con q lista de enteros que representa un 
+    polinomio de F2^m[x] y r = a(u), calculados a la vez mediante la regla de Horner
+    '''
+    if a == []:
+        return([],0)
+
+    q = [0]*(len(a)-1)
+    r = a[-1]
+    for i in range(len(a)-2,-1,-1):
+        q[i] = r
+        r = f_2_m.mult(r, u, h) ^ a[i]
+
+    return(vd_len(q),r)
+
+
+def deriv(a):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        lista de enteros que representa un polinomio de F2^m[x]
+
+    Returns
+    -------
+    Lista de enteros que representa la derivada de a. Como la característica
+    es 2, solo sobreviven los términos de grado impar.
+    '''
+    sol = [a[i] if i % 2 == 1 else 0 for i in range(1,len(a))]
+    return(vd_len(sol))
+
+
+# Funciones auxiliares:
+def vd_len(a):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        lista de enteros que representa un polinomio de F2^m[x]
+
+    Returns
+    -------
+    La misma lista a, sin los ceros de la derecha
+    '''
+    while a and a[-1] == 0:
+        a.pop()
+
+    return(a)
+
+
+def mult_escuela(a,b):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        lista de enteros que representa un polinomio de F2^m[x]
+    b : LIST
+        lista de enteros que representa un polinomio de F2^m[x]
+
+    Returns
+    -------
+    Lista de longitud len(a) + len(b) - 1 con los coeficientes de a*b sin reducir
+    módulo h (productos en F2[x]), calculados con el producto escolar
+    '''
+    if a == [] or b == []:
+        return([])
+
+    sol = [0]*(len(a) + len(b) - 1)
+    for i in range(len(a)):
+        ai = a[i]
+        if ai == 0:
+            continue
+        for j in range(len(b)):
+            if b[j]:
+                sol[i+j] ^= f_2_m.mult_pol(ai, b[j])
+
+    return(sol)
+
+
+def mult_karatsuba(a,b):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        lista de enteros que representa un polinomio de F2^m[x]
+    b : LIST
+        lista de enteros que representa un polinomio de F2^m[x]
+
+    Returns
+    -------
+    Lista de longitud len(a) + len(b) - 1 con los coeficientes de a*b sin reducir
+    módulo h, calculados con el algoritmo de Karatsuba: si a = a0 + a1*x^k y 
+    b = b0 + b1*x^k, a*b = a0*b0 + ((a0+a1)*(b0+b1) + a0*b0 + a1*b1)*x^k + a1*b1*x^(2k).
+    Por debajo de UMBRAL_KARATSUBA se usa el producto escolar
+    '''
+    la, lb = len(a), len(b)
+    if la < lb:
+        a, b, la, lb = b, a, lb, la
+
+    if lb < UMBRAL_KARATSUBA:
+        return(mult_escuela(a,b))
+
+    sol = [0]*(la + lb - 1)
+    if 2*lb <= la: # factores muy desiguales: se multiplica a por bloques de longitud lb
+        for i in range(0, la, lb):
+            prod = mult_karatsuba(a[i:i+lb], b)
+            for j in range(len(prod)):
+                sol[i+j] ^= prod[j]
+        return(sol)
+
+    k = la // 2 # punto de corte, con k < lb
+    a0, a1 = a[:k], a[k:]
+    b0, b1 = b[:k], b[k:]
+    z0 = mult_karatsuba(a0,b0)
+    z2 = mult_karatsuba(a1,b1)
+    z1 = mult_karatsuba([x ^ y for x,y in zip(a0,a1)] + a1[k:], 
+                        [x ^ y for x,y in zip(b0,b1)] + b0[len(b1):] + b1[k:])
+
+    for i in range(len(z0)):
+        sol[i] ^= z0[i]
+        sol[i+k] ^= z0[i]
+    for i in range(len(z2)):
+        sol[i+2*k] ^= z2[i]
+        sol[i+k] ^= z2[i]
+    for i in range(len(z1)):
+        sol[i+k] ^= z1[i]
+
+    return(sol)
+
+
+def arbol_subproductos(u,h):
+    '''
+    Parameters
+    ----------
+    u : LIST
+        lista no vacía de enteros que representan elementos de F2^m
+    h : INT
+        entero que representa el polinomio irreducible que define F2^m
+
+    Returns
+    -------
+    Lista con los niveles del árbol de subproductos de los puntos u: el nivel 0 
+    son los polinomios x - u[i], cada nivel es el producto de los polinomios 
+    consecutivos dos a dos del anterior, y el último nivel tiene un único 
+    polinomio, el producto de todos los (x - u[i])
+    '''
+    arbol = [[[x,1] for x in u]] # x - u[i] = x + u[i]
+    while len(arbol[-1]) > 1:
+        nivel = arbol[-1]
+        arbol.append([mult(nivel[i],nivel[i+1],h) if i+1 < len(nivel) else nivel[i] 
+                      for i in range(0, len(nivel), 2)])
+
+    return(arbol)
+
+
+def niveles_fft(h):
+    '''
+    Parameters
+    ----------
+    h : INT
+        entero que representa el polinomio irreducible que define F2^m
+
+    Returns
+    -------
+    Lista con los datos de cada nivel de recursión de la FFT aditiva, que solo 
+    dependen de h y se calculan una única vez. Partiendo de la base b_1,...,b_k 
+    (en el primer nivel, 1, s, ..., s^(m-1)), cada nivel es el par (b_k, G), con 
+    G la lista de los 2^(k-1) elementos generados por c_i = b_i/b_k, i < k (G[j] 
+    es la suma de los c_i con el bit i de j igual a 1). La base del nivel 
+    siguiente es d_i = c_i^2 + c_i
+    '''
+    sol = _niveles_fft.get(h)
+    if sol is None:
+        sol = []
+        base = [1 << i for i in range(h.bit_length() - 1)]
+        while base != []:
+            bk = base[-1]
+            bk_i = f_2_m.inv_mult(bk, h)
+            c = [f_2_m.mult(b, bk_i, h) for b in base[:-1]]
+            G = [0]
+            for ci in c:
+                G += [x ^ ci for x in G]
+            sol.append((bk, G))
+            base = [f_2_m.mult(ci, ci, h) ^ ci for ci in c]
+        _niveles_fft[h] = sol
+
+    return(sol)
+
+
+def fft_aditiva(a,L,d,h):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        lista de enteros que representa un polinomio de F2^m[x]
+    L : LIST
+        niveles de la FFT, calculados con niveles_fft(h)
+    d : INT
+        nivel de recursión, 0 <= d <= len(L)
+    h : INT
+        entero que representa el polinomio irreducible que define F2^m
+
+    Returns
+    -------
+    Lista de 2^k enteros, k = len(L) - d, con a evaluado en los elementos 
+    generados por la base del nivel d. Con b = L[d][0], se toma 
+    a(b*x) = a0(x^2 + x) + x*a1(x^2 + x) (desarrollo_taylor), se evalúan a0 y a1 
+    en el nivel d + 1 y se combinan: a(b*G[j]) = u[j] + G[j]*v[j] y 
+    a(b*(G[j] + 1)) = a(b*G[j]) + v[j]
+    '''
+    k = len(L) - d
+    if len(a) <= 1:
+        return([a[0] if a else 0] * (1 << k))
+    if k == 0:
+        return([a[0]])
+
+    bk, G = L[d]
+    b = []
+    pot = 1 # bk^i
+    for c in a:
+        b.append(f_2_m.mult(c, pot, h) if c else 0)
+        pot = f_2_m.mult(pot, bk, h)
+
+    b0, b1 = desarrollo_taylor(b)
+    u = fft_aditiva(b0, L, d+1, h)
+    v = fft_aditiva(b1, L, d+1, h)
+
+    mitad = 1 << (k-1)
+    sol = [0] * (2*mitad)
+    for j in range(mitad):
+        vj = v[j]
+        w = u[j] ^ f_2_m.mult(G[j], vj, h) if vj else u[j]
+        sol[j] = w
+        sol[j + mitad] = w ^ vj
+
+    return(sol)
+
+
+def desarrollo_taylor(a):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        lista de enteros que representa un polinomio de F2^m[x]
+
+    Returns
+    -------
+    a0, a1 listas de enteros (de la misma longitud) tales que 
+    a = sum((a0[i] + a1[i]*x) * (x^2 + x)^i). Si 2t < len(a) <= 4t, con t potencia 
+    de 2, se divide a entre (x^2 + x)^t = x^(2t) + x^t y se desarrollan cociente 
+    y resto
+    '''
+    if len(a) <= 2:
+        a = a + [0]*(2 - len(a))
+        return([a[0]], [a[1]])
+
+    t = 1
+    while 4*t < len(a):
+        t = 2*t
+
+    r = a + []
+    q = [0] * (len(a) - 2*t)
+    for i in range(len(a)-1, 2*t-1, -1): # división entre x^(2t) + x^t
+        c = r[i]
+        if c:
+            q[i - 2*t] = c
+            r[i - t] ^= c
+
+    r0, r1 = desarrollo_taylor(r[:2*t])
+    q0, q1 = desarrollo_taylor(q)
+    return(r0 + [0]*(t - len(r0)) + q0, r1 + [0]*(t - len(r1)) + q1)
+
+
+def separa_raices(a,j,h,sol):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        lista de enteros que representa un polinomio mónico de F2^m[x], producto 
+        de factores x - u distintos
+    j : INT
+        primer elemento s^j de la base de F2^m con el que se intenta separar
+    h : INT
+        entero que representa el polinomio irreducible que define F2^m
+    sol : LIST
+        lista a la que se añaden las raíces de a
+
+    Returns
+    -------
+    None. Si deg(a) >= 2, para b = s^j, s^(j+1), ... se calcula 
+    gcd(a, Tr(b*x) mod a), con Tr(y) = y + y^2 + ... + y^(2^(m-1)). Cada raíz u 
+    de a es raíz de Tr(b*x) o de Tr(b*x) + 1 según sea Tr(b*u), y dos raíces 
+    distintas difieren en la traza de algún elemento de la base, así que algún b 
+    separa a en dos factores, que se siguen separando con los b siguientes
+    '''
+    if len(a) <= 1:
+        return
+    if len(a) == 2:
+        sol.append(a[0]) # x + u, con raíz u
+        return
+
+    m = h.bit_length() - 1
+    for i in range(j, m):
+        y = div_pol([0, 1 << i], a, h, 1)[1] # b*x (mod a)
+        tr = y
+        for k in range(m - 1):
+            y = div_pol(cuadrado(y,h), a, h, 1)[1]
+            tr = suma(tr,y)
+
+        d = gcd_ext(a,tr,h)[0]
+        if 1 < len(d) < len(a):
+            separa_raices(d,i+1,h,sol)
+            separa_raices(div_pol(a,d,h,1)[0],i+1,h,sol)
+            return
+
+
+def gcd_ext_no_mon(a,b,h):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        lista de enteros que representa un polinomio de F2^m[x]
+    b : LIST
+        lista de enteros que representa un polinomio de F2^m[x]
+    h : INT
+        entero que representa el polinomio irreducible que define F2^m
+
+    Returns
+    -------
+    g,x,y listas de enteros que representan los polinomios de F2^m[x] tales que
+    gcd(a,b) = g, con a*x + b*y = g, g no necesariamente mónico
+    '''
+    r0, r1 = vd_len(a + []), vd_len(b + [])
+    x0, x1 = [1], []
+    y0, y1 = [], [1]
+
+    while r1 != []:
+        q, r = div_pol(r0, r1, h)
+        r0, r1 = r1, r
+        x0, x1 = x1, suma(x0, mult(q, x1, h))
+        y0, y1 = y1, suma(y0, mult(q, y1, h))
+
+    return(r0,x0,y0)
+
+
+def a_int(a):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        lista de listas de listas que representa un polinomio de F2^m[x]
+        como en f_q_m_pol, con p = 2 y f = [1,1]
+
+    Returns
+    -------
+    Lista de enteros que representa el mismo polinomio
+    '''
+    return(vd_len([f_2_m.elem_a_int(c) for c in a]))
+
+
+def de_int(a):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        lista de enteros que representa un polinomio de F2^m[x]
+
+    Returns
+    -------
+    Lista de listas de listas que representa el mismo polinomio como en
+    f_q_m_pol, con p = 2 y f = [1,1]
+    '''
+    return([f_2_m.elem_de_int(c) for c in a])
@@ -15,10 +15,35 @@ Contiene las siguientes funciones:
     inv_adit(a,p,f)
     mult(a,b,p,f)
     inv_mult(a,p,f)
+    inv_mult_batch(a,p,f)
     pot(a,k,p,f)
-    rand_elem(p,f)
+    rand_elem(p,f,azar=None)
+
+Modo tabla, para q <= TAM_MAX_TABLAS:
+    tablas(p,f)
+    a_ind(a,T)
+    de_ind(i,T)
+    suma_ind(x,y,T)
+    inv_adit_ind(x,T)
+    mult_ind(x,y,T)
+    inv_mult_ind(x,T)
+
+Contexto del cuerpo:
+    Contexto(p,f)
+    contexto(p,f)
+
+mult, inv_mult y pot delegan en el Contexto de (p,f), que se construye una única 
+vez por cuerpo. Si q <= TAM_MAX_TABLAS, son consultas en las tablas de Fq. En 
+otro caso, si p = 2, se calculan con la representación binaria de f_2_m. En el 
+resto de casos, mult es z_pz_pol.mult (con la sustitución de Kronecker si 
+n >= z_pz_pol.UMBRAL_KRONECKER) seguido de la reducción módulo f.
 """
-import z_pz_pol, z_pz
+import z_pz_pol, z_pz, f_2_m
+
+TAM_MAX_TABLAS = 2**12 # mayor q para el que se construyen tablas
+_tablas = {} # tablas ya construidas para cada (p,f), o None si q es demasiado grande
+_contextos = {} # contexto ya construido para cada (p,f)
+_ultimo = None # último contexto devuelto por contexto(p,f)
 
 def cero(p,f):
     '''
@@ -122,9 +147,7 @@ def mult(a,b,p,f):
    Lista de tamaño < n que representa el elemento del cuerpo Fq resultado 
    de multiplicar a y b.
    '''
-   aux = z_pz_pol.mult(a,b,p)
-   sol = z_pz_pol.div_pol(aux, f, p)[1]
-   return (sol)
+   return(contexto(p,f).mult(a,b))
 
 
 def inv_mult(a,p,f):
@@ -145,9 +168,28 @@ def inv_mult(a,p,f):
     sol, lista de tamaño < n que representa el inverso multiplicativo del 
     elemento a en el cuerpo Fq
     '''
-    sol = z_pz_pol.gcd_ext(f,a,p)[2]
-    sol = z_pz_pol.div_pol(sol, f, p)[1] #debe pertenecer al cuerpo
-    return(sol)
+    return(contexto(p,f).inv_mult(a))
+
+
+def inv_mult_batch(a,p,f):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        lista de elementos del cuerpo Fq
+    p : INT
+        número primo >= 2
+    f : LIST
+        polinomio mónico, irreducible, de grado n >= 1, perteneciente 
+        al anillo (Z/pZ)[x]
+
+    Returns
+    -------
+    Lista con los inversos multiplicativos de los elementos de a, calculados con 
+    el truco de Montgomery: un único inverso y 3(l-1) productos. Los elementos 
+    nulos, que no tienen inverso, se devuelven como el cero de Fq
+    '''
+    return(contexto(p,f).inv_mult_batch(a))
 
 
 def pot(a,k,p,f):
@@ -169,11 +211,10 @@ def pot(a,k,p,f):
     -------
     Lista que representa el elemento del cuerpo Fq resultado de calcular a^k 
     '''
-    sol = z_pz_pol.pot_mod(a,k,p,f)
-    return(sol)
+    return(contexto(p,f).pot(a,k))
 
 
-def rand_elem(p,f):
+def rand_elem(p,f,azar=None):
     '''
     Parameters
     ----------
@@ -182,6 +223,9 @@ def rand_elem(p,f):
     f : LIST
         polinomio mónico, irreducible, de grado n >= 1, perteneciente 
         al anillo (Z/pZ)[x]
+    azar : random.Random, opcional
+        generador de números aleatorios del que se toma el elemento; si no se 
+        da, se usa el del módulo random
 
     Returns
     -------
@@ -191,7 +235,368 @@ def rand_elem(p,f):
     sol = [z_pz.cero(p)]*n
     
     for i in range(n):
-        sol[i] = z_pz.rand_elem(p)
+        sol[i] = z_pz.rand_elem(p,azar)
             
     sol = z_pz_pol.vd_len(sol, p)        
     return(sol)
+
+
+# Contexto del cuerpo:
+class Contexto:
+    '''
+    Cuerpo Fq con p y f fijados. Guarda los datos que no cambian de una operación 
+    a otra (grado n, q, cero, uno, tablas o f en binario), y sus métodos equivalen 
+    a las funciones del módulo sin los argumentos p y f:
+        tablas = TablasFq del cuerpo, o None si q > TAM_MAX_TABLAS
+        fb = entero que representa f si p = 2 (véase f_2_m), o None
+        zpz = Contexto de Z/pZ
+    '''
+    __slots__ = ('p', 'f', 'n', 'q', 'cero', 'uno', 'tablas', 'fb', 'zpz')
+
+    def __init__(self,p,f):
+        self.p = p
+        self.f = f + []
+        self.n = len(f) - 1
+        self.q = p**self.n
+        self.cero = cero(p,f)
+        self.uno = uno(p,f)
+        self.tablas = tablas(p,f)
+        self.fb = f_2_m.a_int(f) if p == 2 else None
+        self.zpz = z_pz.contexto(p)
+
+    def suma(self,a,b):
+        return(z_pz_pol.suma(a,b,self.p))
+
+    def inv_adit(self,a):
+        return(z_pz_pol.inv_adit(a,self.p))
+
+    def mult(self,a,b):
+        T = self.tablas
+        if T is not None:
+            return(de_ind(mult_ind(a_ind(a,T), a_ind(b,T), T), T))
+
+        if self.fb is not None:
+            sol = f_2_m.mult(f_2_m.a_int(a), f_2_m.a_int(b), self.fb)
+            return(f_2_m.de_int(sol))
+
+        aux = z_pz_pol.mult(a,b,self.p)
+        return(z_pz_pol.div_pol(aux, self.f, self.p)[1])
+
+    def inv_mult(self,a):
+        T = self.tablas
+        if T is not None:
+            return(de_ind(inv_mult_ind(a_ind(a,T), T), T))
+
+        if self.fb is not None:
+            return(f_2_m.de_int(f_2_m.inv_mult(f_2_m.a_int(a), self.fb)))
+
+        sol = z_pz_pol.gcd_ext(self.f,a,self.p)[2]
+        return(z_pz_pol.div_pol(sol, self.f, self.p)[1]) #debe pertenecer al cuerpo
+
+    def inv_mult_batch(self,a):
+        T = self.tablas
+        if T is not None: # cada inverso es una consulta en la tabla
+            sol = []
+            for x in a:
+                i = a_ind(x,T)
+                sol.append(de_ind(inv_mult_ind(i,T),T) if i else cero(self.p,self.f))
+            return(sol)
+
+        if self.fb is not None:
+            sol = f_2_m.inv_mult_batch([f_2_m.a_int(x) for x in a], self.fb)
+            return([f_2_m.de_int(x) for x in sol])
+
+        pref = [0]*len(a) # pref[i] = producto de los elementos no nulos de a[0..i]
+        acc = self.uno
+        for i in range(len(a)):
+            if a[i] != self.cero:
+                acc = self.mult(acc,a[i])
+            pref[i] = acc
+
+        inv = self.inv_mult(acc) # inverso de pref[i] en cada paso del bucle
+        sol = [0]*len(a)
+        for i in range(len(a)-1,-1,-1):
+            if a[i] != self.cero:
+                sol[i] = self.mult(inv,pref[i-1]) if i > 0 else inv
+                inv = self.mult(inv,a[i])
+            else:
+                sol[i] = cero(self.p,self.f)
+
+        return(sol)
+
+    def pot(self,a,k):
+        T = self.tablas
+        if T is not None:
+            x = a_ind(a,T)
+            if x == 0: # 0^0 = 1 y, como en inv_mult, 0^k = 0 para k != 0
+                return(self.uno + [] if k == 0 else self.cero + [])
+            return(de_ind(T.exp[(T.log[x]*k) % (T.q - 1)], T))
+
+        if self.fb is not None:
+            return(f_2_m.de_int(f_2_m.pot(f_2_m.a_int(a), k, self.fb)))
+
+        return(z_pz_pol.pot_mod(a,k,self.p,self.f))
+
+    def rand_elem(self):
+        return(rand_elem(self.p,self.f))
+
+
+def contexto(p,f):
+    '''
+    Parameters
+    ----------
+    p : INT
+        número primo >= 2
+    f : LIST
+        polinomio mónico, irreducible, de grado n >= 1, perteneciente 
+        al anillo (Z/pZ)[x]
+
+    Returns
+    -------
+    El objeto Contexto del cuerpo Fq = (Z/pZ)[x]/<f>, que se construye una única 
+    vez por cuerpo. Se comprueba primero el último contexto devuelto, que es el 
+    caso habitual en los bucles
+    '''
+    global _ultimo
+    sol = _ultimo
+    if sol is not None and sol.p == p and sol.f == f:
+        return(sol)
+
+    clave = (p, tuple(f))
+    sol = _contextos.get(clave)
+    if sol is None:
+        sol = Contexto(p,f)
+        _contextos[clave] = sol
+    _ultimo = sol
+    return(sol)
+
+
+# Tablas de Fq (modo tabla):
+class TablasFq:
+    '''
+    Tablas de un cuerpo Fq concreto, con q <= TAM_MAX_TABLAS. Cada elemento de Fq
+    se identifica con un índice 0 <= i < q, el entero cuyas cifras en base p son
+    sus coeficientes (si n = 1, el índice es el propio elemento de Z/pZ):
+        elem[i] = lista que representa el elemento de índice i
+        indice[tuple(a)] = índice del elemento a
+        log[i] = j tal que elem[i] = alpha^j, con alpha primitivo (log[0] = None)
+        exp[j] = índice de alpha^j, de longitud 2*(q-1)
+        zech[k] = índice de 1 + alpha^k
+        inv[i] = índice del inverso multiplicativo de elem[i] (inv[0] = None)
+    '''
+    __slots__ = ('p', 'n', 'q', 'elem', 'indice', 'log', 'exp', 'zech', 'inv')
+
+
+def tablas(p,f):
+    '''
+    Parameters
+    ----------
+    p : INT
+        número primo >= 2
+    f : LIST
+        polinomio mónico, irreducible, de grado n >= 1, perteneciente 
+        al anillo (Z/pZ)[x]
+
+    Returns
+    -------
+    T, las tablas del cuerpo Fq, o None si q > TAM_MAX_TABLAS. 
+    Se construyen la primera vez que se piden y se guardan para cada (p,f).
+    '''
+    clave = (p, tuple(f))
+    if clave in _tablas:
+        return(_tablas[clave])
+    
+    n = len(f) - 1
+    q = p**n
+    if q > TAM_MAX_TABLAS:
+        _tablas[clave] = None
+        return(None)
+    
+    elem = [0]*q
+    indice = {}
+    for i in range(q):
+        coef = [0]*n
+        c = i
+        for j in range(n):
+            c, coef[j] = divmod(c, p)
+        elem[i] = z_pz_pol.vd_len(coef, p)
+        indice[tuple(elem[i])] = i
+    
+    # buscamos un elemento primitivo alpha: alpha^((q-1)/r) != 1 para todo primo r | q-1
+    primos = z_pz.factores_primos(q-1)
+    alfa = None
+    i = 1
+    while alfa is None:
+        alfa = elem[i]
+        for r in primos:
+            if z_pz_pol.pot_mod(alfa, (q-1)//r, p, f) == z_pz_pol.uno(p):
+                alfa = None
+                break
+        i = i + 1
+    
+    log = [None]*q
+    exp = [0]*(2*(q-1))
+    x = z_pz_pol.uno(p)
+    for j in range(q-1):
+        ix = indice[tuple(x)]
+        log[ix] = j
+        exp[j] = ix
+        exp[j+q-1] = ix
+        x = z_pz_pol.div_pol(z_pz_pol.mult(x, alfa, p), f, p)[1]
+    
+    zech = [0]*(q-1)
+    for k in range(q-1):
+        zech[k] = indice[tuple(z_pz_pol.suma(elem[exp[k]], z_pz_pol.uno(p), p))]
+    
+    inv = [None]*q
+    for i in range(1,q):
+        inv[i] = exp[(q-1-log[i]) % (q-1)]
+    
+    T = TablasFq()
+    T.p = p
+    T.n = n
+    T.q = q
+    T.elem = elem
+    T.indice = indice
+    T.log = log
+    T.exp = exp
+    T.zech = zech
+    T.inv = inv
+    
+    _tablas[clave] = T
+    return(T)
+
+
+def a_ind(a,T):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        polinomio de grado < n perteneciente al anillo (Z/pZ)[x], el cual 
+        constituye un elemento del cuerpo Fq
+    T : TablasFq
+        tablas del cuerpo Fq
+
+    Returns
+    -------
+    El índice del elemento a en las tablas T
+    '''
+    try:
+        return(T.indice[tuple(a)])
+    
+    except KeyError: # puede que a tenga ceros de más a la derecha
+        b = z_pz_pol.vd_len(a + [], T.p)
+        if tuple(b) not in T.indice:
+            raise ValueError(f'{a} no es un elemento del cuerpo')
+        return(T.indice[tuple(b)])
+
+
+def de_ind(i,T):
+    '''
+    Parameters
+    ----------
+    i : INT
+        índice de un elemento del cuerpo Fq
+    T : TablasFq
+        tablas del cuerpo Fq
+
+    Returns
+    -------
+    Lista (independiente de las tablas) que representa el elemento de índice i
+    '''
+    return(T.elem[i] + [])
+
+
+def suma_ind(x,y,T):
+    '''
+    Parameters
+    ----------
+    x : INT
+        índice de un elemento del cuerpo Fq
+    y : INT
+        índice de un elemento del cuerpo Fq
+    T : TablasFq
+        tablas del cuerpo Fq
+
+    Returns
+    -------
+    El índice de la suma de ambos elementos
+    '''
+    if T.n == 1:
+        return((x + y) % T.p)
+    if T.p == 2:
+        return(x ^ y)
+    if x == 0:
+        return(y)
+    if y == 0:
+        return(x)
+    
+    lx = T.log[x]
+    z = T.zech[(T.log[y] - lx) % (T.q - 1)] # x + y = x * (1 + y/x)
+    if z == 0:
+        return(0)
+    return(T.exp[lx + T.log[z]])
+
+
+def inv_adit_ind(x,T):
+    '''
+    Parameters
+    ----------
+    x : INT
+        índice de un elemento del cuerpo Fq
+    T : TablasFq
+        tablas del cuerpo Fq
+
+    Returns
+    -------
+    El índice del inverso aditivo del elemento de índice x
+    '''
+    if T.n == 1:
+        return((-x) % T.p)
+    if T.p == 2 or x == 0:
+        return(x)
+    
+    return(T.exp[T.log[x] + (T.q - 1)//2]) # -1 = alpha^((q-1)/2)
+
+
+def mult_ind(x,y,T):
+    '''
+    Parameters
+    ----------
+    x : INT
+        índice de un elemento del cuerpo Fq
+    y : INT
+        índice de un elemento del cuerpo Fq
+    T : TablasFq
+        tablas del cuerpo Fq
+
+    Returns
+    -------
+    El índice del producto de ambos elementos
+    '''
+    if T.n == 1:
+        return((x * y) % T.p)
+    if x == 0 or y == 0:
+        return(0)
+    
+    return(T.exp[T.log[x] + T.log[y]])
+
+
+def inv_mult_ind(x,T):
+    '''
+    Parameters
+    ----------
+    x : INT
+        índice de un elemento del cuerpo Fq
+    T : TablasFq
+        tablas del cuerpo Fq
+
+    Returns
+    -------
+    El índice del inverso multiplicativo del elemento de índice x. Si x = 0 
+    (el cero, que no tiene inverso), se devuelve 0, como en inv_mult sin tablas
+    '''
+    if x == 0:
+        return(0)
+    
+    return(T.inv[x])
@@ -16,10 +16,23 @@ Contiene las siguientes funciones:
     inv_adit(a,p,f,h)
     mult(a,b,p,f,h)
     inv_mult(a,p,f,h)
+    inv_mult_batch(a,p,f,h)
     pot(a,k,p,f,h)
-    rand_elem(p,f,h)   
+    rand_elem(p,f,h,azar=None)   
+
+Contexto del cuerpo:
+    Contexto(p,f,h)
+    contexto(p,f,h)
+
+mult, inv_mult y pot delegan en el Contexto de (p,f,h), que se construye una única
+vez por cuerpo. Si se han activado las tablas de logaritmos del cuerpo 
+(f_q_m_tab.activar), se calculan mediante consultas en dichas tablas. En otro caso,
+si q = 2 (p = 2 y f = [1,1]), se usa la representación binaria de f_2_m.
 """
-import f_q_pol, f_q
+import f_q_pol, f_q, f_q_m_tab, f_2_m
+
+_contextos = {} # contexto ya construido para cada (p,f,h)
+_ultimo = None # último contexto devuelto por contexto(p,f,h)
 
 def cero(p,f,h):
     '''
@@ -138,9 +151,7 @@ def mult(a,b,p,f,h):
    Lista de listas de tamaño < m que representa el elemento del cuerpo Fq^m 
    resultado de multiplicar a y b.
    '''
-   aux = f_q_pol.mult(a,b,p,f)
-   sol = f_q_pol.div_pol(aux, h, p, f)[1]
-   return (sol)
+   return(contexto(p,f,h).mult(a,b))
 
 
 def inv_mult(a,p,f,h):
@@ -164,9 +175,31 @@ def inv_mult(a,p,f,h):
     sol, lista de tamaño < m que representa el inverso multiplicativo del 
     elemento a del cuerpo Fq^m
     '''
-    sol = f_q_pol.gcd_ext(h,a,p,f)[2]
-    sol = f_q_pol.div_pol(sol, h, p, f)[1] #debe pertenecer al cuerpo
-    return(sol)
+    return(contexto(p,f,h).inv_mult(a))
+
+
+def inv_mult_batch(a,p,f,h):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        lista de elementos del cuerpo Fq^m
+    p : INT
+        número primo >= 2
+    f : LIST
+        polinomio mónico, irreducible, de grado n >= 1, perteneciente 
+        al anillo (Z/pZ)[t]
+    h : LIST
+        lista de listas que representa un polinomio mónico, irreducible, 
+        de grado m >= 1, perteneciente al anillo Fq[x]  
+
+    Returns
+    -------
+    Lista con los inversos multiplicativos de los elementos de a, calculados con 
+    el truco de Montgomery: un único inverso y 3(l-1) productos. Los elementos 
+    nulos, que no tienen inverso, se devuelven como el cero de Fq^m
+    '''
+    return(contexto(p,f,h).inv_mult_batch(a))
 
 
 def pot(a,k,p,f,h):
@@ -192,11 +225,10 @@ def pot(a,k,p,f,h):
     lista de listas que representa al elemento del cuerpo Fq^m resultado de
     calcular a^k 
     '''
-    sol = f_q_pol.pot_mod(a,k,p,f,h)
-    return(sol)
+    return(contexto(p,f,h).pot(a,k))
 
 
-def rand_elem(p,f,h):
+def rand_elem(p,f,h,azar=None):
     '''
     Parameters
     ----------
@@ -208,6 +240,9 @@ def rand_elem(p,f,h):
     h : LIST
         lista de listas que representa un polinomio mónico, irreducible, 
         de grado m >= 1, perteneciente al anillo Fq[x]  
+    azar : random.Random, opcional
+        generador de números aleatorios del que se toma el elemento; si no se 
+        da, se usa el del módulo random
 
     Returns
     -------
@@ -217,8 +252,135 @@ def rand_elem(p,f,h):
     sol = [f_q.cero(p,f)]*n
     
     for i in range(n):
-        sol[i] = f_q.rand_elem(p,f)
+        sol[i] = f_q.rand_elem(p,f,azar)
             
     sol = f_q_pol.vd_len(sol, p, f)        
 
     return(sol)
+
+
+# Contexto del cuerpo:
+class Contexto:
+    '''
+    Cuerpo Fq^m con p, f y h fijados. Guarda los datos que no cambian de una 
+    operación a otra, y sus métodos equivalen a las funciones del módulo sin los 
+    argumentos p, f y h:
+        m = grado de h
+        clave = clave del cuerpo en f_q_m_tab (para consultar si hay tablas activas)
+        fq = Contexto del cuerpo Fq
+        hb = entero que representa h si q = 2 (véase f_2_m), o None
+    '''
+    __slots__ = ('p', 'f', 'h', 'm', 'clave', 'cero', 'uno', 'fq', 'hb')
+
+    def __init__(self,p,f,h):
+        self.p = p
+        self.f = f + []
+        self.h = [c + [] for c in h]
+        self.m = len(h) - 1
+        self.clave = f_q_m_tab.clave_cuerpo(p,f,h)
+        self.cero = cero(p,f,h)
+        self.uno = uno(p,f,h)
+        self.fq = f_q.contexto(p,f)
+        self.hb = f_2_m.elem_a_int(h) if f_2_m.es_binario(p,f) else None
+
+    def suma(self,a,b):
+        return(f_q_pol.suma(a,b,self.p,self.f))
+
+    def inv_adit(self,a):
+        return(f_q_pol.inv_adit(a,self.p,self.f))
+
+    def mult(self,a,b):
+        T = f_q_m_tab.activa_clave(self.clave)
+        if T is not None:
+            return(f_q_m_tab.mult(a,b,T))
+
+        if self.hb is not None:
+            sol = f_2_m.mult(f_2_m.elem_a_int(a), f_2_m.elem_a_int(b), self.hb)
+            return(f_2_m.elem_de_int(sol))
+
+        aux = f_q_pol.mult(a,b,self.p,self.f)
+        return(f_q_pol.div_pol(aux, self.h, self.p, self.f)[1])
+
+    def inv_mult(self,a):
+        T = f_q_m_tab.activa_clave(self.clave)
+        if T is not None:
+            return(f_q_m_tab.inv_mult(a,T))
+
+        if self.hb is not None:
+            return(f_2_m.elem_de_int(f_2_m.inv_mult(f_2_m.elem_a_int(a), self.hb)))
+
+        sol = f_q_pol.gcd_ext(self.h,a,self.p,self.f)[2]
+        return(f_q_pol.div_pol(sol, self.h, self.p, self.f)[1]) #debe pertenecer al cuerpo
+
+    def inv_mult_batch(self,a):
+        T = f_q_m_tab.activa_clave(self.clave)
+        if T is not None: # cada inverso es una consulta en la tabla
+            return([f_q_m_tab.inv_mult(x,T) if x != self.cero else cero(self.p,self.f,self.h) 
+                    for x in a])
+
+        if self.hb is not None:
+            sol = f_2_m.inv_mult_batch([f_2_m.elem_a_int(x) for x in a], self.hb)
+            return([f_2_m.elem_de_int(x) for x in sol])
+
+        pref = [0]*len(a) # pref[i] = producto de los elementos no nulos de a[0..i]
+        acc = self.uno
+        for i in range(len(a)):
+            if a[i] != self.cero:
+                acc = self.mult(acc,a[i])
+            pref[i] = acc
+
+        inv = self.inv_mult(acc) # inverso de pref[i] en cada paso del bucle
+        sol = [0]*len(a)
+        for i in range(len(a)-1,-1,-1):
+            if a[i] != self.cero:
+                sol[i] = self.mult(inv,pref[i-1]) if i > 0 else inv
+                inv = self.mult(inv,a[i])
+            else:
+                sol[i] = cero(self.p,self.f,self.h)
+
+        return(sol)
+
+    def pot(self,a,k):
+        T = f_q_m_tab.activa_clave(self.clave)
+        if T is not None:
+            return(f_q_m_tab.pot(a,k,T))
+
+        if self.hb is not None:
+            return(f_2_m.elem_de_int(f_2_m.pot(f_2_m.elem_a_int(a), k, self.hb)))
+
+        return(f_q_pol.pot_mod(a,k,self.p,self.f,self.h))
+
+    def rand_elem(self):
+        return(rand_elem(self.p,self.f,self.h))
+
+
+def contexto(p,f,h):
+    '''
+    Parameters
+    ----------
+    p : INT
+        número primo >= 2
+    f : LIST
+        polinomio mónico, irreducible, de grado n >= 1, perteneciente 
+        al anillo (Z/pZ)[t]
+    h : LIST
+        lista de listas que representa un polinomio mónico, irreducible, 
+        de grado m >= 1, perteneciente al anillo Fq[x]  
+
+    Returns
+    -------
+    El objeto Contexto del cuerpo Fq^m = Fq[x]/<h>, que se construye una única 
+    vez por cuerpo. Se comprueba primero el último contexto devuelto
+    '''
+    global _ultimo
+    sol = _ultimo
+    if sol is not None and sol.p == p and sol.h == h and sol.f == f:
+        return(sol)
+
+    clave = f_q_m_tab.clave_cuerpo(p,f,h)
+    sol = _contextos.get(clave)
+    if sol is None:
+        sol = Contexto(p,f,h)
+        _contextos[clave] = sol
+    _ultimo = sol
+    return(sol)
@@ -15,10 +15,16 @@ Contiene las siguientes funciones:
     suma(a,b,p,f,h)
     inv_adit(a,p,f,h)
     mult(a,b,p,f,h)
+    cuadrado(a,p,f,h)
     gcd(a,b,p,f,h)
     gcd_ext(a,b,p,f,h)
     pot_mod(a,k,p,f,g,h)
     eval_pol(a,u,p,f,h)
+    eval_pol_multi(a,u,p,f,h)
+    eval_fft(a,p,f,h)
+    busqueda_chien(a,u,p,f,h)
+    raices(a,p,f,h)
+    div_lineal(a,u,p,f,h)
     deriv(a,p,f,h)
 
 Funciones auxiliares: 
@@ -26,8 +32,38 @@ Funciones auxiliares:
     div_pol(a,b,p,f,h)
     gcd_ext_no_mon(a,b,p,f,h)
     cop_pol(a,p,f,h)
+
+Contexto del anillo:
+    Contexto(p,f,h,g=None)
+    contexto(p,f,h)
+
+Las funciones delegan en el Contexto de (p,f,h), que se construye una única vez 
+por cuerpo y guarda el Contexto de Fq^m. Si se fija además un polinomio g, el 
+Contexto guarda el inverso de su coeficiente principal para reducir módulo g 
+(resto y pot_mod) sin volver a calcularlo.
+
+Si ambos factores tienen al menos UMBRAL_KARATSUBA coeficientes, mult y cuadrado 
+usan el algoritmo de Karatsuba (métodos mult_karatsuba y cuadrado_karatsuba del 
+Contexto); en otro caso, el producto escolar. div_pol divide sobre una copia del 
+dividendo, restando cada paso en su sitio (si el divisor es mónico no se 
+multiplica por el inverso de su coeficiente principal). gcd_ext_no_mon es el 
+algoritmo de Euclides extendido iterativo; si a y b tienen al menos UMBRAL_HGCD 
+coeficientes, usa el algoritmo half-GCD (métodos gcd_ext_hgcd y hgcd del Contexto).
+
+Si se han activado las tablas de logaritmos del cuerpo Fq^m (f_q_m_tab.activar),
+mult y eval_pol trabajan directamente sobre los logaritmos de los coeficientes.
+Si q = 2 (p = 2 y f = [1,1]), mult, div_pol, gcd_ext, pot_mod y eval_pol usan la
+representación binaria de f_2_m_pol, en la que cada coeficiente es un entero.
 """
-import f_q_m, f_q_pol
+import f_q_m, f_q_pol, f_q_m_tab, f_2_m, f_2_m_pol, random
+
+UMBRAL_KARATSUBA = 16 # longitud mínima de los factores para usar Karatsuba
+UMBRAL_HGCD = 1024 # longitud mínima de a y b para usar el algoritmo half-GCD en gcd_ext
+UMBRAL_MULTIPUNTO = 256 # longitud mínima del polinomio y de los puntos para usar el árbol de subproductos
+BLOQUE_MULTIPUNTO = 16 # puntos por cada árbol de subproductos
+
+_contextos = {} # contexto ya construido para cada (p,f,h)
+_ultimo = None # último contexto devuelto por contexto(p,f,h)
 
 def cero(p,f,h):
     '''
@@ -93,23 +129,7 @@ def suma(a,b,p,f,h):
     Lista de listas de listas que representa al polinomio del anillo Fq^m[x]
     resultado de sumar a y b
     '''
-    la = len(a)
-    lb = len(b)
-    
-    if la>=lb:
-        sol = [0]*la
-        for i in range(la):
-            if i<lb:
-                sol[i] = f_q_m.suma(a[i],b[i],p,f,h)
-            else: 
-                sol[i] = f_q_m.suma(a[i],f_q_m.cero(p,f,h),p,f,h)
-                
-        sol = vd_len(sol,p,f,h)
-        
-    else: 
-        sol = suma(b,a,p,f,h)
-    
-    return(sol)
+    return(contexto(p,f,h).suma(a,b))
 
 
 def inv_adit(a,p,f,h):
@@ -133,13 +153,7 @@ def inv_adit(a,p,f,h):
     Lista de listas de listas que representa el inverso aditivo del elemento a 
     del anillo Fq^m[x]
     '''
-    la = len(a)
-    sol = [0]*la
-    
-    for i in range(la):
-        sol[i] = f_q_m.inv_adit(a[i],p,f,h)
-    
-    return(sol)
+    return(contexto(p,f,h).inv_adit(a))
 
 
 def mult(a,b,p,f,h):
@@ -166,20 +180,32 @@ def mult(a,b,p,f,h):
     Lista de listas de listas que representa el elemento del anillo Fq^m[x] 
     resultado de multiplicar a y b
     '''
-    if a==cero(p,f,h) or b==cero(p,f,h):
-        return(cero(p,f,h))
-    
-    else:
-        la = len(a)
-        lb = len(b)
-        l = la + lb - 1
-        sol = l*[f_q_m.cero(p,f,h)]
-    
-        for i in range(la):
-            for j in range(lb):
-                sol[i+j] = f_q_m.suma(sol[i+j],f_q_m.mult(a[i],b[j],p,f,h),p,f,h)
-        
-        return(sol)
+    return(contexto(p,f,h).mult(a,b))
+
+
+def cuadrado(a,p,f,h):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        Lista de listas de listas que representa un polinomio de grado arbitrario del
+        anillo Fq^m[x]
+    p : INT
+        número primo >= 2
+    f : LIST
+        polinomio mónico, irreducible, de grado n >= 1, perteneciente 
+        al anillo (Z/pZ)[t]
+    h : LIST
+        lista de listas que representa un polinomio mónico, irreducible, 
+        de grado m >= 1, perteneciente al anillo Fq[s]  
+
+    Returns
+    -------
+    Lista de listas de listas que representa el polinomio a*a del anillo Fq^m[x],
+    calculado con aproximadamente la mitad de productos que mult(a,a,p,f,h). Si 
+    p = 2, es sum(ai^2 * x^(2i))
+    '''
+    return(contexto(p,f,h).cuadrado(a))
 
 
 def gcd(a,b,p,f,h):
@@ -206,7 +232,7 @@ def gcd(a,b,p,f,h):
     g lista de listas de listas que representa el polinomio del anillo Fq^m[x] 
     tal que gcd(a,b) = g, con g mónico
     '''
-    return(gcd_ext(a,b,p,f,h)[0])
+    return(contexto(p,f,h).gcd_ext(a,b)[0])
 
 
 def gcd_ext(a,b,p,f,h):
@@ -233,15 +259,7 @@ def gcd_ext(a,b,p,f,h):
     g,x,y listas de listas de listas que representan los polinomio del anillo 
     Fq^m[x] tal que gcd(a,b) = g, con g mónico, y a*x + b*y = g
     '''
-    g,x,y = gcd_ext_no_mon(a,b,p,f,h)
-    
-    if g[-1] != f_q_m.uno(p,f,h):
-        coef = [ f_q_m.inv_mult(g[-1],p,f,h) ] #polinomio de Fq^m[x]
-        g = mult(g,coef,p,f,h)
-        x = mult(x,coef,p,f,h)
-        y = mult(y,coef,p,f,h)
-        
-    return(g,x,y)
+    return(contexto(p,f,h).gcd_ext(a,b))
 
 
 def pot_mod(a,k,p,f,h,g):
@@ -271,27 +289,7 @@ def pot_mod(a,k,p,f,h,g):
     Lista de listas de listas que representa el polinomio con coeficientes en el 
     cuerpo Fp^m a^k (mod g)
     '''
-    if (k==0):
-        return(uno(p,f,h))
-    
-    elif (k>0):
-        if k%2==0: #k es par
-            x = pot_mod(a,k//2,p,f,h,g)
-            aux = mult(x,x,p,f,h)
-            sol = div_pol(aux,g,p,f,h)[1]
-        
-        else: #k es impar
-            x = pot_mod(a,k-1,p,f,h,g)
-            aux = mult(a,x,p,f,h)
-            sol = div_pol(aux,g,p,f,h)[1]
-        
-        return(sol)
-        
-    else: #solo podremos calcular esta potencia si existe el inverso multiplicativo de a
-          #modulo g
-        aux = gcd_ext(a, g, p, f, h)[1]
-        inv_mul = div_pol(aux, g, p, f, h)[1]
-        return(pot_mod(inv_mul,-k,p,f,h,g))
+    return(Contexto(p,f,h,g).pot_mod(a,k))
 
 
 def eval_pol(a,u,p,f,h):
@@ -315,17 +313,144 @@ def eval_pol(a,u,p,f,h):
     Returns
     -------
     Lista de listas de tamaño < m que representa el elemento del cuerpo Fq^m que 
-    se obtiene al evaluar el polinomio a en u
+    se obtiene al evaluar el polinomio a en u, mediante la regla de Horner
     '''
-    sol = f_q_m.cero(p, f, h)
-    la = len(a)
-    
-    for i in range(la):
-        potc = f_q_m.pot(u, i, p, f, h)
-        multip = f_q_m.mult(a[i], potc, p, f, h)
-        sol = f_q_m.suma(sol, multip, p, f, h)
-    
-    return(sol)
+    return(contexto(p,f,h).eval_pol(a,u))
+
+
+def eval_fft(a,p,f,h):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        Lista de listas de listas que representa un polinomio de grado arbitrario del
+        anillo Fq^m[x]
+    p : INT
+        número primo, que debe ser 2
+    f : LIST
+        polinomio mónico, irreducible, de grado n >= 1, perteneciente 
+        al anillo (Z/pZ)[t]
+    h : LIST
+        lista de listas que representa un polinomio mónico, irreducible, 
+        de grado m >= 1, perteneciente al anillo Fq[s]  
+
+    Returns
+    -------
+    Lista de q^m elementos del cuerpo Fq^m con a(u) en la posición indice_fft(u) 
+    del Contexto, para todos los u de Fq^m, calculada con la FFT aditiva de 
+    Gao-Mateer. Lanza ValueError si p != 2
+    '''
+    return(contexto(p,f,h).eval_fft(a))
+
+
+def eval_pol_multi(a,u,p,f,h):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        Lista de listas de listas que representa un polinomio de grado arbitrario del
+        anillo Fq^m[x]
+    u : LIST
+        lista de elementos del cuerpo Fq^m (listas de listas)
+    p : INT
+        número primo >= 2
+    f : LIST
+        polinomio mónico, irreducible, de grado n >= 1, perteneciente 
+        al anillo (Z/pZ)[t]
+    h : LIST
+        lista de listas que representa un polinomio mónico, irreducible, 
+        de grado m >= 1, perteneciente al anillo Fq[s]  
+
+    Returns
+    -------
+    Lista con los elementos a(u[i]) del cuerpo Fq^m. Si a y u tienen al menos 
+    UMBRAL_MULTIPUNTO elementos, se evalúa con el árbol de subproductos de cada 
+    bloque de BLOQUE_MULTIPUNTO puntos (método arbol_subproductos del Contexto); 
+    en otro caso, con la regla de Horner en cada punto
+    '''
+    return(contexto(p,f,h).eval_pol_multi(a,u))
+
+
+def busqueda_chien(a,u,p,f,h):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        Lista de listas de listas que representa un polinomio de grado arbitrario del
+        anillo Fq^m[x]
+    u : LIST
+        lista de elementos no nulos del cuerpo Fq^m que son potencias consecutivas 
+        de un mismo elemento: u[i] = u[0] * alfa^i
+    p : INT
+        número primo >= 2
+    f : LIST
+        polinomio mónico, irreducible, de grado n >= 1, perteneciente 
+        al anillo (Z/pZ)[t]
+    h : LIST
+        lista de listas que representa un polinomio mónico, irreducible, 
+        de grado m >= 1, perteneciente al anillo Fq[s]  
+
+    Returns
+    -------
+    Lista ordenada de las posiciones i tales que a(u[i]) = 0, por búsqueda de 
+    Chien: cada término a[j]*u[i]^j se obtiene del anterior multiplicándolo por 
+    alfa^j, y la búsqueda termina al encontrar deg(a) raíces. Lanza ValueError 
+    si los u[i] no son de esa forma
+    '''
+    return(contexto(p,f,h).busqueda_chien(a,u))
+
+
+def raices(a,p,f,h):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        Lista de listas de listas que representa un polinomio de grado arbitrario del
+        anillo Fq^m[x]
+    p : INT
+        número primo >= 2
+    f : LIST
+        polinomio mónico, irreducible, de grado n >= 1, perteneciente 
+        al anillo (Z/pZ)[t]
+    h : LIST
+        lista de listas que representa un polinomio mónico, irreducible, 
+        de grado m >= 1, perteneciente al anillo Fq[s]  
+
+    Returns
+    -------
+    Lista ordenada de las raíces distintas de a en el cuerpo Fq^m. Se toma 
+    s = gcd(a, x^(q^m) - x) y se separan sus factores lineales con el algoritmo 
+    de la traza de Berlekamp si p = 2, o con el de Cantor-Zassenhaus si p es 
+    impar (método separa_raices del Contexto), sin recorrer el cuerpo
+    '''
+    return(contexto(p,f,h).raices(a))
+
+
+def div_lineal(a,u,p,f,h):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        Lista de listas de listas que representa un polinomio de grado arbitrario del
+        anillo Fq^m[x]
+    u : LIST
+        lista de listas que representa un elemento del cuerpo Fq^m
+    p : INT
+        número primo >= 2
+    f : LIST
+        polinomio mónico, irreducible, de grado n >= 1, perteneciente 
+        al anillo (Z/pZ)[t]
+    h : LIST
+        lista de listas que representa un polinomio mónico, irreducible, 
+        de grado m >= 1, perteneciente al anillo Fq[s]  
+
+    Returns
+    -------
+    q y r tales que a = q*(x - u) + r, con q polinomio del anillo Fq^m[x] y r = a(u)
+    elemento del cuerpo Fq^m, calculados a la vez mediante la regla de Horner
+    (división sintética)
+    '''
+    return(contexto(p,f,h).div_lineal(a,u))
 
 
 def deriv(a,p,f,h):
@@ -349,18 +474,7 @@ def deriv(a,p,f,h):
     Lista de listas de listas que representa el elemento del anillo Fq^m[x] que 
     se obtiene al derivar el polinomio a
     '''
-    if len(a) == 0:
-       return cero(p,f,h)
-    
-    ad = [f_q_m.cero(p, f, h)]*(len(a)-1)
-    
-    for i in range(1,len(a)):
-        ai = a[i]
-        for j in range(i):
-            ad[i-1] = f_q_m.suma(ad[i-1],ai,p,f,h)
-            
-    ad = vd_len(ad,p,f,h)
-    return(ad)
+    return(contexto(p,f,h).deriv(a))
 
 
 # Funciones auxiliares:
@@ -385,14 +499,7 @@ def vd_len(a,p,f,h):
     Lista de listas de listas que representa el mismo polinomio a, únicamente hasta su 
     coeficiente de mayor grado no nulo 
     '''
-    if len(a) == 0:
-        return(cero(p,f,h))
-    
-    else:
-        while(len(a)>0 and a[-1]==f_q_m.cero(p,f,h)):
-            a.pop()
-            
-        return(a)    
+    return(contexto(p,f,h).vd_len(a))
     
 
 def div_pol(a,b,p,f,h):
@@ -419,29 +526,7 @@ def div_pol(a,b,p,f,h):
     q y r, listas de listas de listas que representan los polinomios del anillo 
     Fq^m[x] tales que a = q*b + r
     '''
-    if (a == cero(p,f,h) or len(a)<len(b)):
-        q = cero(p,f,h)
-        r = cop_pol(a,p,f,h) # es necesario copiar a, pues es el resto
-        return(q,r)
-    
-    else:
-        lq = len(a) - len(b) + 1 #longitud del cociente
-        q = [f_q_m.cero(p,f,h)]*lq 
-        cb_i = f_q_m.inv_mult(b[-1],p,f,h) # inverso del coeficiente principal de b
-        
-        while len(a)>=len(b): #mientras podamos dividir a entre b
-            ca = a[-1] # coeficiente principal de a
-            
-            paso = [f_q_m.cero(p,f,h)]*lq
-            paso[len(a)-len(b)] = f_q_m.mult(ca,cb_i,p,f,h)
-            q = suma(q,paso,p,f,h)
-            
-            sumar = inv_adit(mult(b,paso,p,f,h),p,f,h)
-            a = suma(a,sumar,p,f,h)
-                   
-        r = a # no me hace falta copiar a, porque a ya la hemos cambiado en el bucle, 
-              # de modo que la variable a ya no está asociada a la lista de listas de listas original
-        return(q,r)
+    return(contexto(p,f,h).div_pol(a,b))
         
         
 def gcd_ext_no_mon(a,b,p,f,h):
@@ -468,13 +553,7 @@ def gcd_ext_no_mon(a,b,p,f,h):
     g,x,y listas de listas de listas que representan los polinomio del anillo 
     Fq^m[x] tales que gcd(a,b) = g, con a*x + b*y = g, g no necesariamente mónico
     '''
-    if b == cero(p,f,h):
-        return(cop_pol(a,p,f,h),uno(p,f,h),cero(p,f,h))
-    
-    else: 
-        q,r = div_pol(a,b,p,f,h)
-        g,a2,b2 = gcd_ext_no_mon(b,r,p,f,h)
-        return(g, b2, suma(a2,inv_adit(mult(q,b2,p,f,h),p,f,h),p,f,h))
+    return(contexto(p,f,h).gcd_ext_no_mon(a,b))
 
 
 def cop_pol(a,p,f,h):
@@ -504,3 +583,734 @@ def cop_pol(a,p,f,h):
     for i in range(la):
         sol[i] = f_q_pol.cop_pol(a[i],p,f)
     return(sol)
+
+
+# Contexto del anillo:
+class Contexto:
+    '''
+    Anillo Fq^m[x] con p, f y h fijados y, opcionalmente, un polinomio g respecto 
+    del que se reduce. Guarda los datos que no cambian de una operación a otra, y 
+    sus métodos equivalen a las funciones del módulo sin los argumentos p, f y h:
+        cuerpo = Contexto del cuerpo Fq^m (véase f_q_m)
+        clave = clave del cuerpo en f_q_m_tab (para consultar si hay tablas activas)
+        hb = entero que representa h si q = 2 (véase f_2_m), o None
+        g = copia del polinomio g, o None
+        t = grado de g
+        g_inv = inverso del coeficiente principal de g
+        gb = lista de enteros que representa g si q = 2 (véase f_2_m_pol), o None
+        fft = niveles de la FFT aditiva si p = 2 (véase niveles_fft), o None 
+              hasta que se usan por primera vez
+        azar = generador random.Random propio del que separa_raices toma los 
+               elementos aleatorios si p es impar, de modo que buscar raíces no 
+               altera el estado del módulo random; None hasta que se usa
+    '''
+    __slots__ = ('p', 'f', 'h', 'cuerpo', 'clave', 'hb', 'cero', 'uno', 
+                 'g', 't', 'g_inv', 'gb', 'fft', 'azar')
+
+    def __init__(self,p,f,h,g=None):
+        cz = f_q_m.contexto(p,f,h)
+        self.p = cz.p
+        self.f = cz.f
+        self.h = cz.h
+        self.cuerpo = cz
+        self.clave = cz.clave
+        self.hb = cz.hb
+        self.cero = cero(p,f,h)
+        self.uno = uno(p,f,h)
+        self.g = None
+        self.t = None
+        self.g_inv = None
+        self.gb = None
+        self.fft = None
+        self.azar = None
+        if g is not None:
+            self.g = cop_pol(g,p,f,h)
+            self.t = len(g) - 1
+            self.g_inv = cz.inv_mult(g[-1])
+            if self.hb is not None:
+                self.gb = f_2_m_pol.a_int(g)
+
+    def suma(self,a,b):
+        if len(a) < len(b):
+            a, b = b, a
+
+        cz = self.cuerpo
+        sol = [0]*len(a)
+        for i in range(len(a)):
+            if i < len(b):
+                sol[i] = cz.suma(a[i],b[i])
+            else:
+                sol[i] = cz.suma(a[i],cz.cero)
+
+        return(self.vd_len(sol))
+
+    def inv_adit(self,a):
+        cz = self.cuerpo
+        return([cz.inv_adit(c) for c in a])
+
+    def mult(self,a,b):
+        T = f_q_m_tab.activa_clave(self.clave)
+        if T is not None:
+            return(f_q_m_tab.mult_pol(a,b,T))
+
+        if self.hb is not None:
+            sol = f_2_m_pol.mult(f_2_m_pol.a_int(a), f_2_m_pol.a_int(b), self.hb)
+            return(f_2_m_pol.de_int(sol))
+
+        if a == self.cero or b == self.cero:
+            return(cero(self.p,self.f,self.h))
+
+        return(self.mult_karatsuba(a,b))
+
+    def mult_escuela(self,a,b):
+        '''
+        Producto escolar, de longitud len(a) + len(b) - 1
+        '''
+        if a == [] or b == []:
+            return([])
+
+        cz = self.cuerpo
+        sol = (len(a) + len(b) - 1)*[f_q_m.cero(self.p,self.f,self.h)]
+        for i in range(len(a)):
+            ai = a[i]
+            if ai != cz.cero:
+                for j in range(len(b)):
+                    sol[i+j] = cz.suma(sol[i+j],cz.mult(ai,b[j]))
+
+        return(sol)
+
+    def mult_karatsuba(self,a,b):
+        '''
+        Producto con el algoritmo de Karatsuba, de longitud len(a) + len(b) - 1:
+        si a = a0 + a1*x^k y b = b0 + b1*x^k, 
+        a*b = a0*b0 + ((a0+a1)*(b0+b1) - a0*b0 - a1*b1)*x^k + a1*b1*x^(2k). 
+        Por debajo de UMBRAL_KARATSUBA se usa el producto escolar
+        '''
+        la, lb = len(a), len(b)
+        if la < lb:
+            a, b, la, lb = b, a, lb, la
+
+        if lb < UMBRAL_KARATSUBA:
+            return(self.mult_escuela(a,b))
+
+        cz = self.cuerpo
+        sol = (la + lb - 1)*[f_q_m.cero(self.p,self.f,self.h)]
+        if 2*lb <= la: # factores muy desiguales: se multiplica a por bloques de longitud lb
+            for i in range(0, la, lb):
+                prod = self.mult_karatsuba(a[i:i+lb], b)
+                for j in range(len(prod)):
+                    sol[i+j] = cz.suma(sol[i+j],prod[j])
+            return(sol)
+
+        k = la // 2 # punto de corte, con k < lb
+        a0, a1 = a[:k], a[k:]
+        b0, b1 = b[:k], b[k:]
+        z0 = self.mult_karatsuba(a0,b0)
+        z2 = self.mult_karatsuba(a1,b1)
+        z1 = self.mult_karatsuba([cz.suma(x,y) for x,y in zip(a0,a1)] + a1[k:], 
+                                 [cz.suma(x,y) for x,y in zip(b0,b1)] + b0[len(b1):] + b1[k:])
+
+        return(self.combinar_karatsuba(sol,z0,z1,z2,k))
+
+    def cuadrado(self,a):
+        T = f_q_m_tab.activa_clave(self.clave)
+        if T is not None:
+            return(f_q_m_tab.mult_pol(a,a,T))
+
+        if self.hb is not None:
+            return(f_2_m_pol.de_int(f_2_m_pol.cuadrado(f_2_m_pol.a_int(a), self.hb)))
+
+        if a == self.cero:
+            return(cero(self.p,self.f,self.h))
+
+        if self.p == 2: # a*a = sum(ai^2 * x^(2i))
+            cz = self.cuerpo
+            sol = (2*len(a) - 1)*[f_q_m.cero(self.p,self.f,self.h)]
+            for i in range(len(a)):
+                sol[2*i] = cz.mult(a[i],a[i])
+            return(sol)
+
+        return(self.cuadrado_karatsuba(a))
+
+    def cuadrado_escuela(self,a):
+        '''
+        Cuadrado escolar, de longitud 2*len(a) - 1, en el que cada producto 
+        ai*aj con i != j se calcula una sola vez
+        '''
+        if a == []:
+            return([])
+
+        cz = self.cuerpo
+        sol = (2*len(a) - 1)*[f_q_m.cero(self.p,self.f,self.h)]
+        for i in range(len(a)):
+            ai = a[i]
+            if ai != cz.cero:
+                sol[2*i] = cz.suma(sol[2*i],cz.mult(ai,ai))
+                ai2 = cz.suma(ai,ai)
+                for j in range(i+1, len(a)):
+                    sol[i+j] = cz.suma(sol[i+j],cz.mult(ai2,a[j]))
+
+        return(sol)
+
+    def cuadrado_karatsuba(self,a):
+        '''
+        Cuadrado con el algoritmo de Karatsuba (tres cuadrados de la mitad de 
+        longitud), de longitud 2*len(a) - 1
+        '''
+        la = len(a)
+        if la < UMBRAL_KARATSUBA:
+            return(self.cuadrado_escuela(a))
+
+        cz = self.cuerpo
+        k = la // 2
+        a0, a1 = a[:k], a[k:]
+        z0 = self.cuadrado_karatsuba(a0)
+        z2 = self.cuadrado_karatsuba(a1)
+        z1 = self.cuadrado_karatsuba([cz.suma(x,y) for x,y in zip(a0,a1)] + a1[k:])
+
+        sol = (2*la - 1)*[f_q_m.cero(self.p,self.f,self.h)]
+        return(self.combinar_karatsuba(sol,z0,z1,z2,k))
+
+    def combinar_karatsuba(self,sol,z0,z1,z2,k):
+        '''
+        Suma a sol los términos z0 + (z1 - z0 - z2)*x^k + z2*x^(2k)
+        '''
+        cz = self.cuerpo
+        for i in range(len(z0)):
+            sol[i] = cz.suma(sol[i],z0[i])
+            sol[i+k] = cz.suma(sol[i+k],cz.inv_adit(z0[i]))
+        for i in range(len(z2)):
+            sol[i+2*k] = cz.suma(sol[i+2*k],z2[i])
+            sol[i+k] = cz.suma(sol[i+k],cz.inv_adit(z2[i]))
+        for i in range(len(z1)):
+            sol[i+k] = cz.suma(sol[i+k],z1[i])
+
+        return(sol)
+
+    def gcd(self,a,b):
+        return(self.gcd_ext(a,b)[0])
+
+    def gcd_ext(self,a,b):
+        if self.hb is not None:
+            sol = f_2_m_pol.gcd_ext(f_2_m_pol.a_int(a), f_2_m_pol.a_int(b), self.hb)
+            return(tuple(f_2_m_pol.de_int(c) for c in sol))
+
+        g,x,y = self.gcd_ext_no_mon(a,b)
+
+        if g[-1] != self.cuerpo.uno:
+            coef = [ self.cuerpo.inv_mult(g[-1]) ] #polinomio de Fq^m[x]
+            g = self.mult(g,coef)
+            x = self.mult(x,coef)
+            y = self.mult(y,coef)
+
+        return(g,x,y)
+
+    def pot_mod(self,a,k):
+        '''
+        a^k (mod g), con el polinomio g del contexto
+        '''
+        if self.hb is not None:
+            sol = f_2_m_pol.pot_mod(f_2_m_pol.a_int(a), k, self.hb, self.gb)
+            return(f_2_m_pol.de_int(sol))
+
+        if k == 0:
+            return(uno(self.p,self.f,self.h))
+
+        elif k > 0:
+            if k%2 == 0: #k es par
+                x = self.pot_mod(a,k//2)
+                return(self.resto(self.cuadrado(x)))
+
+            else: #k es impar
+                x = self.pot_mod(a,k-1)
+                return(self.resto(self.mult(a,x)))
+
+        else: #solo existe si a tiene inverso multiplicativo módulo g
+            inv_mul = self.resto(self.gcd_ext(a,self.g)[1])
+            return(self.pot_mod(inv_mul,-k))
+
+    def resto(self,a):
+        '''
+        a (mod g), con el polinomio g del contexto
+        '''
+        if self.hb is not None:
+            cb_i = f_2_m.elem_a_int(self.g_inv)
+            r = f_2_m_pol.div_pol(f_2_m_pol.a_int(a), self.gb, self.hb, cb_i)[1]
+            return(f_2_m_pol.de_int(r))
+
+        return(self.div_pol(a,self.g,self.g_inv)[1])
+
+    def eval_pol(self,a,u):
+        T = f_q_m_tab.activa_clave(self.clave)
+        if T is not None:
+            return(f_q_m_tab.eval_pol(a,u,T))
+
+        if self.hb is not None:
+            sol = f_2_m_pol.eval_pol(f_2_m_pol.a_int(a), f_2_m.elem_a_int(u), self.hb)
+            return(f_2_m.elem_de_int(sol))
+
+        cz = self.cuerpo
+        sol = f_q_m.cero(self.p,self.f,self.h)
+        for i in range(len(a)-1,-1,-1): # regla de Horner
+            sol = cz.suma(cz.mult(sol,u), a[i])
+
+        return(sol)
+
+    def eval_pol_multi(self,a,u):
+        T = f_q_m_tab.activa_clave(self.clave)
+        if T is not None:
+            return([f_q_m_tab.eval_pol(a,x,T) for x in u])
+
+        if self.hb is not None:
+            sol = f_2_m_pol.eval_pol_multi(f_2_m_pol.a_int(a), [f_2_m.elem_a_int(x) for x in u], self.hb)
+            return([f_2_m.elem_de_int(x) for x in sol])
+
+        if len(a) < UMBRAL_MULTIPUNTO or len(u) < UMBRAL_MULTIPUNTO:
+            return([self.eval_pol(a,x) for x in u])
+
+        sol = []
+        for s in range(0, len(u), BLOQUE_MULTIPUNTO):
+            arbol = self.arbol_subproductos(u[s:s+BLOQUE_MULTIPUNTO])
+            restos = [self.div_pol(a,arbol[-1][0])[1]]
+            for k in range(len(arbol)-2,-1,-1):
+                restos = [self.div_pol(restos[j//2],arbol[k][j])[1] for j in range(len(arbol[k]))]
+            sol += [r[0] if r else f_q_m.cero(self.p,self.f,self.h) for r in restos]
+
+        return(sol)
+
+    def eval_fft(self,a):
+        '''
+        Si p = 2, lista de los q^m valores a(u), u en Fq^m, con a(u) en la 
+        posición indice_fft(u), calculada con la FFT aditiva de Gao-Mateer 
+        (véase f_2_m_pol.eval_fft)
+        '''
+        if self.p != 2:
+            raise ValueError('La FFT aditiva solo está definida en característica 2')
+
+        if self.hb is not None:
+            sol = f_2_m_pol.eval_fft(f_2_m_pol.a_int(a), self.hb)
+            return([f_2_m.elem_de_int(x) for x in sol])
+
+        return(self.fft_aditiva(a, self.niveles_fft(), 0))
+
+    def indice_fft(self,u):
+        '''
+        Posición del elemento u de Fq^m en la lista de eval_fft: el bit j*n + i 
+        es el coeficiente de t^i en el coeficiente de s^j de u
+        '''
+        n = len(self.f) - 1
+        sol = 0
+        for j in range(len(u)):
+            for i in range(len(u[j])):
+                if u[j][i]:
+                    sol |= 1 << (j*n + i)
+        return(sol)
+
+    def niveles_fft(self):
+        '''
+        Datos de cada nivel de recursión de la FFT aditiva (véase 
+        f_2_m_pol.niveles_fft), partiendo de la base de Fq^m sobre F2 formada por 
+        los t^i * s^j, en el orden de indice_fft. Se calculan una única vez
+        '''
+        if self.fft is None:
+            cz = self.cuerpo
+            n = len(self.f) - 1
+            base = [[f_q_pol.cero(self.p,self.f)[:] for j in range(b // n)] + [[0]*(b % n) + [1]] 
+                    for b in range(n*(len(self.h) - 1))] # t^(b % n) * s^(b // n)
+            self.fft = []
+            while base != []:
+                bk = base[-1]
+                bk_i = cz.inv_mult(bk)
+                c = [cz.mult(b,bk_i) for b in base[:-1]]
+                G = [f_q_m.cero(self.p,self.f,self.h)]
+                for ci in c:
+                    G += [cz.suma(x,ci) for x in G]
+                self.fft.append((bk, G))
+                base = [cz.suma(cz.mult(ci,ci),ci) for ci in c]
+
+        return(self.fft)
+
+    def fft_aditiva(self,a,L,d):
+        '''
+        a evaluado en los 2^k elementos generados por la base del nivel d, 
+        k = len(L) - d (véase f_2_m_pol.fft_aditiva)
+        '''
+        cz = self.cuerpo
+        k = len(L) - d
+        if len(a) <= 1:
+            return([a[0] if a else f_q_m.cero(self.p,self.f,self.h) for j in range(1 << k)])
+        if k == 0:
+            return([a[0]])
+
+        bk, G = L[d]
+        b = []
+        pot = cz.uno # bk^i
+        for c in a:
+            b.append(cz.mult(c,pot))
+            pot = cz.mult(pot,bk)
+
+        b0, b1 = self.desarrollo_taylor(b)
+        u = self.fft_aditiva(b0,L,d+1)
+        v = self.fft_aditiva(b1,L,d+1)
+
+        mitad = 1 << (k-1)
+        sol = [0] * (2*mitad)
+        for j in range(mitad):
+            w = cz.suma(u[j],cz.mult(G[j],v[j]))
+            sol[j] = w
+            sol[j + mitad] = cz.suma(w,v[j])
+
+        return(sol)
+
+    def desarrollo_taylor(self,a):
+        '''
+        a0, a1 tales que a = sum((a0[i] + a1[i]*x) * (x^2 + x)^i), en 
+        característica 2 (véase f_2_m_pol.desarrollo_taylor)
+        '''
+        cz = self.cuerpo
+        if len(a) <= 2:
+            a = a + [f_q_m.cero(self.p,self.f,self.h) for i in range(2 - len(a))]
+            return([a[0]], [a[1]])
+
+        t = 1
+        while 4*t < len(a):
+            t = 2*t
+
+        r = a + []
+        q = [f_q_m.cero(self.p,self.f,self.h) for i in range(len(a) - 2*t)]
+        for i in range(len(a)-1, 2*t-1, -1): # división entre x^(2t) + x^t
+            c = r[i]
+            if c != cz.cero:
+                q[i - 2*t] = c
+                r[i - t] = cz.suma(r[i - t],c)
+
+        r0, r1 = self.desarrollo_taylor(r[:2*t])
+        q0, q1 = self.desarrollo_taylor(q)
+        ceros = [f_q_m.cero(self.p,self.f,self.h) for i in range(t - len(r0))]
+        return(r0 + ceros + q0, r1 + ceros + q1)
+
+    def busqueda_chien(self,a,u):
+        if self.hb is not None:
+            return(f_2_m_pol.busqueda_chien(f_2_m_pol.a_int(a), [f_2_m.elem_a_int(x) for x in u], self.hb))
+
+        a = self.vd_len(self.cop_pol(a))
+        t = len(a) - 1
+        sol = []
+        if t <= 0 or u == []:
+            return(sol)
+
+        cz = self.cuerpo
+        if u[0] == cz.cero:
+            raise ValueError('Los puntos de la búsqueda de Chien deben ser no nulos')
+
+        alfa = cz.mult(u[1], cz.inv_mult(u[0])) if len(u) > 1 else cz.uno
+        paso = [cz.uno]*(t+1) # alfa^j
+        term = a # a[j] * u[i]^j
+        y = cz.uno
+        for j in range(1,t+1):
+            paso[j] = cz.mult(paso[j-1], alfa)
+            y = cz.mult(y, u[0])
+            term[j] = cz.mult(a[j], y)
+
+        x = u[0]
+        for i in range(len(u)):
+            if i > 0:
+                x = cz.mult(x, alfa)
+                if x != u[i]:
+                    raise ValueError('Los puntos de la búsqueda de Chien no son potencias consecutivas')
+                for j in range(1,t+1):
+                    term[j] = cz.mult(term[j], paso[j])
+
+            s = cz.cero
+            for c in term:
+                s = cz.suma(s,c)
+            if s == cz.cero:
+                sol.append(i)
+                if len(sol) == t: # a no tiene más raíces
+                    break
+
+        return(sol)
+
+    def raices(self,a):
+        if self.hb is not None:
+            sol = f_2_m_pol.raices(f_2_m_pol.a_int(a), self.hb)
+            return(sorted(f_2_m.elem_de_int(x) for x in sol))
+
+        a = self.vd_len(self.cop_pol(a))
+        if len(a) <= 1:
+            return([])
+
+        cz = self.cuerpo
+        a = self.gcd_ext(a,self.cero)[0] # mónico
+        q = self.p ** ((len(self.f) - 1)*(len(self.h) - 1)) # número de elementos de Fq^m
+        x = [cz.cero, cz.uno]
+        xq = Contexto(self.p,self.f,self.h,a).pot_mod(x,q) # x^(q^m) (mod a)
+        s = self.gcd(a, self.suma(xq,self.inv_adit(x)))
+
+        sol = []
+        self.separa_raices(s,0,sol)
+        return(sorted(sol))
+
+    def separa_raices(self,a,j,sol):
+        '''
+        Añade a sol las raíces de a, mónico y producto de factores x - u 
+        distintos. Si p = 2, a se separa con gcd(a, Tr(b*x) mod a) para los 
+        elementos b = t^i * s^k de la base de Fq^m sobre F2 a partir del j-ésimo 
+        (véase f_2_m_pol.separa_raices). Si p es impar, con gcd(a, (x + d)^((q^m - 1)/2) - 1) 
+        para elementos d aleatorios de Fq^m, hasta dar con uno que separe a. 
+        Los d se toman del generador azar del Contexto, no del módulo random
+        '''
+        cz = self.cuerpo
+        if len(a) <= 1:
+            return
+        if len(a) == 2:
+            sol.append(cz.inv_adit(a[0])) # x - u, con raíz u
+            return
+
+        cm = Contexto(self.p,self.f,self.h,a) # operaciones módulo a
+        n = len(self.f) - 1
+        nm = n*(len(self.h) - 1)
+        if self.p == 2:
+            for i in range(j, nm):
+                b = [f_q_pol.cero(self.p,self.f)[:] for k in range(i // n)] + [[0]*(i % n) + [1]]
+                y = cm.resto([cz.cero, b]) # b*x (mod a)
+                tr = y
+                for k in range(nm - 1):
+                    y = cm.resto(cm.cuadrado(y))
+                    tr = self.suma(tr,y)
+
+                d = self.gcd(a,tr)
+                if 1 < len(d) < len(a):
+                    self.separa_raices(d,i+1,sol)
+                    self.separa_raices(self.div_pol(a,d)[0],i+1,sol)
+                    return
+
+        else:
+            e = (self.p ** nm - 1) // 2
+            if self.azar is None:
+                self.azar = random.Random()
+            while True:
+                d = f_q_m.rand_elem(self.p,self.f,self.h,self.azar)
+                y = cm.pot_mod([d, cz.uno], e)
+                d = self.gcd(a, self.suma(y,self.inv_adit(self.uno)))
+                if 1 < len(d) < len(a):
+                    self.separa_raices(d,0,sol)
+                    self.separa_raices(self.div_pol(a,d)[0],0,sol)
+                    return
+
+    def arbol_subproductos(self,u):
+        '''
+        Niveles del árbol de subproductos de los puntos u: el nivel 0 son los 
+        polinomios x - u[i], cada nivel es el producto de los polinomios 
+        consecutivos dos a dos del anterior, y el último tiene un único polinomio
+        '''
+        cz = self.cuerpo
+        arbol = [[[cz.inv_adit(x), f_q_m.uno(self.p,self.f,self.h)] for x in u]]
+        while len(arbol[-1]) > 1:
+            nivel = arbol[-1]
+            arbol.append([self.mult(nivel[i],nivel[i+1]) if i+1 < len(nivel) else nivel[i] 
+                          for i in range(0, len(nivel), 2)])
+
+        return(arbol)
+
+    def div_lineal(self,a,u):
+        if self.hb is not None:
+            q,r = f_2_m_pol.div_lineal(f_2_m_pol.a_int(a), f_2_m.elem_a_int(u), self.hb)
+            return(f_2_m_pol.de_int(q), f_2_m.elem_de_int(r))
+
+        if len(a) == 0:
+            return(cero(self.p,self.f,self.h), f_q_m.cero(self.p,self.f,self.h))
+
+        cz = self.cuerpo
+        q = [0]*(len(a)-1)
+        r = f_q_pol.cop_pol(a[-1],self.p,self.f)
+        for i in range(len(a)-2,-1,-1):
+            q[i] = r
+            r = cz.suma(a[i], cz.mult(r,u))
+
+        return(self.vd_len(q), r)
+
+    def deriv(self,a):
+        if len(a) == 0:
+            return(cero(self.p,self.f,self.h))
+
+        cz = self.cuerpo
+        ad = [f_q_m.cero(self.p,self.f,self.h)]*(len(a)-1)
+        for i in range(1,len(a)):
+            ai = a[i]
+            for j in range(i):
+                ad[i-1] = cz.suma(ad[i-1],ai)
+
+        return(self.vd_len(ad))
+
+    def vd_len(self,a):
+        if len(a) == 0:
+            return(cero(self.p,self.f,self.h))
+
+        c = self.cuerpo.cero
+        while len(a) > 0 and a[-1] == c:
+            a.pop()
+
+        return(a)
+
+    def div_pol(self,a,b,cb_i=None):
+        '''
+        cb_i es, si ya se conoce, el inverso del coeficiente principal de b
+        '''
+        if self.hb is not None:
+            if cb_i is not None:
+                cb_i = f_2_m.elem_a_int(cb_i)
+            q,r = f_2_m_pol.div_pol(f_2_m_pol.a_int(a), f_2_m_pol.a_int(b), self.hb, cb_i)
+            return(f_2_m_pol.de_int(q),f_2_m_pol.de_int(r))
+
+        if a == self.cero or len(a) < len(b):
+            return(cero(self.p,self.f,self.h), self.cop_pol(a)) # el resto es una copia de a
+
+        cz = self.cuerpo
+        r = self.vd_len(self.cop_pol(a)) # se trabaja sobre una copia de a, que se modifica
+        d = len(b) - 1
+        q = [f_q_m.cero(self.p,self.f,self.h) for i in range(len(r) - d)]
+        if cb_i is None and b[-1] != cz.uno: # si b es mónico no hace falta el inverso
+            cb_i = cz.inv_mult(b[-1]) # inverso del coeficiente principal de b
+        if cb_i == cz.uno:
+            cb_i = None
+        nb = [cz.inv_adit(c) for c in b[:-1]] # -b, sin el coeficiente principal
+
+        for i in range(len(r)-1, d-1, -1):
+            c = r[i] # coeficiente principal de lo que queda por dividir
+            if c != cz.cero:
+                if cb_i is not None:
+                    c = cz.mult(c,cb_i)
+                q[i-d] = c
+                # restamos c * x^(i-d) * b
+                for j in range(d):
+                    r[i-d+j] = cz.suma(r[i-d+j],cz.mult(c,nb[j]))
+
+        return(self.vd_len(q),self.vd_len(r[:d]))
+
+    def gcd_ext_no_mon(self,a,b):
+        if self.hb is not None:
+            sol = f_2_m_pol.gcd_ext_no_mon(f_2_m_pol.a_int(a), f_2_m_pol.a_int(b), self.hb)
+            return(tuple(f_2_m_pol.de_int(c) for c in sol))
+
+        if min(len(a),len(b)) >= UMBRAL_HGCD:
+            return(self.gcd_ext_hgcd(a,b))
+
+        r0, r1 = a, b
+        x0, x1 = uno(self.p,self.f,self.h), cero(self.p,self.f,self.h)
+        y0, y1 = cero(self.p,self.f,self.h), uno(self.p,self.f,self.h)
+        while r1 != self.cero:
+            q, r = self.div_pol(r0,r1)
+            r0, r1 = r1, r
+            x0, x1 = x1, self.suma(x0,self.inv_adit(self.mult(q,x1)))
+            y0, y1 = y1, self.suma(y0,self.inv_adit(self.mult(q,y1)))
+
+        return(self.cop_pol(r0),x0,y0)
+
+    def gcd_ext_hgcd(self,a,b):
+        '''
+        Mismo resultado que gcd_ext_no_mon (con b no nulo), obteniendo la sucesión 
+        de cocientes del algoritmo de Euclides por bloques con hgcd
+        '''
+        q, r = self.div_pol(a,b) # primer paso, tras el que deg(r0) > deg(r1)
+        r0, r1 = b, r
+        M = (cero(self.p,self.f,self.h), uno(self.p,self.f,self.h), 
+             uno(self.p,self.f,self.h), self.inv_adit(q))
+        while r1 != self.cero:
+            H = self.hgcd(r0,r1)
+            r0, r1 = (self.suma(self.mult(H[0],r0),self.mult(H[1],r1)), 
+                      self.suma(self.mult(H[2],r0),self.mult(H[3],r1)))
+            M = self.mult_mat(H,M)
+            if r1 == self.cero:
+                break
+
+            q, r = self.div_pol(r0,r1)
+            r0, r1 = r1, r
+            M = self.paso_euclides(M,q)
+
+        return(self.cop_pol(r0),M[0],M[1])
+
+    def hgcd(self,a,b):
+        '''
+        Con deg(b) < deg(a), matriz (m00,m01,m10,m11) producto de los pasos del 
+        algoritmo de Euclides sobre a y b tal que c = m00*a + m01*b y 
+        d = m10*a + m11*b son los dos restos consecutivos con 
+        deg(c) >= k > deg(d), k = ceil(deg(a)/2) (algoritmo half-GCD)
+        '''
+        k = len(a) // 2 # ceil(deg(a)/2)
+        if len(a) < UMBRAL_HGCD: # pasos del algoritmo de Euclides hasta bajar de grado k
+            R = (uno(self.p,self.f,self.h), cero(self.p,self.f,self.h), 
+                 cero(self.p,self.f,self.h), uno(self.p,self.f,self.h))
+            while len(b) - 1 >= k:
+                q, r = self.div_pol(a,b)
+                a, b = b, r
+                R = self.paso_euclides(R,q)
+            return(R)
+
+        R = self.hgcd(a[k:],b[k:])
+        c, d = (self.suma(self.mult(R[0],a),self.mult(R[1],b)), 
+                self.suma(self.mult(R[2],a),self.mult(R[3],b)))
+        if len(d) - 1 < k:
+            return(R)
+
+        q, r = self.div_pol(c,d)
+        c, d = d, r
+        R = self.paso_euclides(R,q)
+        if len(d) - 1 < k:
+            return(R)
+
+        l = 2*k - (len(c) - 1)
+        S = self.hgcd(c[l:],d[l:])
+        return(self.mult_mat(S,R))
+
+    def paso_euclides(self,M,q):
+        '''
+        Producto de la matriz de un paso del algoritmo de Euclides, 
+        (0, 1, 1, -q), por la matriz M
+        '''
+        return(M[2], M[3], self.suma(M[0],self.inv_adit(self.mult(q,M[2]))), 
+               self.suma(M[1],self.inv_adit(self.mult(q,M[3]))))
+
+    def mult_mat(self,M,N):
+        '''
+        Producto de las matrices 2x2 de polinomios M y N
+        '''
+        return(self.suma(self.mult(M[0],N[0]),self.mult(M[1],N[2])),
+               self.suma(self.mult(M[0],N[1]),self.mult(M[1],N[3])),
+               self.suma(self.mult(M[2],N[0]),self.mult(M[3],N[2])),
+               self.suma(self.mult(M[2],N[1]),self.mult(M[3],N[3])))
+
+    def cop_pol(self,a):
+        return(cop_pol(a,self.p,self.f,self.h))
+
+
+def contexto(p,f,h):
+    '''
+    Parameters
+    ----------
+    p : INT
+        número primo >= 2
+    f : LIST
+        polinomio mónico, irreducible, de grado n >= 1, perteneciente 
+        al anillo (Z/pZ)[t]
+    h : LIST
+        lista de listas que representa un polinomio mónico, irreducible, 
+        de grado m >= 1, perteneciente al anillo Fq[s]  
+
+    Returns
+    -------
+    El objeto Contexto del anillo Fq^m[x], sin polinomio g, que se construye una 
+    única vez por cuerpo. Se comprueba primero el último contexto devuelto
+    '''
+    global _ultimo
+    sol = _ultimo
+    if sol is not None and sol.p == p and sol.h == h and sol.f == f:
+        return(sol)
+
+    clave = f_q_m_tab.clave_cuerpo(p,f,h)
+    sol = _contextos.get(clave)
+    if sol is None:
+        sol = Contexto(p,f,h)
+        _contextos[clave] = sol
+    _ultimo = sol
+    return(sol)
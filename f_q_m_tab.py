@@ -0,0 +1,539 @@
+# -*- coding: utf-8 -*-
+"""
+Diana Gómez Moreno
+
+Tablas de logaritmos (log/antilog) y logaritmos de Zech para cuerpos Fq^m
+pequeños, con q = p^n
+
+Se define Fq^m como Fq[x]/<h>, h irreducible mónico tal que deg(h) = m.
+Fijado un elemento primitivo alpha de Fq^m, todo elemento no nulo se escribe
+como alpha^i con 0 <= i < q^m - 1, de modo que:
+    alpha^i * alpha^j = alpha^(i+j)
+    alpha^i + alpha^j = alpha^(i + Z(j-i)), con Z(k) = log(1 + alpha^k)
+    el logaritmo de Zech de k
+Así, la multiplicación, el inverso y la potencia pasan a ser consultas en tabla.
+
+Las tablas solo se construyen si q^m <= TAM_MAX; en caso contrario
+construir(p,f,h) devuelve None y se debe usar la aritmética polinómica de f_q_m.
+Su uso es opcional: tras llamar a activar(p,f,h), las funciones de f_q_m y
+f_q_m_pol utilizan automáticamente las tablas para ese cuerpo.
+
+Contiene las siguientes funciones:
+    construir(p,f,h)
+    activar(p,f,h)
+    desactivar(p,f,h)
+    activa(p,f,h)
+    activa_clave(clave)
+    mult(a,b,T)
+    inv_mult(a,T)
+    pot(a,k,T)
+    log(a,T)
+    exp(i,T)
+    suma_log(i,j,T)
+    mult_pol(a,b,T)
+    eval_pol(a,u,T)
+
+Funciones auxiliares:
+    clave_cuerpo(p,f,h)
+    elem_de_indice(c,p,f,h)
+    elem_primitivo(p,f,h)
+    copia(a)
+"""
+import f_q_pol, f_q, z_pz_pol, z_pz
+
+TAM_MAX = 2**12 # mayor número de elementos de Fq^m para el que se construyen tablas
+
+_cache = {} # tablas ya construidas (o None si el cuerpo es demasiado grande)
+_activas = {} # tablas que deben usar f_q_m y f_q_m_pol
+
+
+class Tablas:
+    '''
+    Tablas de un cuerpo Fq^m concreto:
+        exp[i] = alpha^i, de longitud 2*(q^m - 1) para no tener que reducir
+               la suma de dos logaritmos
+        log[clave(a)] = i tal que a = alpha^i, con log[clave(cero)] = None
+        zech[k] = log(1 + alpha^k), o None si 1 + alpha^k = 0
+        menos_uno = log(-1)
+    '''
+    __slots__ = ('p', 'f', 'h', 'orden', 'exp', 'log', 'zech', 'menos_uno')
+
+
+def construir(p,f,h):
+    '''
+    Parameters
+    ----------
+    p : INT
+        número primo >= 2
+    f : LIST
+        polinomio mónico, irreducible, de grado n >= 1, perteneciente
+        al anillo (Z/pZ)[t]
+    h : LIST
+        lista de listas que representa un polinomio mónico, irreducible,
+        de grado m >= 1, perteneciente al anillo Fq[x]
+
+    Returns
+    -------
+    T, las tablas del cuerpo Fq^m, o None si q^m > TAM_MAX.
+    Se construyen una única vez por cuerpo.
+    '''
+    clave = clave_cuerpo(p,f,h)
+    if clave in _cache:
+        return(_cache[clave])
+
+    tam = (p**(len(f)-1))**(len(h)-1) # número de elementos de Fq^m
+    if tam > TAM_MAX:
+        _cache[clave] = None
+        return(None)
+
+    orden = tam - 1 # orden del grupo multiplicativo de Fq^m
+    alfa = elem_primitivo(p,f,h)
+
+    exp = [0]*(2*orden)
+    log = {(): None}
+    x = f_q_pol.uno(p,f)
+    for i in range(orden):
+        exp[i] = x
+        exp[i+orden] = x
+        log[tuple(map(tuple,x))] = i
+        x = f_q_pol.div_pol(f_q_pol.mult(x,alfa,p,f), h, p, f)[1]
+
+    zech = [None]*orden
+    for k in range(orden):
+        s = f_q_pol.suma(exp[k], f_q_pol.uno(p,f), p, f)
+        if s != f_q_pol.cero(p,f):
+            zech[k] = log[tuple(map(tuple,s))]
+
+    T = Tablas()
+    T.p = p
+    T.f = f + []
+    T.h = f_q_pol.cop_pol(h,p,f)
+    T.orden = orden
+    T.exp = exp
+    T.log = log
+    T.zech = zech
+    T.menos_uno = 0 if p == 2 else orden//2
+
+    _cache[clave] = T
+    return(T)
+
+
+def activar(p,f,h):
+    '''
+    Parameters
+    ----------
+    p : INT
+        número primo >= 2
+    f : LIST
+        polinomio mónico, irreducible, de grado n >= 1, perteneciente
+        al anillo (Z/pZ)[t]
+    h : LIST
+        lista de listas que representa un polinomio mónico, irreducible,
+        de grado m >= 1, perteneciente al anillo Fq[x]
+
+    Returns
+    -------
+    True si se han podido construir las tablas de Fq^m, que a partir de ahora
+    usarán f_q_m y f_q_m_pol; False si el cuerpo es demasiado grande y se
+    seguirá usando la aritmética polinómica
+    '''
+    T = construir(p,f,h)
+    if T is None:
+        return(False)
+
+    _activas[clave_cuerpo(p,f,h)] = T
+    return(True)
+
+
+def desactivar(p,f,h):
+    '''
+    Parameters
+    ----------
+    p : INT
+        número primo >= 2
+    f : LIST
+        polinomio mónico, irreducible, de grado n >= 1, perteneciente
+        al anillo (Z/pZ)[t]
+    h : LIST
+        lista de listas que representa un polinomio mónico, irreducible,
+        de grado m >= 1, perteneciente al anillo Fq[x]
+
+    Returns
+    -------
+    None. f_q_m y f_q_m_pol vuelven a usar la aritmética polinómica en Fq^m
+    '''
+    _activas.pop(clave_cuerpo(p,f,h), None)
+
+
+def activa(p,f,h):
+    '''
+    Parameters
+    ----------
+    p : INT
+        número primo >= 2
+    f : LIST
+        polinomio mónico, irreducible, de grado n >= 1, perteneciente
+        al anillo (Z/pZ)[t]
+    h : LIST
+        lista de listas que representa un polinomio mónico, irreducible,
+        de grado m >= 1, perteneciente al anillo Fq[x]
+
+    Returns
+    -------
+    Las tablas de Fq^m si han sido activadas, None en otro caso
+    '''
+    if not _activas: # caso habitual, sin coste adicional
+        return(None)
+
+    return(_activas.get(clave_cuerpo(p,f,h)))
+
+
+def activa_clave(clave):
+    '''
+    Parameters
+    ----------
+    clave : TUPLE
+        clave del cuerpo Fq^m, tal como la devuelve clave_cuerpo(p,f,h)
+
+    Returns
+    -------
+    Lo mismo que activa(p,f,h), sin tener que volver a construir la clave
+    '''
+    if not _activas:
+        return(None)
+
+    return(_activas.get(clave))
+
+
+def mult(a,b,T):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        lista de listas que representa un elemento del cuerpo Fq^m
+    b : LIST
+        lista de listas que representa un elemento del cuerpo Fq^m
+    T : Tablas
+        tablas del cuerpo Fq^m
+
+    Returns
+    -------
+    Lista de listas que representa el elemento de Fq^m resultado de
+    multiplicar a y b
+    '''
+    i = log(a,T)
+    j = log(b,T)
+    if i is None or j is None:
+        return([])
+
+    return(copia(T.exp[i + j]))
+
+
+def inv_mult(a,T):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        lista de listas que representa un elemento del cuerpo Fq^m
+    T : Tablas
+        tablas del cuerpo Fq^m
+
+    Returns
+    -------
+    Lista de listas que representa el inverso multiplicativo de a en Fq^m. 
+    Si a es el cero, se devuelve el cero, como en f_q_m.inv_mult sin tablas
+    '''
+    i = log(a,T)
+    if i is None:
+        return([])
+
+    return(copia(T.exp[(-i) % T.orden]))
+
+
+def pot(a,k,T):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        lista de listas que representa un elemento del cuerpo Fq^m
+    k : INT
+        número entero
+    T : Tablas
+        tablas del cuerpo Fq^m
+
+    Returns
+    -------
+    Lista de listas que representa el elemento de Fq^m resultado de
+    calcular a^k. Si a es el cero y k < 0, se devuelve el cero, como en 
+    f_q_m.pot sin tablas
+    '''
+    i = log(a,T)
+    if i is None:
+        if k == 0:
+            return(copia(T.exp[0]))
+        return([])
+
+    return(copia(T.exp[(i*k) % T.orden]))
+
+
+def log(a,T):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        lista de listas que representa un elemento del cuerpo Fq^m
+    T : Tablas
+        tablas del cuerpo Fq^m
+
+    Returns
+    -------
+    i, entero 0 <= i < q^m - 1 tal que a = alpha^i, o None si a es el cero
+    '''
+    try:
+        return(T.log[tuple(map(tuple,a))])
+
+    except KeyError: # puede que a tenga ceros de más a la derecha
+        b = f_q_pol.vd_len([z_pz_pol.vd_len(c+[],T.p) for c in a], T.p, T.f)
+        clave = tuple(map(tuple,b))
+        if clave not in T.log:
+            raise ValueError(f'{a} no es un elemento del cuerpo')
+        return(T.log[clave])
+
+
+def exp(i,T):
+    '''
+    Parameters
+    ----------
+    i : INT
+        número entero, o None para representar el elemento cero
+    T : Tablas
+        tablas del cuerpo Fq^m
+
+    Returns
+    -------
+    Lista de listas que representa el elemento alpha^i de Fq^m
+    '''
+    if i is None:
+        return([])
+
+    return(copia(T.exp[i % T.orden]))
+
+
+def suma_log(i,j,T):
+    '''
+    Parameters
+    ----------
+    i : INT
+        logaritmo de un elemento de Fq^m, o None si es el cero
+    j : INT
+        logaritmo de un elemento de Fq^m, o None si es el cero
+    T : Tablas
+        tablas del cuerpo Fq^m
+
+    Returns
+    -------
+    El logaritmo de alpha^i + alpha^j (None si es el cero), calculado con
+    el logaritmo de Zech: alpha^i + alpha^j = alpha^(i + Z(j-i))
+    '''
+    if i is None:
+        return(j)
+    if j is None:
+        return(i)
+
+    z = T.zech[(j-i) % T.orden]
+    if z is None:
+        return(None)
+
+    return((i + z) % T.orden)
+
+
+def mult_pol(a,b,T):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        Lista de listas de listas que representa un polinomio de grado arbitrario del
+        anillo Fq^m[x]
+    b : LIST
+        Lista de listas de listas que representa un polinomio de grado arbitrario del
+        anillo Fq^m[x]
+    T : Tablas
+        tablas del cuerpo Fq^m
+
+    Returns
+    -------
+    Lista de listas de listas que representa el polinomio de Fq^m[x] resultado
+    de multiplicar a y b. Todas las operaciones se hacen sobre logaritmos.
+    '''
+    if a == [] or b == []:
+        return([])
+
+    la = [log(c,T) for c in a]
+    lb = [log(c,T) for c in b]
+    orden = T.orden
+    zech = T.zech
+    sol = [None]*(len(a) + len(b) - 1)
+
+    for i in range(len(la)):
+        if la[i] is None:
+            continue
+        for j in range(len(lb)):
+            if lb[j] is None:
+                continue
+            prod = la[i] + lb[j]
+            s = sol[i+j]
+            if s is None:
+                sol[i+j] = prod % orden
+            else: # sol[i+j] + alpha^prod, con el logaritmo de Zech
+                z = zech[(prod - s) % orden]
+                sol[i+j] = None if z is None else (s + z) % orden
+
+    while sol and sol[-1] is None:
+        sol.pop()
+
+    return([exp(c,T) for c in sol])
+
+
+def eval_pol(a,u,T):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        Lista de listas de listas que representa un polinomio de grado arbitrario del
+        anillo Fq^m[x]
+    u : LIST
+        lista de listas que representa un elemento del cuerpo Fq^m
+    T : Tablas
+        tablas del cuerpo Fq^m
+
+    Returns
+    -------
+    Lista de listas que representa el elemento del cuerpo Fq^m que se obtiene
+    al evaluar el polinomio a en u, mediante la regla de Horner sobre logaritmos
+    '''
+    if a == []:
+        return([])
+
+    lu = log(u,T)
+    if lu is None:
+        return(exp(log(a[0],T),T))
+
+    orden = T.orden
+    sol = None
+
+    for i in range(len(a)-1,-1,-1):
+        if sol is not None:
+            sol = (sol + lu) % orden
+        sol = suma_log(sol, log(a[i],T), T)
+
+    return(exp(sol,T))
+
+
+# Funciones auxiliares:
+def clave_cuerpo(p,f,h):
+    '''
+    Parameters
+    ----------
+    p : INT
+        número primo >= 2
+    f : LIST
+        polinomio mónico, irreducible, de grado n >= 1, perteneciente
+        al anillo (Z/pZ)[t]
+    h : LIST
+        lista de listas que representa un polinomio mónico, irreducible,
+        de grado m >= 1, perteneciente al anillo Fq[x]
+
+    Returns
+    -------
+    Una tupla que identifica el cuerpo Fq^m y puede usarse como clave de un diccionario
+    '''
+    return((p, tuple(f), tuple(map(tuple,h))))
+
+
+def elem_de_indice(c,p,f,h):
+    '''
+    Parameters
+    ----------
+    c : INT
+        número entero 0 <= c < q^m
+    p : INT
+        número primo >= 2
+    f : LIST
+        polinomio mónico, irreducible, de grado n >= 1, perteneciente
+        al anillo (Z/pZ)[t]
+    h : LIST
+        lista de listas que representa un polinomio mónico, irreducible,
+        de grado m >= 1, perteneciente al anillo Fq[x]
+
+    Returns
+    -------
+    Lista de listas que representa el elemento de Fq^m cuyos coeficientes
+    son las cifras de c en base p (las n primeras para el primer coeficiente,
+    y así sucesivamente)
+    '''
+    n = len(f) - 1
+    m = len(h) - 1
+    sol = [0]*m
+
+    for j in range(m):
+        coef = [0]*n
+        for i in range(n):
+            c, coef[i] = divmod(c, p)
+        sol[j] = z_pz_pol.vd_len(coef, p)
+
+    return(f_q_pol.vd_len(sol, p, f))
+
+
+def elem_primitivo(p,f,h):
+    '''
+    Parameters
+    ----------
+    p : INT
+        número primo >= 2
+    f : LIST
+        polinomio mónico, irreducible, de grado n >= 1, perteneciente
+        al anillo (Z/pZ)[t]
+    h : LIST
+        lista de listas que representa un polinomio mónico, irreducible,
+        de grado m >= 1, perteneciente al anillo Fq[x]
+
+    Returns
+    -------
+    Lista de listas que representa un elemento primitivo de Fq^m, es decir,
+    un generador de su grupo multiplicativo. Se prueba primero con x.
+    '''
+    orden = (p**(len(f)-1))**(len(h)-1) - 1
+    primos = z_pz.factores_primos(orden)
+
+    candidatos = [[f_q.cero(p,f), f_q.uno(p,f)]] if len(h) > 2 else []
+    c = 1
+    while True:
+        if candidatos:
+            beta = candidatos.pop()
+        else:
+            beta = elem_de_indice(c, p, f, h)
+            c = c + 1
+
+        # beta es primitivo si beta^(orden/r) != 1 para todo primo r que divide al orden
+        primitivo = True
+        for r in primos:
+            if f_q_pol.pot_mod(beta, orden//r, p, f, h) == f_q_pol.uno(p,f):
+                primitivo = False
+                break
+
+        if primitivo:
+            return(beta)
+
+
+def copia(a):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        lista de listas que representa un elemento del cuerpo Fq^m
+
+    Returns
+    -------
+    Lista de listas que es una copia de a, independiente de las tablas
+    '''
+    return([c + [] for c in a])
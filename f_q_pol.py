@@ -14,6 +14,7 @@ Contiene las siguientes funciones:
     suma(a,b,p,f)
     inv_adit(a,p,f)
     mult(a,b,p,f)
+    cuadrado(a,p,f)
     gcd(a,b,p,f)
     gcd_ext(a,b,p,f)
     pot_mod(a,k,p,f,g)
@@ -23,8 +24,39 @@ Funciones auxiliares:
     div_pol(a,b,p,f)
     gcd_ext_no_mon(a,b,p,f)
     cop_pol(a,p,f)
+    mult_escuela(a,b,p,f)
+    mult_karatsuba(a,b,p,f)
+    cuadrado_escuela(a,p,f)
+    cuadrado_karatsuba(a,p,f)
+    mult_kronecker(a,b,p,f)
+    div_newton(a,b,p,f)
+    inv_serie(a,k,p,f)
+    gcd_ext_hgcd(a,b,p,f)
+    hgcd(a,b,p,f)
+    mult_mat(M,N,p,f)
+
+Si Fq no tiene tablas (f_q.tablas) ni representación binaria y ambos factores 
+tienen al menos UMBRAL_KRONECKER coeficientes, mult y cuadrado usan la sustitución 
+de Kronecker en dos niveles (véase z_pz_pol.mult_kronecker). En otro caso, si 
+ambos factores tienen al menos UMBRAL_KARATSUBA coeficientes, usan el algoritmo 
+de Karatsuba, y si no, el producto escolar.
+
+div_pol divide sobre una copia del dividendo, restando cada paso en su sitio (si 
+el divisor es mónico no se multiplica por el inverso de su coeficiente principal). 
+Si mult usa la sustitución de Kronecker y el cociente y el divisor tienen al menos 
+UMBRAL_NEWTON coeficientes, se usa la división de Newton (div_newton).
+
+gcd_ext_no_mon es el algoritmo de Euclides extendido iterativo; si mult usa la 
+sustitución de Kronecker y a y b tienen al menos UMBRAL_HGCD coeficientes, usa 
+el algoritmo half-GCD (gcd_ext_hgcd), que obtiene el mismo resultado con un 
+número subcuadrático de operaciones.
 """
-import f_q
+import f_q, z_pz_pol
+
+UMBRAL_KARATSUBA = 24 # longitud mínima de los factores para usar Karatsuba
+UMBRAL_KRONECKER = 2 # longitud mínima de los factores para usar la sustitución de Kronecker
+UMBRAL_NEWTON = 16 # longitud mínima del cociente y del divisor para dividir con Newton
+UMBRAL_HGCD = 32 # longitud mínima de a y b para usar el algoritmo half-GCD en gcd_ext
 
 def cero(p,f):
     '''
@@ -151,18 +183,48 @@ def mult(a,b,p,f):
     if a==cero(p,f) or b==cero(p,f):
         return(cero(p,f))
     
-    else:
-        la = len(a)
-        lb = len(b)
-        l = la + lb - 1
-        sol = l*[f_q.cero(p,f)]
-    
-        for i in range(la):
-            for j in range(lb):
-                sol[i+j] = f_q.suma(sol[i+j],f_q.mult(a[i],b[j],p,f),p,f)
-        
+    cq = f_q.contexto(p,f)
+    if cq.tablas is None and cq.fb is None and min(len(a),len(b)) >= UMBRAL_KRONECKER:
+        return(mult_kronecker(a,b,p,f))
+
+    return(mult_karatsuba(a,b,p,f))
+
+
+def cuadrado(a,p,f):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        Lista de listas que representa un polinomio de grado arbitrario del
+        anillo Fq[x]
+    p : INT
+        número primo >= 2
+    f : LIST
+        polinomio mónico, irreducible, de grado n >= 1, perteneciente 
+        al anillo (Z/pZ)[t]
+
+    Returns
+    -------
+    Lista de listas que representa el polinomio a*a del anillo Fq[x], calculado 
+    con aproximadamente la mitad de productos que mult(a,a,p,f). Si p = 2, es 
+    sum(ai^2 * x^(2i))
+    '''
+    if a==cero(p,f):
+        return(cero(p,f))
+
+    if p == 2:
+        cq = f_q.contexto(p,f)
+        sol = [f_q.cero(p,f)]*(2*len(a) - 1)
+        for i in range(len(a)):
+            sol[2*i] = cq.mult(a[i],a[i])
         return(sol)
 
+    cq = f_q.contexto(p,f)
+    if cq.tablas is None and cq.fb is None and len(a) >= UMBRAL_KRONECKER:
+        return(mult_kronecker(a,a,p,f))
+
+    return(cuadrado_karatsuba(a,p,f))
+
 
 def gcd(a,b,p,f):
     '''
@@ -249,7 +311,7 @@ def pot_mod(a,k,p,f,g):
     elif (k>0):
         if k%2==0: #k es par
             x = pot_mod(a,k//2,p,f,g)
-            aux = mult(x,x,p,f)
+            aux = cuadrado(x,p,f)
             sol = div_pol(aux,g,p,f)[1]
         
         else: #k es impar
@@ -320,26 +382,30 @@ def div_pol(a,b,p,f):
         r = cop_pol(a,p,f) # es necesario copiar a, pues es el resto
         return(q,r)
     
-    else:
-        lq = len(a) - len(b) + 1 #longitud del cociente
-        
-        q = [f_q.cero(p,f)]*(lq) 
-        
-        cb_i = f_q.inv_mult(b[-1],p,f) # inverso del coeficiente principal de b
-        
-        while len(a)>=len(b): #mientras podamos dividir a entre b
-            ca = a[-1] # coeficiente principal de a
-            
-            paso = [f_q.cero(p,f)]*lq
-            paso[len(a)-len(b)] = f_q.mult(ca,cb_i,p,f)
-            q = suma(q,paso,p,f)
-            
-            sumar = inv_adit(mult(b,paso,p,f),p,f)
-            a = suma(a,sumar,p,f)
-                   
-        r = a # no me hace falta copiar a, porque a ya la hemos cambiado en el bucle, 
-              # de modo que la variable a ya no está asociada a la lista de listas original
-        return(q,r)        
+    r = vd_len(cop_pol(a,p,f),p,f) # se trabaja sobre una copia de a, que se modifica
+    d = len(b) - 1
+    lq = len(r) - d #longitud del cociente
+    cq = f_q.contexto(p,f)
+    if cq.tablas is None and cq.fb is None and min(lq,len(b)) >= UMBRAL_NEWTON:
+        return(div_newton(r,b,p,f)) # sólo si mult usa la sustitución de Kronecker
+
+    q = [f_q.cero(p,f) for i in range(lq)]
+    cb_i = None # inverso del coeficiente principal de b, innecesario si b es mónico
+    if b[-1] != cq.uno:
+        cb_i = cq.inv_mult(b[-1])
+    nb = [cq.inv_adit(c) for c in b[:-1]] # -b, sin el coeficiente principal
+
+    for i in range(len(r)-1, d-1, -1):
+        c = r[i] # coeficiente principal de lo que queda por dividir
+        if c != cq.cero:
+            if cb_i is not None:
+                c = cq.mult(c,cb_i)
+            q[i-d] = c
+            # restamos c * x^(i-d) * b
+            for j in range(d):
+                r[i-d+j] = cq.suma(r[i-d+j],cq.mult(c,nb[j]))
+
+    return(vd_len(q,p,f),vd_len(r[:d],p,f))
 
 
 def gcd_ext_no_mon(a,b,p,f):
@@ -363,13 +429,20 @@ def gcd_ext_no_mon(a,b,p,f):
     g,x,y listas de listas que representan a los polinomio del anillo Fq[x] 
     tal que gcd(a,b) = g, con a*x + b*y = g, g no necesariamente mónico
     '''
-    if b == cero(p,f):
-        return(cop_pol(a,p,f),uno(p,f),cero(p,f))
-    
-    else: 
-        q,r = div_pol(a,b,p,f)
-        g,a2,b2 = gcd_ext_no_mon(b,r,p,f)
-        return(g, b2, suma(a2,inv_adit(mult(q,b2,p,f),p,f),p,f))
+    cq = f_q.contexto(p,f)
+    if cq.tablas is None and cq.fb is None and min(len(a),len(b)) >= UMBRAL_HGCD:
+        return(gcd_ext_hgcd(a,b,p,f)) # sólo si mult usa la sustitución de Kronecker
+
+    r0, r1 = a, b
+    x0, x1 = uno(p,f), cero(p,f)
+    y0, y1 = cero(p,f), uno(p,f)
+    while r1 != cero(p,f):
+        q, r = div_pol(r0,r1,p,f)
+        r0, r1 = r1, r
+        x0, x1 = x1, suma(x0,inv_adit(mult(q,x1,p,f),p,f),p,f)
+        y0, y1 = y1, suma(y0,inv_adit(mult(q,y1,p,f),p,f),p,f)
+
+    return(cop_pol(r0,p,f),x0,y0)
 
 
 def cop_pol(a,p,f):
@@ -397,3 +470,407 @@ def cop_pol(a,p,f):
         sol[i] = a[i] + []
 
     return(sol)
+
+
+def mult_escuela(a,b,p,f):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        Lista de listas que representa un polinomio de grado arbitrario del
+        anillo Fq[x]
+    b : LIST
+        Lista de listas que representa un polinomio de grado arbitrario del
+        anillo Fq[x]
+    p : INT
+        número primo >= 2
+    f : LIST
+        polinomio mónico, irreducible, de grado n >= 1, perteneciente 
+        al anillo (Z/pZ)[t]
+
+    Returns
+    -------
+    Lista de longitud len(a) + len(b) - 1 que representa el polinomio a*b, 
+    calculado con el producto escolar
+    '''
+    if a == [] or b == []:
+        return([])
+
+    cq = f_q.contexto(p,f)
+    sol = (len(a) + len(b) - 1)*[f_q.cero(p,f)]
+    for i in range(len(a)):
+        ai = a[i]
+        if ai != cq.cero:
+            for j in range(len(b)):
+                sol[i+j] = cq.suma(sol[i+j],cq.mult(ai,b[j]))
+
+    return(sol)
+
+
+def mult_karatsuba(a,b,p,f):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        Lista de listas que representa un polinomio de grado arbitrario del
+        anillo Fq[x]
+    b : LIST
+        Lista de listas que representa un polinomio de grado arbitrario del
+        anillo Fq[x]
+    p : INT
+        número primo >= 2
+    f : LIST
+        polinomio mónico, irreducible, de grado n >= 1, perteneciente 
+        al anillo (Z/pZ)[t]
+
+    Returns
+    -------
+    Lista de longitud len(a) + len(b) - 1 que representa el polinomio a*b, 
+    calculado con el algoritmo de Karatsuba: si a = a0 + a1*x^k y b = b0 + b1*x^k,
+    a*b = a0*b0 + ((a0+a1)*(b0+b1) - a0*b0 - a1*b1)*x^k + a1*b1*x^(2k). Por debajo 
+    de UMBRAL_KARATSUBA se usa el producto escolar
+    '''
+    la, lb = len(a), len(b)
+    if la < lb:
+        a, b, la, lb = b, a, lb, la
+
+    if lb < UMBRAL_KARATSUBA:
+        return(mult_escuela(a,b,p,f))
+
+    cq = f_q.contexto(p,f)
+    sol = (la + lb - 1)*[f_q.cero(p,f)]
+    if 2*lb <= la: # factores muy desiguales: se multiplica a por bloques de longitud lb
+        for i in range(0, la, lb):
+            prod = mult_karatsuba(a[i:i+lb], b, p, f)
+            for j in range(len(prod)):
+                sol[i+j] = cq.suma(sol[i+j],prod[j])
+        return(sol)
+
+    k = la // 2 # punto de corte, con k < lb
+    a0, a1 = a[:k], a[k:]
+    b0, b1 = b[:k], b[k:]
+    z0 = mult_karatsuba(a0,b0,p,f)
+    z2 = mult_karatsuba(a1,b1,p,f)
+    z1 = mult_karatsuba([cq.suma(x,y) for x,y in zip(a0,a1)] + a1[k:], 
+                        [cq.suma(x,y) for x,y in zip(b0,b1)] + b0[len(b1):] + b1[k:], p, f)
+
+    for i in range(len(z0)):
+        sol[i] = cq.suma(sol[i],z0[i])
+        sol[i+k] = cq.suma(sol[i+k],cq.inv_adit(z0[i]))
+    for i in range(len(z2)):
+        sol[i+2*k] = cq.suma(sol[i+2*k],z2[i])
+        sol[i+k] = cq.suma(sol[i+k],cq.inv_adit(z2[i]))
+    for i in range(len(z1)):
+        sol[i+k] = cq.suma(sol[i+k],z1[i])
+
+    return(sol)
+
+
+def cuadrado_escuela(a,p,f):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        Lista de listas que representa un polinomio de grado arbitrario del
+        anillo Fq[x]
+    p : INT
+        número primo >= 2
+    f : LIST
+        polinomio mónico, irreducible, de grado n >= 1, perteneciente 
+        al anillo (Z/pZ)[t]
+
+    Returns
+    -------
+    Lista de longitud 2*len(a) - 1 que representa el polinomio a*a. Cada producto
+    ai*aj con i != j se calcula una sola vez
+    '''
+    if a == []:
+        return([])
+
+    cq = f_q.contexto(p,f)
+    sol = (2*len(a) - 1)*[f_q.cero(p,f)]
+    for i in range(len(a)):
+        ai = a[i]
+        if ai != cq.cero:
+            sol[2*i] = cq.suma(sol[2*i],cq.mult(ai,ai))
+            ai2 = cq.suma(ai,ai)
+            for j in range(i+1, len(a)):
+                sol[i+j] = cq.suma(sol[i+j],cq.mult(ai2,a[j]))
+
+    return(sol)
+
+
+def cuadrado_karatsuba(a,p,f):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        Lista de listas que representa un polinomio de grado arbitrario del
+        anillo Fq[x]
+    p : INT
+        número primo >= 2
+    f : LIST
+        polinomio mónico, irreducible, de grado n >= 1, perteneciente 
+        al anillo (Z/pZ)[t]
+
+    Returns
+    -------
+    Lista de longitud 2*len(a) - 1 que representa el polinomio a*a, calculado con
+    el algoritmo de Karatsuba (tres cuadrados de la mitad de longitud). Por debajo
+    de UMBRAL_KARATSUBA se usa cuadrado_escuela
+    '''
+    la = len(a)
+    if la < UMBRAL_KARATSUBA:
+        return(cuadrado_escuela(a,p,f))
+
+    cq = f_q.contexto(p,f)
+    k = la // 2
+    a0, a1 = a[:k], a[k:]
+    z0 = cuadrado_karatsuba(a0,p,f)
+    z2 = cuadrado_karatsuba(a1,p,f)
+    z1 = cuadrado_karatsuba([cq.suma(x,y) for x,y in zip(a0,a1)] + a1[k:], p, f)
+
+    sol = (2*la - 1)*[f_q.cero(p,f)]
+    for i in range(len(z0)):
+        sol[i] = cq.suma(sol[i],z0[i])
+        sol[i+k] = cq.suma(sol[i+k],cq.inv_adit(z0[i]))
+    for i in range(len(z2)):
+        sol[i+2*k] = cq.suma(sol[i+2*k],z2[i])
+        sol[i+k] = cq.suma(sol[i+k],cq.inv_adit(z2[i]))
+    for i in range(len(z1)):
+        sol[i+k] = cq.suma(sol[i+k],z1[i])
+
+    return(sol)
+
+
+def mult_kronecker(a,b,p,f):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        Lista de listas que representa un polinomio de grado arbitrario del
+        anillo Fq[x]
+    b : LIST
+        Lista de listas que representa un polinomio de grado arbitrario del
+        anillo Fq[x]
+    p : INT
+        número primo >= 2
+    f : LIST
+        polinomio mónico, irreducible, de grado n >= 1, perteneciente 
+        al anillo (Z/pZ)[t]
+
+    Returns
+    -------
+    Lista de longitud len(a) + len(b) - 1 que representa el polinomio a*b, 
+    calculado con la sustitución de Kronecker en dos niveles: cada coeficiente 
+    de a y b ocupa 2n - 1 coeficientes enteros (los que necesita un producto de 
+    dos elementos de Fq antes de reducir módulo f), de forma que a*b se obtiene 
+    con un único z_pz_pol.mult_kronecker. Después cada bloque se reduce módulo p 
+    y módulo f
+    '''
+    if a == [] or b == []:
+        return([])
+
+    n = len(f) - 1
+    s = 2*n - 1 # coeficientes enteros por cada coeficiente de Fq
+    ea = []
+    for c in a:
+        ea += c + [0]*(s - len(c))
+    eb = []
+    for c in b:
+        eb += c + [0]*(s - len(c))
+
+    prod = z_pz_pol.mult_kronecker(ea,eb)
+    sol = []
+    for i in range(len(a) + len(b) - 1):
+        c = z_pz_pol.vd_len([x % p for x in prod[i*s:(i+1)*s]], p)
+        if len(c) > n:
+            c = z_pz_pol.div_pol(c,f,p)[1]
+        sol.append(c)
+
+    return(sol)
+
+
+def div_newton(a,b,p,f):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        Lista de listas que representa un polinomio no nulo del anillo Fq[x], 
+        sin ceros al final
+    b : LIST
+        Lista de listas que representa un polinomio del anillo Fq[x], con 
+        len(b) <= len(a)
+    p : INT
+        número primo >= 2
+    f : LIST
+        polinomio mónico, irreducible, de grado n >= 1, perteneciente 
+        al anillo (Z/pZ)[t]
+
+    Returns
+    -------
+    q y r, listas de listas que representan los polinomios del anillo Fq[x] 
+    tales que a = q*b + r, calculados con la iteración de Newton: si rev(c) es 
+    el polinomio c con los coeficientes en orden inverso, 
+    rev(q) = rev(a) * rev(b)^(-1) (mod x^(len(a)-len(b)+1))
+    '''
+    lq = len(a) - len(b) + 1
+    inv = inv_serie(b[::-1],lq,p,f)
+    rq = mult(a[::-1][:lq],inv,p,f)[:lq]
+    q = vd_len((rq + [f_q.cero(p,f) for i in range(lq - len(rq))])[::-1],p,f)
+
+    cq = f_q.contexto(p,f)
+    qb = mult(q,b,p,f)
+    r = [cq.suma(a[i],cq.inv_adit(qb[i])) for i in range(len(b)-1)]
+    return(q,vd_len(r,p,f))
+
+
+def inv_serie(a,k,p,f):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        Lista de listas que representa un polinomio del anillo Fq[x] con a[0] 
+        no nulo
+    k : INT
+        número entero >= 1
+    p : INT
+        número primo >= 2
+    f : LIST
+        polinomio mónico, irreducible, de grado n >= 1, perteneciente 
+        al anillo (Z/pZ)[t]
+
+    Returns
+    -------
+    Lista de listas que representa el polinomio g de grado < k tal que 
+    a*g = 1 (mod x^k), calculado con la iteración de Newton g = g*(2 - a*g), 
+    que duplica en cada paso la precisión
+    '''
+    cq = f_q.contexto(p,f)
+    dos = cq.suma(cq.uno,cq.uno)
+    g = [cq.inv_mult(a[0])]
+    prec = 1
+    while prec < k:
+        prec = min(2*prec,k)
+        e = [cq.inv_adit(c) for c in mult(a[:prec],g,p,f)[:prec]] # -a*g (mod x^prec)
+        e[0] = cq.suma(e[0],dos)
+        g = mult(g,vd_len(e,p,f),p,f)[:prec]
+
+    return(vd_len(g,p,f))
+
+
+def gcd_ext_hgcd(a,b,p,f):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        Lista de listas que representa un polinomio de grado arbitrario del
+        anillo Fq[x]
+    b : LIST
+        Lista de listas que representa un polinomio no nulo del anillo Fq[x]
+    p : INT
+        número primo >= 2
+    f : LIST
+        polinomio mónico, irreducible, de grado n >= 1, perteneciente 
+        al anillo (Z/pZ)[t]
+
+    Returns
+    -------
+    g,x,y listas de listas que representan a los polinomio del anillo Fq[x] 
+    tal que gcd(a,b) = g, con a*x + b*y = g, g no necesariamente mónico. Son 
+    los mismos que los de gcd_ext_no_mon, pero la sucesión de cocientes del 
+    algoritmo de Euclides se obtiene por bloques con hgcd
+    '''
+    q, r = div_pol(a,b,p,f) # primer paso, tras el que deg(r0) > deg(r1)
+    r0, r1 = b, r
+    M = (cero(p,f), uno(p,f), uno(p,f), inv_adit(q,p,f))
+    while r1 != cero(p,f):
+        H = hgcd(r0,r1,p,f)
+        r0, r1 = (suma(mult(H[0],r0,p,f),mult(H[1],r1,p,f),p,f), 
+                  suma(mult(H[2],r0,p,f),mult(H[3],r1,p,f),p,f))
+        M = mult_mat(H,M,p,f)
+        if r1 == cero(p,f):
+            break
+
+        q, r = div_pol(r0,r1,p,f)
+        r0, r1 = r1, r
+        M = (M[2], M[3], suma(M[0],inv_adit(mult(q,M[2],p,f),p,f),p,f), 
+             suma(M[1],inv_adit(mult(q,M[3],p,f),p,f),p,f))
+
+    return(cop_pol(r0,p,f),M[0],M[1])
+
+
+def hgcd(a,b,p,f):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        Lista de listas que representa un polinomio no nulo del anillo Fq[x]
+    b : LIST
+        Lista de listas que representa un polinomio del anillo Fq[x] con 
+        deg(b) < deg(a)
+    p : INT
+        número primo >= 2
+    f : LIST
+        polinomio mónico, irreducible, de grado n >= 1, perteneciente 
+        al anillo (Z/pZ)[t]
+
+    Returns
+    -------
+    Tupla (m00,m01,m10,m11) de polinomios del anillo Fq[x], producto de las 
+    matrices de los pasos del algoritmo de Euclides sobre a y b, tal que 
+    c = m00*a + m01*b y d = m10*a + m11*b son los dos restos consecutivos con 
+    deg(c) >= k > deg(d), k = ceil(deg(a)/2). Los cocientes se calculan de forma 
+    recursiva sobre las mitades superiores de a y b (algoritmo half-GCD), y por 
+    debajo de UMBRAL_HGCD coeficientes con el algoritmo de Euclides
+    '''
+    k = len(a) // 2 # ceil(deg(a)/2)
+    if len(a) < UMBRAL_HGCD: # pasos del algoritmo de Euclides hasta bajar de grado k
+        R = (uno(p,f), cero(p,f), cero(p,f), uno(p,f))
+        while len(b) - 1 >= k:
+            q, r = div_pol(a,b,p,f)
+            a, b = b, r
+            R = (R[2], R[3], suma(R[0],inv_adit(mult(q,R[2],p,f),p,f),p,f), 
+                 suma(R[1],inv_adit(mult(q,R[3],p,f),p,f),p,f))
+        return(R)
+
+    R = hgcd(a[k:],b[k:],p,f)
+    c, d = (suma(mult(R[0],a,p,f),mult(R[1],b,p,f),p,f), 
+            suma(mult(R[2],a,p,f),mult(R[3],b,p,f),p,f))
+    if len(d) - 1 < k:
+        return(R)
+
+    q, r = div_pol(c,d,p,f)
+    c, d = d, r
+    R = (R[2], R[3], suma(R[0],inv_adit(mult(q,R[2],p,f),p,f),p,f), 
+         suma(R[1],inv_adit(mult(q,R[3],p,f),p,f),p,f))
+    if len(d) - 1 < k:
+        return(R)
+
+    l = 2*k - (len(c) - 1)
+    S = hgcd(c[l:],d[l:],p,f)
+    return(mult_mat(S,R,p,f))
+
+
+def mult_mat(M,N,p,f):
+    '''
+    Parameters
+    ----------
+    M : TUPLE
+        matriz 2x2 (m00,m01,m10,m11) de polinomios del anillo Fq[x]
+    N : TUPLE
+        matriz 2x2 (n00,n01,n10,n11) de polinomios del anillo Fq[x]
+    p : INT
+        número primo >= 2
+    f : LIST
+        polinomio mónico, irreducible, de grado n >= 1, perteneciente 
+        al anillo (Z/pZ)[t]
+
+    Returns
+    -------
+    La matriz producto M*N, en el mismo formato
+    '''
+    return(suma(mult(M[0],N[0],p,f),mult(M[1],N[2],p,f),p,f),
+           suma(mult(M[0],N[1],p,f),mult(M[1],N[3],p,f),p,f),
+           suma(mult(M[2],N[0],p,f),mult(M[3],N[2],p,f),p,f),
+           suma(mult(M[2],N[1],p,f),mult(M[3],N[3],p,f),p,f))
@@ -4,18 +4,49 @@ Diana Gómez Moreno
 
 Contiene las siguientes funciones: 
     gen_ai(g,l,p,f,h)
+    gen_ai_potencias(g,l,p,f,h)
     mat_h(g,a,p,f,h)
-    mat_h_stan(g,a,p,f,h)
-    mat_g_can(g,a,p,f,h)
+    mat_h_stan(g,a,p,f,h,permutar=False)
+    mat_g_can(g,a,p,f,h,permutar=False)
     sindrome(r,a,g,p,f,h)
-    encode(m,G,p,f)
-    decode(r,a,g,k,p,f,h)
+    sindrome_mat(r,H,g,p,f,h)
+    encode(m,G,p,f,perm=None)
+    decode(r,a,g,k,p,f,h,raices='evaluacion',solver='euclides',H=None)
+    decode_patterson(r,a,g,k,p,f,h)
 
 Funciones auxiliares: 
+    forma_canonica(H,p,f,permutar=False)
+    mat_g_de_h(H,p,f)
+    suma_inversos(r,inv,t,p,f,h)
+    suma_inversos_bin(r,inv,t,h)
     gcd_truncado(a,b,k,p,f,h) 
+    sugiyama(a,b,k,p,f,h)
     copy_vec(v)
+    sindrome_bin(r,a,g,h)
+    sindrome_mat_bin(r,H,g,h,filas=None,imagen=None)
+    transformada_bin(g,h)
+    filas_bin(H)
+    inversos_sindrome(a,g,p,f,h)
+    inversos_sindrome_bin(a,g,h)
+    gcd_truncado_bin(a,b,k,h)
+    sugiyama_bin(a,b,k,h)
+
+Código de Goppa:
+    CodigoGoppa(g,a,p,f,h)
+
+Si q = 2 (p = 2 y f = [1,1]), sindrome y decode trabajan con la representación 
+binaria de f_2_m y f_2_m_pol, en la que los elementos de F2^m son enteros. Si 
+además hay al menos f_2_m_planos.UMBRAL_PLANOS ai's, decode evalúa los polinomios 
+en todos los ai a la vez, con los planos de bits de f_2_m_planos. Si Fq no tiene 
+tablas (f_q.tablas), mat_h_stan reduce H en su sitio como mat_f_q.MatrizFq si sus 
+coeficientes caben en un array de 64 bits (mat_f_q.cabe_en_array), y si 
+Fq = Z/pZ con p > 2 y NumPy está instalado, con arrays de NumPy (mat_f_q.usa_numpy).
+
+Las funciones de decodificación construyen un CodigoGoppa en cada llamada; para 
+trabajar varias veces con el mismo código, es mejor construirlo una vez y usar 
+sus métodos, que guardan H, G, los g(ai) y las demás tablas del código.
 """
-import f_q, mat_f_q, f_q_m, f_q_m_pol
+import f_q, mat_f_q, f_q_m, f_q_m_pol, f_q_m_tab, f_2_m, f_2_m_pol, f_2_m_planos
 
 def gen_ai(g,l,p,f,h):
     '''
@@ -42,28 +73,96 @@ def gen_ai(g,l,p,f,h):
     ai, una lista de l elementos, donde cada elemento es uno de los ai's mencionados 
     anteriormente. Así, es una lista de listas de listas
     '''  
-    ai = [0]*l
+    ai = []
+    cz = f_q_m.contexto(p,f,h)
+    cp = f_q_m_pol.contexto(p,f,h)
+    vistos = set() # candidatos ya generados: los ai y las raíces de g descartadas
     
-    j = 0
-    while j < l:
-        # Generamos un posible candidato para un nuevo ai:
-        ai[j] = f_q_m.rand_elem(p, f, h)
-        dif = True
-        
-        for k in range(j):
-            if ai[k] == ai[j]:
-                 dif = False 
+    while len(ai) < l:
+        # Generamos tantos candidatos nuevos como ai faltan, en el mismo orden en 
+        # que se irían generando uno a uno
+        cand = []
+        while len(cand) < l - len(ai):
+            x = f_q_m.rand_elem(p, f, h)
+            clave = tuple(tuple(c) for c in x)
+            if clave not in vistos: # debe ser diferente a los ya generados
+                vistos.add(clave)
+                cand.append(x)
 
-        if not dif:
-            continue
+        # Para añadirlo a la lista, debe no ser raíz de g
+        g_cand = cp.eval_pol_multi(g, cand)
+        ai += [cand[i] for i in range(len(cand)) if g_cand[i] != cz.cero]
 
-        # Para añadirlo a la lista, debe no ser raíz de g y ser diferente a los ai ya generados
-        no_raiz = (f_q_m_pol.eval_pol(g, ai[j], p, f, h) != f_q_m.cero(p, f, h))
+    return(ai)
+
+
+def gen_ai_potencias(g,l,p,f,h):
+    '''
+    Parameters
+    ----------
+    g : LIST
+        Lista de listas de listas que representa un polinomio de grado t con 
+        coeficientes en el cuerpo Fq^m
+    l : INT
+        Número de ai's que queremos generar, con cada ai un elemento del cuerpo Fq^m
+        tal que g(ai)/=0, y con todos los ai's distintos entre sí. 
+        l es la longitud de las palabras del código
+    p : INT
+        número primo >= 2
+    f : LIST
+        lista que representa un polinomio de grado n >= 1 irreducible, mónico, 
+        con coeficientes en el cuerpo Z/pZ
+    h : LIST
+        lista de listas que representa un polinomio de grado m >= 1 irreducible, 
+        mónico con coeficientes en el cuerpo Fq
+
+    Returns
+    -------
+    ai, una lista de l elementos como la de gen_ai, pero formada por potencias 
+    consecutivas alfa^j, ..., alfa^(j+l-1) de un elemento alfa de orden 
+    suficiente (el primero de s, y después de los elementos en el orden de 
+    f_q_m_tab.elem_de_indice, que lo sea), de modo que decode pueda buscar las 
+    raíces con la búsqueda de Chien (raices='chien'). Lanza ValueError si 
+    ningún alfa tiene l potencias consecutivas que no sean raíces de g
+    '''
+    cz = f_q_m.contexto(p,f,h)
+    cp = f_q_m_pol.contexto(p,f,h)
+    q = p ** ((len(f) - 1)*(len(h) - 1)) # número de elementos de Fq^m
+    
+    candidatos = [[f_q.cero(p,f), f_q.uno(p,f)]] if len(h) > 2 else []
+    c = 2 # los índices 0 y 1 son el cero y el uno
+    while l < q and (candidatos or c < q):
+        if candidatos:
+            alfa = candidatos.pop()
+        else:
+            alfa = f_q_m_tab.elem_de_indice(c, p, f, h)
+            c = c + 1
         
-        if no_raiz:
-            j = j + 1
+        # Recorremos alfa^0, alfa^1, ... por bloques, empezando de nuevo tras 
+        # cada raíz de g, hasta reunir l potencias seguidas o volver a alfa^0
+        ai = []
+        x = cz.uno
+        vuelta = False
+        while len(ai) < l and not vuelta:
+            cand = []
+            while len(cand) < l - len(ai):
+                cand.append(x)
+                x = cz.mult(x, alfa)
+                if x == cz.uno:
+                    vuelta = True
+                    break
 
-    return(ai)
+            g_cand = cp.eval_pol_multi(g, cand)
+            for i in range(len(cand)):
+                if g_cand[i] == cz.cero:
+                    ai = []
+                else:
+                    ai.append(cand[i])
+
+        if len(ai) == l:
+            return(ai)
+
+    raise ValueError('No hay ' + str(l) + ' potencias consecutivas que no sean raíces de g')
 
 
 def mat_h(g,a,p,f,h):
@@ -97,7 +196,7 @@ def mat_h(g,a,p,f,h):
     return(mat_f_q.mat_h(g,a,p,f,h))
 
 
-def mat_h_stan(g,a,p,f,h):
+def mat_h_stan(g,a,p,f,h,permutar=False):
     '''
     Parameters
     ----------
@@ -117,37 +216,403 @@ def mat_h_stan(g,a,p,f,h):
     h : LIST
         lista de listas que representa un polinomio de grado m >= 1 irreducible, 
         mónico con coeficientes en el cuerpo Fq
+    permutar : BOOL, opcional
+        si es True, se intercambian columnas cuando falta un pivote en lugar de 
+        lanzar ValueError
 
     Returns
     -------
     Lista de listas de listas que representa una matriz definida por filas,
     cuyos elementos pertenecen al cuerpo Fq.
     Es la forma canónica de la matriz de control de paridad del código de Goppa C 
-    definido con los elementos de 'a' y polinomio g
+    definido con los elementos de 'a' y polinomio g. Lanza ValueError si no es 
+    posible obtenerla sin intercambiar columnas.
+    Si permutar es True, devuelve también perm, la lista con el índice del ai 
+    que corresponde a cada columna: la matriz es la forma canónica, sin filas 
+    nulas, del código definido con los ai's en el orden [a[i] for i in perm]
+    '''
+    if f_2_m.es_binario(p,f): # sin pasar por las listas de elementos de F2
+        return(forma_canonica(mat_f_q.mat_h(g,a,p,f,h,True),p,f,permutar))
+    if (f_q.tablas(p,f) is None and not mat_f_q.usa_numpy(p,f) and 
+        mat_f_q.cabe_en_array(p)): # sin tablas, sobre el array de una MatrizFq
+        return(forma_canonica(mat_f_q.mat_h(g,a,p,f,h,plana=True),p,f,permutar))
+    return(forma_canonica(mat_h(g,a,p,f,h),p,f,permutar))
+
+
+def mat_g_can(g,a,p,f,h,permutar=False):
+    '''
+    Parameters
+    ----------
+    g : LIST
+        Lista de listas de listas que representa un polinomio de grado t con 
+        coeficientes en el cuerpo Fq^m
+    a : LIST
+        lista de listas de listas, donde cada elemento de la lista principal
+        es un elemento de Fq^m.
+        concretamente, son cada uno de los 'l' ai's necesarios para definir 
+        el código de Goppa C
+    p : INT
+        número primo >= 2
+    f : LIST
+        polinomio de grado n >= 1 irreducible, mónico, con coeficientes en
+        el cuerpo Z/pZ
+    h : LIST
+        lista de listas que representa un polinomio de grado m >= 1 irreducible, 
+        mónico con coeficientes en el cuerpo Fq
+    permutar : BOOL, opcional
+        si es True, se intercambian columnas de la matriz de control de paridad 
+        cuando falta un pivote (véase mat_h_stan)
+
+    Returns
+    -------
+    Lista de listas de listas que representa una matriz, definida por filas,
+    cuyos elementos pertenecen al cuerpo Fq.
+    Es la forma canónica de la matriz generadora del código de Goppa C 
+    definido con los elementos de 'a' y polinomio g.
+    Si permutar es True, devuelve también perm, como mat_h_stan: la matriz es 
+    la del código definido con los ai's en el orden [a[i] for i in perm], y 
+    encode con perm da las palabras en el orden de a
     '''
-    H = mat_h(g,a,p,f,h)
+    if permutar:
+        H, perm = mat_h_stan(g,a,p,f,h,True)
+        return(mat_g_de_h(H,p,f),perm)
+    return(mat_g_de_h(mat_h_stan(g,a,p,f,h),p,f))
 
-    m = len(h) - 1 # grado de h
-    t = len(g) - 1 # grado de g
-    l = len(a) # número de ai's
+
+def sindrome(r,a,g,p,f,h):
+    '''
+    Parameters
+    ----------
+    r : LIST
+        Vector columna de tamaño l de elementos del cuerpo Fq que representa una palabra
+        recibida. Es, por tanto, una lista de listas. 
+    a : LIST
+        lista de listas de listas, donde cada elemento de la lista principal
+        es un elemento de Fq^m.
+        concretamente, son cada uno de los 'l' ai's necesarios para definir 
+        el código de Goppa C
+    g : LIST
+        Lista de listas de listas que representa un polinomio de grado t con 
+        coeficientes en el cuerpo Fq^m
+    p : INT
+        número primo >= 2
+    f : LIST
+        polinomio de grado n >= 1 irreducible, mónico, con coeficientes en
+        el cuerpo Z/pZ
+    h : LIST
+        lista de listas que representa un polinomio de grado m >= 1 irreducible, 
+        mónico con coeficientes en el cuerpo Fq
+
+    Returns
+    -------
+    sind, una lista de listas de listas que representa el polinomio con coeficientes en
+    el cuerpo Fq^m conocido como síndrome
+    '''
+    if f_2_m.es_binario(p,f):
+        ab = [f_2_m.elem_a_int(ai) for ai in a]
+        sind = sindrome_bin(r, ab, f_2_m_pol.a_int(g), f_2_m.elem_a_int(h))
+        return(f_2_m_pol.de_int(sind))
+    
+    inv = inversos_sindrome(a,g,p,f,h) # (x - ai)^(-1) mod g(x); CodigoGoppa los guarda
+    return(suma_inversos(r,inv,len(g) - 1,p,f,h))
+
+
+def sindrome_mat(r,H,g,p,f,h):
+    '''
+    Parameters
+    ----------
+    r : LIST
+        Vector columna de tamaño l de elementos del cuerpo Fq que representa una palabra
+        recibida. Es, por tanto, una lista de listas. 
+    H : LIST
+        matriz de control de paridad de dimensión mtxl sobre Fq, la de mat_h
+    g : LIST
+        Lista de listas de listas que representa un polinomio de grado t con 
+        coeficientes en el cuerpo Fq^m
+    p : INT
+        número primo >= 2
+    f : LIST
+        polinomio de grado n >= 1 irreducible, mónico, con coeficientes en
+        el cuerpo Z/pZ
+    h : LIST
+        lista de listas que representa un polinomio de grado m >= 1 irreducible, 
+        mónico con coeficientes en el cuerpo Fq
+
+    Returns
+    -------
+    El mismo síndrome que sindrome, calculado a partir de H*r. Las filas i*m + k 
+    de H*r son los coeficientes de s_i = sumatorio en j de rj * aj^i / g(aj), y 
+    como (g(x) - g(a))/(x - a) = sumatorio en i y j de g_(i+j+1) * x^i * a^j, 
+    el coeficiente de x^i del síndrome es -sumatorio en j de g_(i+j+1) * s_j. 
+    Si H*r = 0, se devuelve el síndrome nulo sin ninguna operación en Fq^m[x]. 
+    Si q = 2, se calcula con sindrome_mat_bin
+    '''
+    if f_2_m.es_binario(p,f):
+        sind = sindrome_mat_bin(r, H, f_2_m_pol.a_int(g), f_2_m.elem_a_int(h))
+        return(f_2_m_pol.de_int(sind))
+    
+    cq = f_q.contexto(p,f)
+    m = len(h) - 1
+    t = len(g) - 1
+    pos = [j for j in range(len(r)) if r[j] != cq.cero]
+    Hr = [cq.cero]*len(H)
+    for i in range(len(H)):
+        for j in pos:
+            Hr[i] = cq.suma(Hr[i], cq.mult(H[i][j], r[j]))
     
+    if all(c == cq.cero for c in Hr): # r pertenece al código
+        return(f_q_m_pol.cero(p, f, h))
+    
+    cz = f_q_m.contexto(p,f,h)
+    cp = f_q_m_pol.contexto(p,f,h)
+    s = []
+    for i in range(t): # s_i como elemento de Fq^m
+        si = Hr[i*m:(i+1)*m]
+        while si != [] and si[-1] == cq.cero:
+            si.pop()
+        s.append(si)
+    
+    sind = [cz.cero]*t
+    for i in range(t):
+        for j in range(t - i):
+            sind[i] = cz.suma(sind[i], cz.mult(g[i+j+1], s[j]))
+        sind[i] = cz.inv_adit(sind[i])
+    
+    return(cp.vd_len(sind))
+
+
+def encode(m,G,p,f,perm=None):
+    '''
+    Parameters
+    ----------
+    m : LIST
+        Vector columna de tamaño k de elementos del cuerpo Fq que representa un mensaje
+        que se quiere transmitir
+    G : LIST
+        Lista de listas de listas que representa una matriz, definida por filas,
+        cuyos elementos pertenecen al cuerpo Fq. Es una matriz generadora de un 
+        código de Goppa C
+    p : INT
+        número primo >= 2
+    f : LIST
+        polinomio de grado n >= 1 irreducible, mónico, con coeficientes en
+        el cuerpo Z/pZ
+    perm : LIST, opcional
+        permutación de las columnas que devuelve mat_g_can con permutar=True
+
+    Returns
+    -------
+    r, vector columna de tamaño l de elementos del cuerpo Fq que representa la palabra
+    m codificada para pertenecer al código de Goppa C de matriz generadora G. 
+    Si se da perm, la coordenada i de G*m se coloca en la posición perm[i], 
+    de modo que r está en el orden de los ai's originales
+    '''
+    m_mat = mat_f_q.vect_a_mat(m)
+    m1 = mat_f_q.mult_mat(G,m_mat,p,f)
+    r = mat_f_q.mat_a_vect(m1)
+    if perm is not None:
+        r_perm = [0]*len(r)
+        for i in range(len(r)):
+            r_perm[perm[i]] = r[i]
+        r = r_perm
+    return(r)
+
+
+def decode(r,a,g,k,p,f,h,raices='evaluacion',solver='euclides',H=None):
+    '''
+    Parameters
+    ----------
+    r : LIST
+        Vector columna de tamaño l de elementos del cuerpo Fq que representa una palabra
+        recibida. Esta puede pertenecer al código o no. 
+    a : LIST
+        lista de listas de listas, donde cada elemento de la lista principal
+        es un elemento de Fq^m.
+        concretamente, son cada uno de los 'l' ai's necesarios para definir 
+        el código de Goppa C
+    g : LIST
+        Lista de listas de listas que representa un polinomio de grado k con 
+        coeficientes en el cuerpo Fq^m
+    k : INT
+        obsoleto: se ignora, pues el grado de g se toma de la propia g. Se 
+        mantiene para no cambiar la forma de llamar a la función
+    p : INT
+        número primo >= 2
+    f : LIST
+        polinomio de grado n >= 1 irreducible, mónico, con coeficientes en
+        el cuerpo Z/pZ
+    h : LIST
+        lista de listas que representa un polinomio de grado m >= 1 irreducible, 
+        mónico con coeficientes en el cuerpo Fq
+    raices : STR, opcional
+        método para encontrar las posiciones con error, los ai que son raíces del 
+        polinomio localizador o(x). Con 'evaluacion' (por defecto), se evalúa o(x)
+        en cada ai (f_q_m_pol.eval_pol_multi, o f_2_m_planos.eval_pol si q = 2); 
+        con 'fft', se evalúa o(x) en todo el cuerpo Fq^m de una vez con la FFT aditiva (f_q_m_pol.eval_fft), que 
+        solo es posible si p = 2 y compensa cuando los ai son casi todo el cuerpo; 
+        con 'factorizacion', se calculan las raíces de o(x) (f_q_m_pol.raices) y se 
+        buscan en un diccionario de posiciones de los ai, sin evaluar o(x) en 
+        ninguno de ellos; con 'chien', se evalúa o(x) en los ai con la búsqueda de 
+        Chien (f_q_m_pol.busqueda_chien), que exige que los ai sean potencias 
+        consecutivas de un mismo elemento (véase gen_ai_potencias) y se detiene 
+        al encontrar deg(o) raíces
+    solver : STR, opcional
+        método para resolver la ecuación clave, es decir, obtener el localizador 
+        o(x) y el evaluador n(x) a partir del síndrome. Con 'euclides' (por 
+        defecto), gcd_truncado; con 'sugiyama', el algoritmo de Sugiyama, que 
+        hace los mismos pasos de Euclides restando en su sitio (sugiyama)
+    H : LIST, opcional
+        matriz de control de paridad sobre Fq del código, la de mat_h. Si se da, 
+        el síndrome se calcula como H*r (sindrome_mat), y si es nulo se devuelve 
+        r sin más operaciones
+
+    Returns
+    -------
+    c y e, listas de listas que representan vectores columna cuyos elementos pertenecen
+    al cuerpo Fq, con c la palabra corregida del código C y e el error. Se 
+    calculan con el método decode de un CodigoGoppa nuevo, así que para 
+    decodificar varias palabras del mismo código es mejor construirlo una vez 
+    y llamar a su método decode
+    '''
+    codigo = CodigoGoppa(g,a,p,f,h)
+    if H is not None:
+        codigo.hq = H
+    return(codigo.decode(r,raices,solver,H is not None))
+
+
+def decode_patterson(r,a,g,k,p,f,h):
+    '''
+    Parameters
+    ----------
+    r : LIST
+        Vector columna de tamaño l de elementos del cuerpo F2 que representa una 
+        palabra recibida (cada elemento es [] o [1]). Esta puede pertenecer al 
+        código o no. 
+    a : LIST
+        lista de listas de listas, donde cada elemento de la lista principal
+        es un elemento de F2^m.
+        concretamente, son cada uno de los 'l' ai's necesarios para definir 
+        el código de Goppa C
+    g : LIST
+        Lista de listas de listas que representa un polinomio de grado k, libre 
+        de cuadrados, con coeficientes en el cuerpo F2^m
+    k : INT
+        obsoleto: se ignora, como en decode
+    p : INT
+        número primo, que debe ser 2
+    f : LIST
+        polinomio que debe ser [1,1], de modo que Fq = F2
+    h : LIST
+        lista de listas que representa un polinomio de grado m >= 1 irreducible, 
+        mónico con coeficientes en el cuerpo F2
+
+    Returns
+    -------
+    c y e, como en decode, pero calculados con el algoritmo de Patterson, que 
+    corrige hasta k errores en lugar de k/2: con T = S^(-1) (mod g), S el 
+    síndrome, se toma tau = sqrt(T + x) (mod g) (f_2_m_pol.raiz_mod), se buscan 
+    alfa = beta*tau (mod g) con deg(alfa) <= k/2 y deg(beta) <= (k-1)/2 con el 
+    algoritmo de Euclides, y los errores están en los ai que son raíces de 
+    o(x) = alfa^2 + x*beta^2. Si S no es invertible módulo g (g reducible), se 
+    recurre a decode. Lanza ValueError si el código no es binario
+    '''
+    return(CodigoGoppa(g,a,p,f,h).decode_patterson(r))
+
+
+#  Funciones auxiliares:
+def forma_canonica(H,p,f,permutar=False):
+    '''
+    Parameters
+    ----------
+    H : LIST
+        Lista de listas de listas que representa una matriz definida por filas, 
+        cuyos elementos pertenecen al cuerpo Fq, o mat_f_q.MatrizBinaria si 
+        Fq = F2, o mat_f_q.MatrizFq. Se modifica si es una lista o una MatrizFq
+    p : INT
+        número primo >= 2
+    f : LIST
+        polinomio de grado n >= 1 irreducible, mónico, con coeficientes en
+        el cuerpo Z/pZ
+    permutar : BOOL, opcional
+        si es True, se permite intercambiar columnas cuando falta un pivote
+
+    Returns
+    -------
+    Lista de listas de listas que representa la forma canónica de la matriz H, 
+    obtenida por reducción de Gauss-Jordan con intercambio de filas pero no de 
+    columnas (véase mat_h_stan). Lanza ValueError si no es posible. 
+    Si permutar es True, devuelve la forma canónica [Id | A] de H con las 
+    columnas permutadas y sin filas nulas, y la lista perm con la columna de H 
+    que ocupa cada posición, y nunca lanza ValueError
+    '''
+    n_f = len(H) # número de filas de H
+    l = len(H[0]) # número de columnas de H
+    perm = list(range(l)) if permutar else None
+    
+    if isinstance(H, mat_f_q.MatrizFq): # reducción de Gauss-Jordan en su sitio, sobre el array
+        r = H.gauss(min(n_f,l),perm)
+        if permutar: # las filas a partir de la r son nulas
+            return(H.primeras_filas(r).a_lista(),perm)
+        for i in range(r,n_f): # si falta algún pivote, las filas restantes deben ser nulas
+            if any(H.vista_fila(i)):
+                raise ValueError('No es posible calcular H en forma canónica sin intercambiar columnas')
+        return(H.a_lista())
+    
+    if mat_f_q.usa_numpy(p,f): # Z/pZ, eliminando con filas enteras de NumPy
+        H_np = mat_f_q.mat_a_np(H)
+        r = mat_f_q.gauss_np(H_np,min(n_f,l),p,perm)
+        if permutar: # las filas a partir de la r son nulas
+            return(mat_f_q.mat_de_np(H_np[:r]),perm)
+        if H_np[r:].any(): # si falta algún pivote, las filas restantes deben ser nulas
+            raise ValueError('No es posible calcular H en forma canónica sin intercambiar columnas')
+        return(mat_f_q.mat_de_np(H_np))
+    
+    if f_2_m.es_binario(p,f): # filas como enteros, por el método de los cuatro rusos
+        if isinstance(H, mat_f_q.MatrizBinaria):
+            H_b = H.filas + []
+        else:
+            H_b = mat_f_q.mat_a_bits(H)
+        r = mat_f_q.gauss_m4ri(H_b,min(n_f,l),perm)
+        if permutar: # las filas a partir de la r son nulas
+            return(mat_f_q.mat_de_bits(H_b[:r],l),perm)
+        if any(H_b[r:]): # si falta algún pivote, las filas restantes deben ser nulas
+            raise ValueError('No es posible calcular H en forma canónica sin intercambiar columnas')
+        return(mat_f_q.mat_de_bits(H_b,l))
+    
+    T = f_q.tablas(p,f)
+    if T is not None: # reducción de Gauss-Jordan sobre los índices de las tablas de Fq
+        H_i = mat_f_q.mat_a_ind(H,T)
+        if permutar: # las filas a partir de la r son nulas
+            r = mat_f_q.gauss_ind(H_i,min(n_f,l),T,perm)
+            return(mat_f_q.mat_de_ind(H_i[:r],T),perm)
+        r = mat_f_q.gauss_ind(H_i,n_f,T)
+        for i in range(r,n_f): # si falta algún pivote, las filas restantes deben ser nulas
+            if any(H_i[i]):
+                raise ValueError('No es posible calcular H en forma canónica sin intercambiar columnas')
+        return(mat_f_q.mat_de_ind(H_i,T))
+    
+    cq = f_q.contexto(p,f)
     fi = 0 # contador de la fila de H en la que estamos
     continuar = True # valdrá False cuando tengamos H en su forma escalonada reducida
     
     while continuar: 
-        if fi >= m*t: # el caso en que tiene rango máximo de entre los posibles
+        if fi >= n_f: # el caso en que tiene rango máximo de entre los posibles
             continuar = False
             fi = fi - 1
             
-        elif H[fi][fi] == f_q.cero(p, f): # el elemento (fi,fi) de la diagonal es el cero del cuerpo f_q    
+        elif permutar and fi >= l: # todas las columnas tienen pivote y las filas restantes son nulas
+            del H[fi:]
+            continuar = False
+            
+        elif H[fi][fi] == cq.cero: # el elemento (fi,fi) de la diagonal es el cero del cuerpo f_q    
                                         
             # Vemos con un bucle si algún elemento de esa columna es dinstinto de cero, pues permitiremos intercambio de filas
             # para hacer la reducción gaussiana
             
             change = False # nos indicará si hay que hacer intercambio de filas
             r = fi + 1 
-            while (r<m*t and (not change)):
-                if H[r][fi] != f_q.cero(p,f):
+            while (r<n_f and (not change)):
+                if H[r][fi] != cq.cero:
                     change = True
                 else:
                     r = r + 1
@@ -164,32 +629,46 @@ def mat_h_stan(g,a,p,f,h):
                 # es la antigua fila r, en la siguiente vuelta del bucle
                 fi = fi - 1
 
+            elif permutar: # buscamos una de las siguientes columnas con algún elemento no nulo a partir de la fila fi
+                c = fi + 1
+                while c < l and all(H[i][c] == cq.cero for i in range(fi,n_f)):
+                    c = c + 1
+                
+                if c < l: # intercambiamos las columnas fi y c, y repetimos la fila fi
+                    for fila in H:
+                        fila[fi], fila[c] = fila[c], fila[fi]
+                    perm[fi], perm[c] = perm[c], perm[fi]
+                    fi = fi - 1
+                else: # las filas a partir de la fi son nulas
+                    del H[fi:]
+                    continuar = False
+
             else: # No podemos continuar con la reducción gaussiana; veamos si hemos acabado o si tocaría intercambiar columnas
                   # cosa que no haremos, parando aquí el proceso
-                for i in range(fi,m*t): # empezando en la propia fila fi
+                for i in range(fi,n_f): # empezando en la propia fila fi
                     for j in range(fi+1,l): # las siguientes columnas
-                        if H[i][j] != f_q.cero(p, f):
+                        if H[i][j] != cq.cero:
                             raise ValueError('No es posible calcular H en forma canónica sin intercambiar columnas')
                         
                 
                 continuar = False # la matriz está en forma triangular y salimos de este primer bucle
 
         else: 
-            inv1 = f_q.inv_mult(H[fi][fi], p, f)
+            inv1 = cq.inv_mult(H[fi][fi])
             
             for i in range(fi,l): # multiplicamos la fila fi por el inverso del elemento H[fi][fi] para que su primer elemento sea = f_q.uno()
-                H[fi][i] = f_q.mult(H[fi][i], inv1, p, f)
+                H[fi][i] = cq.mult(H[fi][i], inv1)
             
                 
             
-            for i in range(fi+1,m*t): # eliminamos todos los elementos en la columna fi mediante resta de filas
+            for i in range(fi+1,n_f): # eliminamos todos los elementos en la columna fi mediante resta de filas
                 
-                if H[i][fi] != f_q.cero(p, f):
+                if H[i][fi] != cq.cero:
                     
                     for j in range(l-1,fi-1,-1):
-                        mult = f_q.mult(H[fi][j], H[i][fi], p, f)
-                        inv_adit = f_q.inv_adit(mult, p, f)
-                        H[i][j] = f_q.suma(H[i][j], inv_adit, p, f)
+                        mult = cq.mult(H[fi][j], H[i][fi])
+                        inv_adit = cq.inv_adit(mult)
+                        H[i][j] = cq.suma(H[i][j], inv_adit)
                 
         
         # Seguimos con la reducción gaussiana
@@ -199,44 +678,34 @@ def mat_h_stan(g,a,p,f,h):
         i = len(H)-1-ix  
         for j in range(i): # todas las filas a las que les deberemos restar la fila i
             for k in range(l-1,i-1,-1):
-                mult = f_q.mult(H[i][k],H[j][i], p, f)
-                inv_adit = f_q.inv_adit(mult, p, f)
-                H[j][k] = f_q.suma(H[j][k], inv_adit, p, f) 
+                mult = cq.mult(H[i][k],H[j][i])
+                inv_adit = cq.inv_adit(mult)
+                H[j][k] = cq.suma(H[j][k], inv_adit) 
            
+    if permutar:
+        return(H,perm)
     return H
 
 
-def mat_g_can(g,a,p,f,h):
+def mat_g_de_h(H,p,f):
     '''
     Parameters
     ----------
-    g : LIST
-        Lista de listas de listas que representa un polinomio de grado t con 
-        coeficientes en el cuerpo Fq^m
-    a : LIST
-        lista de listas de listas, donde cada elemento de la lista principal
-        es un elemento de Fq^m.
-        concretamente, son cada uno de los 'l' ai's necesarios para definir 
-        el código de Goppa C
+    H : LIST
+        Lista de listas de listas que representa una matriz de control de paridad 
+        en forma canónica, definida por filas, cuyos elementos pertenecen al cuerpo Fq
     p : INT
         número primo >= 2
     f : LIST
         polinomio de grado n >= 1 irreducible, mónico, con coeficientes en
         el cuerpo Z/pZ
-    h : LIST
-        lista de listas que representa un polinomio de grado m >= 1 irreducible, 
-        mónico con coeficientes en el cuerpo Fq
 
     Returns
     -------
-    Lista de listas de listas que representa una matriz, definida por filas,
-    cuyos elementos pertenecen al cuerpo Fq.
-    Es la forma canónica de la matriz generadora del código de Goppa C 
-    definido con los elementos de 'a' y polinomio g
+    Lista de listas de listas que representa la forma canónica de la matriz 
+    generadora del código de matriz de control de paridad H (véase mat_g_can)
     '''
-    H = mat_h_stan(g,a,p,f,h)
-    
-    l = len(a) # número de ai's = número de filas de G
+    l = len(H[0]) # número de columnas de H = número de filas de G
     l_k = len(H) # número de filas de H = número de columnas de G
     k = l - l_k # número de columnas de G
     
@@ -259,21 +728,17 @@ def mat_g_can(g,a,p,f,h):
     return(G)
 
 
-def sindrome(r,a,g,p,f,h):
+def suma_inversos(r,inv,t,p,f,h):
     '''
     Parameters
     ----------
     r : LIST
         Vector columna de tamaño l de elementos del cuerpo Fq que representa una palabra
-        recibida. Es, por tanto, una lista de listas. 
-    a : LIST
-        lista de listas de listas, donde cada elemento de la lista principal
-        es un elemento de Fq^m.
-        concretamente, son cada uno de los 'l' ai's necesarios para definir 
-        el código de Goppa C
-    g : LIST
-        Lista de listas de listas que representa un polinomio de grado t con 
-        coeficientes en el cuerpo Fq^m
+        recibida
+    inv : LIST
+        los l polinomios (x - ai)^(-1) mod g(x) de inversos_sindrome
+    t : INT
+        grado del polinomio g
     p : INT
         número primo >= 2
     f : LIST
@@ -285,68 +750,68 @@ def sindrome(r,a,g,p,f,h):
 
     Returns
     -------
-    sind, una lista de listas de listas que representa el polinomio con coeficientes en
-    el cuerpo Fq^m conocido como síndrome
+    El síndrome de r, la suma de los ri * (x - ai)^(-1) mod g(x)
     '''
-    sind = f_q_m_pol.cero(p, f, h)
+    cz = f_q_m.contexto(p,f,h)
+    cp = f_q_m_pol.contexto(p,f,h)
+    cq = f_q.contexto(p,f)
+    sind = [cz.cero]*t
     
-    for i in range(len(a)):
-        ri = [r[i]] # ri como elemento de Fq^m, para poder hacer las operaciones pertinentes
-        pol_ai = [f_q_m.inv_adit(a[i],p,f,h) , f_q_m.uno(p, f, h)] # x - ai
-        inv_i = f_q_m_pol.gcd_ext(pol_ai, g, p, f, h)[1] # inverso módulo g(x) de x - ai
-        mult_i = f_q_m_pol.mult([ri], inv_i, p, f, h) # ri / (x - ai); hay que tratar ri 
-                                                      # como polinomio de grado 0 de Fq^m[x]
-        sumando = f_q_m_pol.div_pol(mult_i, g, p, f, h)[1] # (ri / (x - ai)) mod (g(x))
-        sind = f_q_m_pol.suma(sind, sumando, p, f, h)
+    for i in range(len(inv)):
+        ri = r[i]
+        if ri != cq.cero: # solo contribuyen ri != 0
+            v = inv[i]
+            if ri == cq.uno:
+                for j in range(len(v)):
+                    sind[j] = cz.suma(sind[j], v[j])
+            else: # ri está en Fq: se multiplica cada coeficiente de Fq^m componente a componente
+                for j in range(len(v)):
+                    sind[j] = cz.suma(sind[j], [cq.mult(ri, c) for c in v[j]])
 
-    return(sind)
+    return(cp.vd_len(sind))
 
 
-def encode(m,G,p,f):
+def suma_inversos_bin(r,inv,t,h):
     '''
     Parameters
     ----------
-    m : LIST
-        Vector columna de tamaño k de elementos del cuerpo Fq que representa un mensaje
-        que se quiere transmitir
-    G : LIST
-        Lista de listas de listas que representa una matriz, definida por filas,
-        cuyos elementos pertenecen al cuerpo Fq. Es una matriz generadora de un 
-        código de Goppa C
-    p : INT
-        número primo >= 2
-    f : LIST
-        polinomio de grado n >= 1 irreducible, mónico, con coeficientes en
-        el cuerpo Z/pZ
+    r : LIST
+        Vector columna de tamaño l de elementos del cuerpo F2 que representa una palabra
+        recibida (cada elemento es [] o [1])
+    inv : LIST
+        los l enteros de inversos_sindrome_bin
+    t : INT
+        grado del polinomio g
+    h : INT
+        entero que representa el polinomio irreducible que define F2^m
 
     Returns
     -------
-    r, vector columna de tamaño l de elementos del cuerpo Fq que representa la palabra
-    m codificada para pertenecer al código de Goppa C de matriz generadora G
+    Lista de enteros que representa el síndrome de r, el XOR de los inv[i] con 
+    ri = 1 separado en sus t coeficientes
     '''
-    m_mat = mat_f_q.vect_a_mat(m)
-    m1 = mat_f_q.mult_mat(G,m_mat,p,f)
-    r = mat_f_q.mat_a_vect(m1)
-    return(r)
+    s = 0
+    for i in range(len(inv)):
+        if r[i] and r[i][0]:
+            s ^= inv[i]
+    
+    m = h.bit_length() - 1
+    mascara = (1 << m) - 1
+    return(f_2_m_pol.vd_len([(s >> (j*m)) & mascara for j in range(t)]))
 
 
-def decode(r,a,g,k,p,f,h):
+def gcd_truncado(a,b,k,p,f,h):
     '''
     Parameters
     ----------
-    r : LIST
-        Vector columna de tamaño l de elementos del cuerpo Fq que representa una palabra
-        recibida. Esta puede pertenecer al código o no. 
     a : LIST
-        lista de listas de listas, donde cada elemento de la lista principal
-        es un elemento de Fq^m.
-        concretamente, son cada uno de los 'l' ai's necesarios para definir 
-        el código de Goppa C
-    g : LIST
-        Lista de listas de listas que representa un polinomio de grado k con 
-        coeficientes en el cuerpo Fq^m
+        lista de listas de listas que representa un polinomio del anillo Fq^m[x]
+        mónico irreducible de grado k
+    b : LIST
+        lista de listas de listas que representa un polinomio del anillo Fq^m[x]
+        de grado < k, congruente mod(a(x)) con sumatorio en i de ri/(x-alpha_i)
     k : INT
-        Grado del polinomio g
+        Grado del polinomio a
     p : INT
         número primo >= 2
     f : LIST
@@ -358,43 +823,43 @@ def decode(r,a,g,k,p,f,h):
 
     Returns
     -------
-    c y e, listas de listas que representan vectores columna cuyos elementos pertenecen
-    al cuerpo Fq, con c la palabra corregida del código C y e el error
+    g1 y t1, polinomios con coeficientes en el cuerpo Fq^m que permitirán, mediante 
+    el Algoritmo de Decodificación, determinar el vector de error y así recuperar el mensaje original
     '''
-    l = len(r)
-    e = [f_q.cero(p, f)] * l # donde guardaremos el vector error
-    sind = sindrome(r,a,g,p,f,h) # síndrome de r
+    cp = f_q_m_pol.contexto(p,f,h)
+    s0 = f_q_m_pol.uno(p, f, h)
+    t0 = f_q_m_pol.cero(p, f, h)
+    g0 = cp.cop_pol(a)
     
-    if sind != f_q_m_pol.cero(p, f, h): # la palabra recibida no pertenece al código
-        c = [f_q.cero(p, f)] * l; # donde guardaremos la palabra que sí pertenece al código
-        
-        n,o = gcd_truncado(g,sind,k,p,f,h) # los polinomios necesarios para 
-                                           # el algoritmo de decodificación
-        od = f_q_m_pol.deriv(o, p, f, h) # o'(x)
+    s1 = f_q_m_pol.cero(p, f, h)
+    t1 = f_q_m_pol.uno(p, f, h)
+    g1 = cp.cop_pol(b)
+    
+    while (len(g1) - 1) >= (k/2):
+        s1_c = cp.cop_pol(s1)
+        t1_c = cp.cop_pol(t1)
+        g1_c = cp.cop_pol(g1)
         
-        for i in range(l): # obtenemos los términos de error
-            
-            if f_q_m_pol.eval_pol(o, a[i], p, f, h) == f_q_m.cero(p, f, h): # en el término i hay un error
-                na = f_q_m_pol.eval_pol(n, a[i], p, f, h) # n(ai)
-                oda = f_q_m_pol.eval_pol(od, a[i], p, f, h) # o'(ai)
-                oda_inv = f_q_m.inv_mult(oda, p, f, h) # inverso multiplicativo de o'(ai)
-                
-                ei = f_q_m.mult(na, oda_inv, p, f, h)
-                e[i] = ei[0]
-
-        for i in range(l): # c = r - e
-            c[i] = f_q.suma(r[i],f_q.inv_adit(e[i], p, f), p, f)
+        # calculamos los nuevos g1, s1 y t1
+        q,g1 = cp.div_pol(g0, g1)
+        s1 = cp.suma(s0,  cp.inv_adit(cp.mult(q, s1)))
+        t1 = cp.suma(t0,  cp.inv_adit(cp.mult(q, t1)))
         
-        return(c,e)
-    
+        # asignamos los nuevos valores a los g0, s0 y t0
+        g0 = g1_c
+        t0 = t1_c
+        s0 = s1_c
     
-    else: # la palabra recibida pertenece al código
-        c = copy_vec(r)
-        return(c,e)
+    # nos aseguramos de que sean coprimos
+    gcd = cp.gcd(t1, g1)    
+    if gcd != cp.uno:
+        t1 = cp.div_pol(t1, gcd)[0]
+        g1 = cp.div_pol(g1, gcd)[0]
+        
+    return(g1,t1)
 
 
-#  Funciones auxiliares:
-def gcd_truncado(a,b,k,p,f,h):
+def sugiyama(a,b,k,p,f,h):
     '''
     Parameters
     ----------
@@ -417,38 +882,37 @@ def gcd_truncado(a,b,k,p,f,h):
 
     Returns
     -------
-    g1 y t1, polinomios con coeficientes en el cuerpo Fq^m que permitirán, mediante 
-    el Algoritmo de Decodificación, determinar el vector de error y así recuperar el mensaje original
+    g1 y t1, los mismos polinomios que gcd_truncado, calculados con el algoritmo 
+    de Sugiyama: cada división de Euclides se hace restando c * x^d * g1 a g0 (y 
+    c * x^d * t1 a t0) en su sitio, término a término, sin calcular el cociente 
+    ni copiar los polinomios, con O(k^2) operaciones en Fq^m. No se comprueba al 
+    final que g1 y t1 sean coprimos, lo que ocurre siempre que el número de 
+    errores es corregible
     '''
-    s0 = f_q_m_pol.uno(p, f, h)
-    t0 = f_q_m_pol.cero(p, f, h)
-    g0 = f_q_m_pol.cop_pol(a, p, f, h)
-    
-    s1 = f_q_m_pol.cero(p, f, h)
-    t1 = f_q_m_pol.uno(p, f, h)
-    g1 = f_q_m_pol.cop_pol(b, p, f, h)
+    cz = f_q_m.contexto(p,f,h)
+    g0, g1 = a + [], b + [] # se trabaja sobre copias, que se modifican
+    t0, t1 = [], [cz.uno] # g_i = t_i * b (mod a)
     
     while (len(g1) - 1) >= (k/2):
-        s1_c = f_q_m_pol.cop_pol(s1, p, f, h)
-        t1_c = f_q_m_pol.cop_pol(t1, p, f, h)
-        g1_c = f_q_m_pol.cop_pol(g1, p, f, h)
-        
-        # calculamos los nuevos g1, s1 y t1
-        q,g1 = f_q_m_pol.div_pol(g0, g1, p, f, h)
-        s1 = f_q_m_pol.suma(s0,  f_q_m_pol.inv_adit(f_q_m_pol.mult(q, s1, p, f, h), p, f, h), p, f, h)
-        t1 = f_q_m_pol.suma(t0,  f_q_m_pol.inv_adit(f_q_m_pol.mult(q, t1, p, f, h), p, f, h), p, f, h)
+        lc_inv = cz.inv_mult(g1[-1])
+        while len(g0) >= len(g1):
+            d = len(g0) - len(g1)
+            c = cz.inv_adit(cz.mult(g0[-1], lc_inv)) # anula el término principal de g0
+            g0.pop()
+            for j in range(len(g1) - 1):
+                g0[j+d] = cz.suma(g0[j+d], cz.mult(c, g1[j]))
+            while g0 != [] and g0[-1] == cz.cero:
+                g0.pop()
+            
+            t0 += [cz.cero]*(len(t1) + d - len(t0))
+            for j in range(len(t1)):
+                t0[j+d] = cz.suma(t0[j+d], cz.mult(c, t1[j]))
+            while t0 != [] and t0[-1] == cz.cero:
+                t0.pop()
         
-        # asignamos los nuevos valores a los g0, s0 y t0
-        g0 = g1_c
-        t0 = t1_c
-        s0 = s1_c
+        g0, g1 = g1, g0
+        t0, t1 = t1, t0
     
-    # nos aseguramos de que sean coprimos
-    gcd = f_q_m_pol.gcd(t1, g1, p, f, h)    
-    if gcd != f_q_m_pol.uno(p, f, h):
-        t1 = f_q_m_pol.div_pol(t1, gcd, p, f, h)
-        g1 = f_q_m_pol.div_pol(g1, gcd, p, f, h)
-        
     return(g1,t1)
 
 
@@ -472,3 +936,659 @@ def copy_vec(v):
         cop[i] = v[i] + []
     
     return(cop)
+
+
+def sindrome_bin(r,a,g,h):
+    '''
+    Parameters
+    ----------
+    r : LIST
+        Vector columna de tamaño l de elementos del cuerpo F2 que representa una palabra
+        recibida (cada elemento es [] o [1])
+    a : LIST
+        lista de enteros, cada uno de los 'l' ai's del código de Goppa C como
+        elemento de F2^m (véase f_2_m)
+    g : LIST
+        lista de enteros que representa el polinomio g de F2^m[x] (véase f_2_m_pol)
+    h : INT
+        entero que representa el polinomio irreducible que define F2^m
+
+    Returns
+    -------
+    sind, lista de enteros que representa el síndrome de r. Solo contribuyen
+    las posiciones i con ri = 1, que suman (x - ai)^(-1) mod g(x), guardado como 
+    un único entero por inversos_sindrome_bin, así que el síndrome es el XOR de 
+    esos enteros
+    '''
+    return(suma_inversos_bin(r,inversos_sindrome_bin(a,g,h),len(g) - 1,h))
+
+
+def sindrome_mat_bin(r,H,g,h,filas=None,imagen=None):
+    '''
+    Parameters
+    ----------
+    r : LIST
+        Vector columna de tamaño l de elementos del cuerpo F2 que representa una palabra
+        recibida (cada elemento es [] o [1])
+    H : LIST
+        matriz de control de paridad de dimensión mtxl sobre F2, la de mat_h
+    g : LIST
+        lista de enteros que representa el polinomio g de F2^m[x] (véase f_2_m_pol)
+    h : INT
+        entero que representa el polinomio irreducible que define F2^m
+    filas : LIST, opcional
+        las filas de H como enteros (filas_bin(H)), si ya se han calculado
+    imagen : LIST, opcional
+        transformada_bin(g,h), si ya se ha calculado
+
+    Returns
+    -------
+    sind, lista de enteros que representa el síndrome de r, como sindrome_bin, 
+    calculado a partir de H*r: cada fila de H es un entero (filas_bin) y su 
+    elemento de H*r es la paridad de los bits comunes con r. Si H*r = 0 se 
+    devuelve [] directamente; si no, el síndrome es el XOR de las imágenes de 
+    los bits no nulos de H*r (transformada_bin)
+    '''
+    rb = int(''.join('1' if ri and ri[0] else '0' for ri in reversed(r)), 2)
+    if filas is None:
+        filas = filas_bin(H)
+    Hr = 0 # bit i = fila i de H*r
+    for i in range(len(filas)):
+        if (filas[i] & rb).bit_count() & 1:
+            Hr |= 1 << i
+    
+    if Hr == 0: # r pertenece al código
+        return([])
+    
+    if imagen is None:
+        imagen = transformada_bin(g,h)
+    s = 0
+    i = 0
+    while Hr:
+        if Hr & 1:
+            s ^= imagen[i]
+        Hr >>= 1
+        i += 1
+    
+    m = h.bit_length() - 1
+    mascara = (1 << m) - 1
+    return(f_2_m_pol.vd_len([(s >> (j*m)) & mascara for j in range(len(g) - 1)]))
+
+
+def transformada_bin(g,h):
+    '''
+    Parameters
+    ----------
+    g : LIST
+        lista de enteros que representa el polinomio g de F2^m[x] (véase f_2_m_pol)
+    h : INT
+        entero que representa el polinomio irreducible que define F2^m
+
+    Returns
+    -------
+    Lista de m*t enteros: el de la posición j*m + k es el síndrome que 
+    corresponde a s_j = s^k (el bit j*m + k de H*r), es decir, el polinomio con 
+    coeficiente g_(i+j+1) * s^k en x^i (véase sindrome_mat), guardado como en 
+    inversos_sindrome_bin. CodigoGoppa la calcula una única vez por código
+    '''
+    m = h.bit_length() - 1
+    t = len(g) - 1
+    sol = []
+    for j in range(t):
+        for k in range(m):
+            v = 0
+            for i in range(t-1-j, -1, -1):
+                v = (v << m) | f_2_m.mult(g[i+j+1], 1 << k, h)
+            sol.append(v)
+    
+    return(sol)
+
+
+def filas_bin(H):
+    '''
+    Parameters
+    ----------
+    H : LIST
+        matriz sobre F2 definida por filas, con cada elemento [] o [1]
+
+    Returns
+    -------
+    Lista de enteros, uno por cada fila de H, cuyo bit j es el elemento j de la 
+    fila. CodigoGoppa las calcula una única vez para su matriz mat_h
+    '''
+    return([int(''.join('1' if x and x[0] else '0' for x in reversed(fila)), 2) for fila in H])
+
+
+def inversos_sindrome(a,g,p,f,h):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        lista de listas de listas, donde cada elemento de la lista principal
+        es un elemento de Fq^m.
+        concretamente, son cada uno de los 'l' ai's necesarios para definir 
+        el código de Goppa C
+    g : LIST
+        Lista de listas de listas que representa un polinomio de grado t con 
+        coeficientes en el cuerpo Fq^m
+    p : INT
+        número primo >= 2
+    f : LIST
+        polinomio de grado n >= 1 irreducible, mónico, con coeficientes en
+        el cuerpo Z/pZ
+    h : LIST
+        lista de listas que representa un polinomio de grado m >= 1 irreducible, 
+        mónico con coeficientes en el cuerpo Fq
+
+    Returns
+    -------
+    Lista con los l polinomios (x - ai)^(-1) mod g(x), cada uno como lista de t 
+    elementos de Fq^m. Si g(x) = q_i(x)*(x - ai) + g(ai), entonces 
+    (x - ai)^(-1) = -q_i(x) * g(ai)^(-1) mod g(x), con deg(q_i) < deg(g), y los 
+    g(ai) se invierten todos a la vez. Solo dependen del código, así que 
+    CodigoGoppa los calcula una única vez y los guarda con el código
+    '''
+    cz = f_q_m.contexto(p,f,h)
+    cp = f_q_m_pol.contexto(p,f,h)
+    t = len(g) - 1
+    div = [cp.div_lineal(g, ai) for ai in a] # q_i y g(ai)
+    g_a_inv = cz.inv_mult_batch([d[1] for d in div])
+    sol = []
+    for i in range(len(a)):
+        coef = cz.inv_adit(g_a_inv[i]) # -g(ai)^(-1)
+        q = div[i][0]
+        sol.append([cz.mult(coef, c) for c in q] + [cz.cero]*(t - len(q)))
+    
+    return(sol)
+
+
+def inversos_sindrome_bin(a,g,h):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        lista de enteros, cada uno de los 'l' ai's del código de Goppa C como
+        elemento de F2^m (véase f_2_m)
+    g : LIST
+        lista de enteros que representa el polinomio g de F2^m[x] (véase f_2_m_pol)
+    h : INT
+        entero que representa el polinomio irreducible que define F2^m
+
+    Returns
+    -------
+    Lista con los l polinomios (x - ai)^(-1) = q_i(x) * g(ai)^(-1) mod g(x), como 
+    en inversos_sindrome, cada uno guardado como un único entero cuyos bits 
+    j*m, ..., j*m + m - 1 son el coeficiente de x^j. CodigoGoppa los calcula 
+    una única vez por código
+    '''
+    m = h.bit_length() - 1
+    div = [f_2_m_pol.div_lineal(g, ai, h) for ai in a] # q_i y g(ai)
+    g_a_inv = f_2_m.inv_mult_batch([d[1] for d in div], h)
+    sol = []
+    for i in range(len(a)):
+        v = 0
+        for c in reversed(div[i][0]):
+            v = (v << m) | f_2_m.mult(c, g_a_inv[i], h)
+        sol.append(v)
+    
+    return(sol)
+
+
+def gcd_truncado_bin(a,b,k,h):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        lista de enteros que representa un polinomio de F2^m[x] mónico de grado k
+    b : LIST
+        lista de enteros que representa un polinomio de F2^m[x] de grado < k, 
+        el síndrome de la palabra recibida
+    k : INT
+        Grado del polinomio a
+    h : INT
+        entero que representa el polinomio irreducible que define F2^m
+
+    Returns
+    -------
+    g1 y t1, listas de enteros que representan los mismos polinomios que 
+    devuelve gcd_truncado
+    '''
+    s0, t0, g0 = [1], [], a + []
+    s1, t1, g1 = [], [1], b + []
+    
+    while (len(g1) - 1) >= (k/2):
+        q,r = f_2_m_pol.div_pol(g0, g1, h)
+        g0, g1 = g1, r
+        s0, s1 = s1, f_2_m_pol.suma(s0, f_2_m_pol.mult(q, s1, h))
+        t0, t1 = t1, f_2_m_pol.suma(t0, f_2_m_pol.mult(q, t1, h))
+    
+    # nos aseguramos de que sean coprimos
+    gcd = f_2_m_pol.gcd_ext(t1, g1, h)[0]
+    if gcd != [1]:
+        t1 = f_2_m_pol.div_pol(t1, gcd, h)[0]
+        g1 = f_2_m_pol.div_pol(g1, gcd, h)[0]
+    
+    return(g1,t1)
+
+
+def sugiyama_bin(a,b,k,h):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        lista de enteros que representa un polinomio de F2^m[x] mónico de grado k
+    b : LIST
+        lista de enteros que representa un polinomio de F2^m[x] de grado < k, 
+        el síndrome de la palabra recibida
+    k : INT
+        Grado del polinomio a
+    h : INT
+        entero que representa el polinomio irreducible que define F2^m
+
+    Returns
+    -------
+    g1 y t1, listas de enteros que representan los mismos polinomios que 
+    devuelve sugiyama
+    '''
+    g0, g1 = a + [], b + []
+    t0, t1 = [], [1]
+    
+    while (len(g1) - 1) >= (k/2):
+        lc_inv = f_2_m.inv_mult(g1[-1], h)
+        while len(g0) >= len(g1):
+            d = len(g0) - len(g1)
+            c = f_2_m.mult(g0.pop(), lc_inv, h)
+            for j in range(len(g1) - 1):
+                g0[j+d] ^= f_2_m.mult(c, g1[j], h)
+            while g0 != [] and g0[-1] == 0:
+                g0.pop()
+            
+            t0 += [0]*(len(t1) + d - len(t0))
+            for j in range(len(t1)):
+                t0[j+d] ^= f_2_m.mult(c, t1[j], h)
+            while t0 != [] and t0[-1] == 0:
+                t0.pop()
+        
+        g0, g1 = g1, g0
+        t0, t1 = t1, t0
+    
+    return(g1,t1)
+
+
+# Código de Goppa:
+class CodigoGoppa:
+    '''
+    Código de Goppa definido por el polinomio g y los ai's de la lista a, con 
+    coeficientes en Fq^m. Guarda los datos que no cambian de una operación a otra, 
+    que se calculan la primera vez que se usan, y sus métodos equivalen a las 
+    funciones del módulo sin los argumentos a, g, k, p, f y h:
+        g = copia del polinomio g
+        a = lista de los ai's (no se copia)
+        t = grado de g
+        l = número de ai's
+        binario = True si q = 2, en cuyo caso se usa la representación de f_2_m
+        hb, gb = enteros que representan h y g si q = 2 (véase f_2_m_pol), o None
+        ab = lista de los ai's como enteros si q = 2, o None hasta que se usa
+        g_a, g_a_inv = listas de los g(ai) y de sus inversos
+        hm = matriz de control de paridad de orden txl sobre Fq^m (mat_f_q_m.mat_h)
+        hq = matriz de control de paridad de orden mtxl sobre Fq (mat_h)
+        hs = forma canónica de hq, intercambiando columnas si falta algún pivote 
+             (mat_h_stan con permutar=True)
+        perm = columna de hq que ocupa cada columna de hs
+        hf = filas de hq como enteros si q = 2 (filas_bin)
+        tr = paso de H*r al síndrome si q = 2 (transformada_bin)
+        gc = matriz generadora en forma canónica, con las columnas de hs (mat_g_can)
+        inv = (x - ai)^(-1) mod g(x) para cada ai (inversos_sindrome)
+        pos = diccionario con la posición de cada ai
+        planos = planos de bits de los ai si q = 2 (véase f_2_m_planos)
+    Las matrices y listas que devuelven los métodos son las guardadas, así que 
+    no deben modificarse
+    '''
+    __slots__ = ('p', 'f', 'h', 'g', 'a', 't', 'l', 'binario', 'hb', 'gb', 'ab', 
+                 'g_a', 'g_a_inv', 'hm', 'hq', 'hs', 'perm', 'hf', 'tr', 'gc', 'inv', 
+                 'pos', 'planos')
+
+    def __init__(self,g,a,p,f,h):
+        cz = f_q_m.contexto(p,f,h)
+        self.p = cz.p
+        self.f = cz.f
+        self.h = cz.h
+        self.g = f_q_m_pol.cop_pol(g,p,f,h)
+        self.a = a
+        self.t = len(g) - 1
+        self.l = len(a)
+        self.binario = f_2_m.es_binario(p,f)
+        self.hb = None
+        self.gb = None
+        if self.binario:
+            self.hb = f_2_m.elem_a_int(h)
+            self.gb = f_2_m_pol.a_int(g)
+        self.ab = None
+        self.g_a = None
+        self.g_a_inv = None
+        self.hm = None
+        self.hq = None
+        self.hs = None
+        self.perm = None
+        self.hf = None
+        self.tr = None
+        self.gc = None
+        self.inv = None
+        self.pos = None
+        self.planos = None
+
+    def a_bin(self):
+        '''
+        Los ai's como enteros (véase f_2_m), si q = 2
+        '''
+        if self.ab is None:
+            self.ab = [f_2_m.elem_a_int(ai) for ai in self.a]
+        return(self.ab)
+
+    def planos_a(self):
+        '''
+        Los planos de bits del vector de los ai's (véase f_2_m_planos), si q = 2
+        '''
+        if self.planos is None:
+            self.planos = f_2_m_planos.a_planos(self.a_bin(), self.hb.bit_length() - 1)
+        return(self.planos)
+
+    def posiciones(self):
+        '''
+        Diccionario con la posición de cada ai en la lista a. Las claves son los 
+        ai como enteros si q = 2, y como tuplas de tuplas en otro caso
+        '''
+        if self.pos is None:
+            if self.binario:
+                ab = self.a_bin()
+                self.pos = {ab[i]: i for i in range(self.l)}
+            else:
+                self.pos = {tuple(tuple(c) for c in self.a[i]): i for i in range(self.l)}
+        return(self.pos)
+
+    def eval_g(self):
+        '''
+        Lista de los g(ai)
+        '''
+        if self.g_a is None:
+            if self.binario and self.l >= f_2_m_planos.UMBRAL_PLANOS:
+                hb = self.hb
+                g_a = f_2_m_planos.eval_pol(self.gb, self.planos_a(), hb, self.l)
+                self.g_a = [f_2_m.elem_de_int(x) for x in f_2_m_planos.de_planos(g_a, self.l)]
+            else:
+                cp = f_q_m_pol.contexto(self.p,self.f,self.h)
+                self.g_a = cp.eval_pol_multi(self.g, self.a)
+        return(self.g_a)
+
+    def inv_g(self):
+        '''
+        Lista de los g(ai)^(-1), con un único inverso para los l elementos
+        '''
+        if self.g_a_inv is None:
+            cz = f_q_m.contexto(self.p,self.f,self.h)
+            self.g_a_inv = cz.inv_mult_batch(self.eval_g())
+        return(self.g_a_inv)
+
+    def inversos(self):
+        '''
+        Los (x - ai)^(-1) mod g(x) con los que se calcula el síndrome: listas de t 
+        elementos de Fq^m (inversos_sindrome), o enteros si q = 2 (inversos_sindrome_bin)
+        '''
+        if self.inv is None:
+            if self.binario:
+                self.inv = inversos_sindrome_bin(self.a_bin(), self.gb, self.hb)
+            else:
+                self.inv = inversos_sindrome(self.a, self.g, self.p, self.f, self.h)
+        return(self.inv)
+
+    def mat_h_m(self):
+        '''
+        Matriz de control de paridad de orden txl sobre Fq^m, como mat_f_q_m.mat_h: 
+        la fila i tiene los g(aj)^(-1) * aj^i
+        '''
+        if self.hm is None:
+            cz = f_q_m.contexto(self.p,self.f,self.h)
+            H = [0]*self.t
+            if self.binario and self.l >= f_2_m_planos.UMBRAL_PLANOS:
+                hb = self.hb
+                U = self.planos_a()
+                fila = f_2_m_planos.a_planos([f_2_m.elem_a_int(x) for x in self.inv_g()], len(U))
+                for i in range(self.t):
+                    if i > 0:
+                        fila = f_2_m_planos.mult(fila, U, hb)
+                    H[i] = [f_2_m.elem_de_int(x) for x in f_2_m_planos.de_planos(fila, self.l)]
+            else:
+                for i in range(self.t):
+                    if i == 0:
+                        H[i] = self.inv_g() + []
+                    else:
+                        H[i] = [cz.mult(H[i-1][j], self.a[j]) for j in range(self.l)]
+            self.hm = H
+        return(self.hm)
+
+    def mat_h(self):
+        '''
+        Matriz de control de paridad de orden mtxl sobre Fq, como mat_h: cada 
+        elemento de mat_h_m se sustituye por la columna de sus m coeficientes
+        '''
+        if self.hq is None:
+            m = len(self.h) - 1
+            cero = f_q.cero(self.p,self.f)
+            Hm = self.mat_h_m()
+            H = [[cero]*self.l for i in range(m*self.t)]
+            for i in range(self.t):
+                for j in range(self.l):
+                    x = Hm[i][j]
+                    for k in range(len(x)):
+                        H[i*m + k][j] = x[k] + []
+            self.hq = H
+        return(self.hq)
+
+    def mat_h_stan(self):
+        '''
+        Forma canónica de la matriz de control de paridad, como mat_h_stan con 
+        permutar=True, de modo que siempre existe
+        '''
+        if self.hs is None:
+            H = [fila + [] for fila in self.mat_h()]
+            self.hs, self.perm = forma_canonica(H, self.p, self.f, True)
+        return(self.hs)
+
+    def permutacion(self):
+        '''
+        Columna de mat_h, es decir, índice del ai, que corresponde a cada columna 
+        de mat_h_stan
+        '''
+        self.mat_h_stan()
+        return(self.perm)
+
+    def mat_g_can(self):
+        '''
+        Forma canónica de la matriz generadora, como mat_g_can con permutar=True
+        '''
+        if self.gc is None:
+            self.gc = mat_g_de_h(self.mat_h_stan(), self.p, self.f)
+        return(self.gc)
+
+    def encode(self,m):
+        '''
+        Palabra del código que codifica el mensaje m, como encode con la matriz 
+        generadora mat_g_can y la permutación de sus columnas, en el orden de a
+        '''
+        return(encode(m, self.mat_g_can(), self.p, self.f, self.permutacion()))
+
+    def sindrome(self,r):
+        '''
+        Síndrome de la palabra recibida r, como sindrome
+        '''
+        if self.binario:
+            return(f_2_m_pol.de_int(suma_inversos_bin(r, self.inversos(), self.t, self.hb)))
+        return(suma_inversos(r, self.inversos(), self.t, self.p, self.f, self.h))
+
+    def decode(self,r,raices='evaluacion',solver='euclides',con_h=False):
+        '''
+        Palabra corregida y error de la palabra recibida r, como decode. Si con_h 
+        es True, el síndrome se calcula como H*r, con la matriz mat_h
+        '''
+        if raices not in ('evaluacion', 'fft', 'factorizacion', 'chien'):
+            raise ValueError('Método de búsqueda de raíces desconocido: ' + str(raices))
+        if raices == 'fft' and self.p != 2:
+            raise ValueError('La FFT aditiva solo está definida en característica 2')
+        if solver not in ('euclides', 'sugiyama'):
+            raise ValueError('Método de resolución de la ecuación clave desconocido: ' + str(solver))
+
+        p, f, h, t = self.p, self.f, self.h, self.t
+        l = len(r)
+        e = [f_q.cero(p, f)] * l # donde guardaremos el vector error
+        cq = f_q.contexto(p,f)
+        
+        if self.binario: # los mismos pasos, con elementos de F2^m como enteros
+            hb = self.hb
+            gb = self.gb
+            if con_h:
+                if self.hf is None:
+                    self.hf = filas_bin(self.mat_h())
+                    self.tr = transformada_bin(gb,hb)
+                sind = sindrome_mat_bin(r,self.mat_h(),gb,hb,self.hf,self.tr)
+            else:
+                sind = suma_inversos_bin(r,self.inversos(),t,hb)
+            
+            if sind == []: # la palabra recibida pertenece al código
+                return(copy_vec(r),e)
+            ab = self.a_bin()
+            
+            if solver == 'sugiyama':
+                n,o = sugiyama_bin(gb,sind,t,hb)
+            else:
+                n,o = gcd_truncado_bin(gb,sind,t,hb)
+            od = f_2_m_pol.deriv(o)
+            
+            if raices == 'evaluacion' and l >= f_2_m_planos.UMBRAL_PLANOS:
+                # o(ai), n(ai) y o'(ai) en todos los ai a la vez, por planos de bits
+                U = self.planos_a()
+                o_a = f_2_m_planos.eval_pol(o, U, hb, l)
+                na = f_2_m_planos.eval_pol(n, U, hb, l)
+                oda_inv = f_2_m_planos.inv_mult(f_2_m_planos.eval_pol(od, U, hb, l), hb)
+                # hay error en los ai con o(ai) = 0 y n(ai)/o'(ai) = 1 (bit 0 igual a 1)
+                err = f_2_m_planos.ceros(o_a, l) & f_2_m_planos.mult(na, oda_inv, hb)[0]
+                for i in range(l):
+                    if (err >> i) & 1:
+                        e[i] = f_q.uno(p, f)
+            else:
+                if raices == 'fft': # o(u) para todo u de F2^m, en la posición u
+                    o_u = f_2_m_pol.eval_fft(o, hb)
+                    err = [i for i in range(l) if o_u[ab[i]] == 0]
+                elif raices == 'factorizacion': # posición de cada raíz de o(x) entre los ai
+                    pos = self.posiciones()
+                    err = sorted(pos[u] for u in f_2_m_pol.raices(o, hb) if u in pos)
+                elif raices == 'chien':
+                    err = f_2_m_pol.busqueda_chien(o, ab, hb)
+                else:
+                    o_a = f_2_m_pol.eval_pol_multi(o, ab, hb)
+                    err = [i for i in range(l) if o_a[i] == 0]
+                ab_err = [ab[i] for i in err]
+                oda_inv = f_2_m.inv_mult_batch(f_2_m_pol.eval_pol_multi(od, ab_err, hb), hb)
+                na = f_2_m_pol.eval_pol_multi(n, ab_err, hb)
+                for k in range(len(err)):
+                    if f_2_m.mult(na[k], oda_inv[k], hb) & 1:
+                        e[err[k]] = f_q.uno(p, f)
+            
+            c = [cq.suma(r[i], e[i]) for i in range(l)] # c = r - e = r + e
+            return(c,e)
+        
+        a = self.a
+        g = self.g
+        if con_h:
+            sind = sindrome_mat(r,self.mat_h(),g,p,f,h) # síndrome de r, a partir de H*r
+        else:
+            sind = suma_inversos(r,self.inversos(),t,p,f,h) # síndrome de r
+        cz = f_q_m.contexto(p,f,h)
+        cp = f_q_m_pol.contexto(p,f,h)
+        
+        if sind != cp.cero: # la palabra recibida no pertenece al código
+            c = [f_q.cero(p, f)] * l; # donde guardaremos la palabra que sí pertenece al código
+            
+            # los polinomios necesarios para el algoritmo de decodificación
+            if solver == 'sugiyama':
+                n,o = sugiyama(g,sind,t,p,f,h)
+            else:
+                n,o = gcd_truncado(g,sind,t,p,f,h)
+            od = cp.deriv(o) # o'(x)
+            
+            # posiciones con error: los términos i tales que o(ai) = 0
+            if raices == 'fft': # o(u) para todo u de Fq^m, en la posición indice_fft(u)
+                o_u = cp.eval_fft(o)
+                err = [i for i in range(l) if o_u[cp.indice_fft(a[i])] == cz.cero]
+            elif raices == 'factorizacion': # posición de cada raíz de o(x) entre los ai
+                pos = self.posiciones()
+                err = [tuple(tuple(c) for c in u) for u in cp.raices(o)]
+                err = sorted(pos[u] for u in err if u in pos)
+            elif raices == 'chien':
+                err = cp.busqueda_chien(o, a)
+            else:
+                o_a = cp.eval_pol_multi(o, a)
+                err = [i for i in range(l) if o_a[i] == cz.cero]
+            a_err = [a[i] for i in err]
+            oda = cp.eval_pol_multi(od, a_err) # o'(ai)
+            oda_inv = cz.inv_mult_batch(oda) # inversos multiplicativos de los o'(ai)
+            na = cp.eval_pol_multi(n, a_err) # n(ai)
+            
+            for k in range(len(err)): # obtenemos los términos de error
+                ei = cz.mult(na[k], oda_inv[k])
+                e[err[k]] = ei[0]
+
+            for i in range(l): # c = r - e
+                c[i] = cq.suma(r[i],cq.inv_adit(e[i]))
+            
+            return(c,e)
+        
+        
+        else: # la palabra recibida pertenece al código
+            c = copy_vec(r)
+            return(c,e)
+
+    def decode_patterson(self,r):
+        '''
+        Palabra corregida y error de la palabra recibida r con el algoritmo de 
+        Patterson, como decode_patterson
+        '''
+        if not self.binario:
+            raise ValueError('El algoritmo de Patterson solo está definido para códigos binarios')
+
+        p, f, t = self.p, self.f, self.t
+        l = len(r)
+        e = [f_q.cero(p, f)] * l # donde guardaremos el vector error
+        cq = f_q.contexto(p,f)
+        hb = self.hb
+        gb = self.gb
+        sind = suma_inversos_bin(r,self.inversos(),t,hb)
+        
+        if sind == []: # la palabra recibida pertenece al código
+            return(copy_vec(r),e)
+        
+        d, s_inv = f_2_m_pol.gcd_ext(sind, gb, hb)[:2]
+        if d != [1]:
+            return(self.decode(r))
+        tau = f_2_m_pol.raiz_mod(f_2_m_pol.suma(s_inv, [0,1]), hb, gb)
+        
+        # Euclides extendido entre g y tau, hasta que el resto alfa tiene grado <= t/2
+        r0, r1 = gb + [], tau
+        b0, b1 = [], [1] # r_i = b_i * tau (mod g)
+        while len(r1) - 1 > t // 2:
+            q, res = f_2_m_pol.div_pol(r0, r1, hb)
+            r0, r1 = r1, res
+            b0, b1 = b1, f_2_m_pol.suma(b0, f_2_m_pol.mult(q, b1, hb))
+        o = f_2_m_pol.suma(f_2_m_pol.cuadrado(r1, hb), [0] + f_2_m_pol.cuadrado(b1, hb))
+        
+        # posiciones con error: los ai tales que o(ai) = 0, todas con error 1
+        if l >= f_2_m_planos.UMBRAL_PLANOS:
+            ceros = f_2_m_planos.ceros(f_2_m_planos.eval_pol(o, self.planos_a(), hb, l), l)
+            err = [i for i in range(l) if (ceros >> i) & 1]
+        else:
+            o_a = f_2_m_pol.eval_pol_multi(o, self.a_bin(), hb)
+            err = [i for i in range(l) if o_a[i] == 0]
+        for i in err:
+            e[i] = f_q.uno(p, f)
+        
+        c = [cq.suma(r[i], e[i]) for i in range(l)] # c = r - e = r + e
+        return(c,e)
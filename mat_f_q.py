@@ -3,16 +3,69 @@
 Diana Gómez Moreno
 
 Contiene las siguientes funciones: 
-    mat_h(g,a,p,f,h)
-    mat_cuad_al(k,p,f)
+    mat_h(g,a,p,f,h,binaria=False,plana=False)
+    mat_cuad_al_inv(k,p,f,binaria=False)
     mult_mat(a,b,p,f)
     mat_inv(M,p,f)
     vect_a_mat(v)
     mat_a_vect(m)
+
+Funciones auxiliares (modo tabla de f_q):
+    mat_a_ind(M,T)
+    mat_de_ind(M,T)
+    suma_filas_ind(a,b,c,T)
+    gauss_ind(M,npiv,T,perm=None)
+
+Funciones auxiliares (F2, filas como enteros):
+    mat_a_bits(M)
+    mat_de_bits(M,nc)
+    gauss_m4ri(M,npiv,perm=None)
+    vect_a_bits(v)
+    vect_de_bits(x,l)
+    mat_binaria(M)
+
+Funciones auxiliares (Fq, elementos en un array):
+    cabe_en_array(p)
+    mat_fq(M,p,f)
+
+Funciones auxiliares (Z/pZ, con NumPy):
+    usa_numpy(p,f)
+    mat_a_np(M)
+    mat_de_np(A)
+    mult_np(A,B,p)
+    gauss_np(A,npiv,p,perm=None)
+
+Matriz binaria:
+    MatrizBinaria(filas,nc)
+    FilaBinaria(matriz,i)
+
+Matriz sobre Fq:
+    MatrizFq(p,f,nf,nc,datos=None)
+    FilaFq(matriz,i)
+
+Si Fq es lo bastante pequeño como para tener tablas (f_q.tablas), mult_mat y mat_inv
+trabajan con matrices de índices enteros y solo convierten a listas al final.
+Si Fq = F2, mat_inv y mat_cuad_al_inv guardan cada fila como un entero y 
+aplican la reducción de Gauss-Jordan por el método de los cuatro rusos (gauss_m4ri).
+Además, mult_mat y mat_inv aceptan matrices de tipo MatrizBinaria, y mat_h y 
+mat_cuad_al_inv las devuelven con binaria=True.
+Para cualquier Fq, mult_mat y mat_inv aceptan también matrices de tipo MatrizFq, 
+que guardan los coeficientes de todos sus elementos en un único array y hacen 
+las operaciones de filas en su sitio; mat_h la devuelve con plana=True.
+Si Fq = Z/pZ con p > 2 y NumPy está instalado (usa_numpy), mult_mat y mat_inv 
+convierten las matrices de listas en arrays de enteros y operan con filas enteras 
+de NumPy, reduciendo módulo p lo menos posible.
 """
-import f_q, mat_f_q_m, random
+import f_q, z_pz_pol, mat_f_q_m, f_2_m, f_2_m_pol, f_2_m_planos, random
+from array import array
+try: # opcional, para las matrices sobre Z/pZ (véase usa_numpy)
+    import numpy as np
+except ImportError:
+    np = None
 
-def mat_h(g,a,p,f,h):
+USAR_NUMPY = True # si es False, no se usa NumPy aunque esté instalado
+
+def mat_h(g,a,p,f,h,binaria=False,plana=False):
     '''
     Parameters
     ----------
@@ -32,6 +85,11 @@ def mat_h(g,a,p,f,h):
     h : LIST
         lista de listas que representa un polinomio de grado m >= 1 irreducible, 
         mónico con coeficientes en el cuerpo Fq
+    binaria : BOOL, opcional
+        si es True, que solo es posible si Fq = F2, se devuelve una MatrizBinaria
+    plana : BOOL, opcional
+        si es True, se devuelve una MatrizFq, lo que requiere que sus 
+        coeficientes quepan en el array (véase cabe_en_array)
 
     Returns
     -------
@@ -40,9 +98,39 @@ def mat_h(g,a,p,f,h):
     Es una de las expresiones de la matriz de control de paridad del código de Goppa C 
     definido con los elementos de 'a' y polinomio g(x) del anillo Fq^m[x]
     '''
+    if binaria:
+        if not f_2_m.es_binario(p,f):
+            raise ValueError('Solo hay matrices binarias si Fq = F2')
+        # la fila i*m + k de H es el plano de bits k de la fila i de la matriz 
+        # sobre F2^m, g(aj)^(-1) * aj^i (véase f_2_m_planos)
+        hb = f_2_m.elem_a_int(h)
+        l = len(a)
+        U = f_2_m_planos.a_planos([f_2_m.elem_a_int(x) for x in a], hb.bit_length() - 1)
+        fila = f_2_m_planos.inv_mult(f_2_m_planos.eval_pol(f_2_m_pol.a_int(g), U, hb, l), hb)
+        filas = []
+        for i in range(len(g) - 1):
+            if i > 0:
+                fila = f_2_m_planos.mult(fila, U, hb)
+            filas += fila
+        return(MatrizBinaria(filas, l))
+    
     m = len(h) - 1  # grado de h
     t = len(g) - 1  # grado de g
     l = len(a) # número de ai's
+    Hm = mat_f_q_m.mat_h(g,a,p,f,h) #Hm tiene dimensión t x l
+    
+    if plana: # el coeficiente k del elemento (i,j) de Hm es el elemento (i*m+k,j) de H, 
+              # cuyos coeficientes se copian en el array sin crear ninguna lista
+        n = len(f) - 1
+        H = MatrizFq(p, f, m*t, l)
+        datos = H.datos
+        for i in range(t):
+            for j in range(l):
+                x = Hm[i][j]
+                for k in range(len(x)):
+                    pos = ((i*m + k)*l + j)*n
+                    datos[pos:pos+len(x[k])] = array('q', x[k])
+        return(H)
     
     # H será de dimensión mt x l
     H = [0]*(m*t) # definimos su número de filas
@@ -50,17 +138,17 @@ def mat_h(g,a,p,f,h):
     for i in range(m*t):
         H[i] = [f_q.cero(p, f)] * l # inicializamos cada fila de modo que contenga 
                                     # en cada entrada el elemento cero del cuerpo Fq
-    Hm = mat_f_q_m.mat_h(g,a,p,f,h) #Hm tiene dimensión t x l
+    cq = f_q.contexto(p,f)
 
     for i in range(t): # cada fila de la matriz Hm
         for j in range(l): # cada elemento de la fila i de la matriz Hm
             for k in range(len(Hm[i][j])): # cada coeficiente del elemento [i][j] en la matriz Hm
-                H[i*m+k][j] = f_q.suma(Hm[i][j][k], f_q.cero(p, f), p, f) # para que no estén las dos matrices 
-                                                                          # H y Hm relacionadas
+                H[i*m+k][j] = cq.suma(Hm[i][j][k], cq.cero) # para que no estén las dos matrices 
+                                                            # H y Hm relacionadas
     return(H)
 
 
-def mat_cuad_al_inv(k,p,f):
+def mat_cuad_al_inv(k,p,f,binaria=False):
     '''
     Parameters
     ----------
@@ -71,12 +159,18 @@ def mat_cuad_al_inv(k,p,f):
     f : LIST
         polinomio de grado n >= 1 irreducible, mónico, con coeficientes en
         el cuerpo Z/pZ
+    binaria : BOOL, opcional
+        si es True, que solo es posible si Fq = F2, M y M_inv se devuelven como 
+        MatrizBinaria
 
     Returns
     -------
     M y M_inv, listas de listas de listas, que representan matrices de dimensión
     kxk de elementos aleatorios de Fq tales que M_inv es la inversa de M
     '''
+    if binaria and not f_2_m.es_binario(p,f):
+        raise ValueError('Solo hay matrices binarias si Fq = F2')
+    
     M = [0]*k # número de filas
     
     for i in range(k):
@@ -84,6 +178,26 @@ def mat_cuad_al_inv(k,p,f):
         for j in range(k):
             M[i][j] = f_q.rand_elem(p, f)
     
+    if f_2_m.es_binario(p,f): # los mismos cambios, sobre las filas como enteros
+        M_b = MatrizBinaria(mat_a_bits(M), k)
+        inv = False
+        while not inv: # una sola reducción de [M | Id] da el rango de M y, si es k, la inversa
+            M_aug = [M_b.filas[i] | (1 << (k + i)) for i in range(k)]
+            if gauss_m4ri(M_aug, k) == k:
+                M_inv = MatrizBinaria([x >> k for x in M_aug], k)
+                inv = True
+            else:
+                fila = random.randint(0,k-1)
+                col = random.randint(0,k-1)
+                M[fila][col] = f_q.rand_elem(p, f)
+                if M[fila][col]:
+                    M_b.filas[fila] |= 1 << col
+                else:
+                    M_b.filas[fila] &= ~(1 << col)
+        if binaria:
+            return(M_b,M_inv)
+        return(M,M_inv.a_lista())
+    
     inv = False
     while not inv:
         try:
@@ -117,11 +231,43 @@ def mult_mat(a,b,p,f):
     -------
     sol, lista de listas de listas, que representa una matriz de dimensión 
     fa x cb cuyos elementos pertenecen al cuerpo Fq, resultado del producto 
-    de matrices a*b
+    de matrices a*b. Si a o b es una MatrizBinaria, o una MatrizFq, sol también lo es
     '''
+    if isinstance(a, MatrizBinaria) or isinstance(b, MatrizBinaria): # F2, filas como enteros
+        if not isinstance(a, MatrizBinaria):
+            a = mat_binaria(a)
+        if not isinstance(b, MatrizBinaria):
+            b = mat_binaria(b)
+        return(a.mult(b))
+    if isinstance(a, MatrizFq) or isinstance(b, MatrizFq): # operaciones de filas sobre el array
+        if not isinstance(a, MatrizFq):
+            a = mat_fq(a,p,f)
+        if not isinstance(b, MatrizFq):
+            b = mat_fq(b,p,f)
+        return(a.mult(b))
+    if usa_numpy(p,f): # producto de arrays de enteros, reduciendo por bloques
+        return(mat_de_np(mult_np(mat_a_np(a), mat_a_np(b), p)))
+    
     fa = len(a) # número de filas de a
     ca = len(a[0]) # número de columnas de a
     cb = len(b[0]) # número de columnas de b
+    
+    T = f_q.tablas(p,f)
+    if T is not None:
+        A = mat_a_ind(a,T)
+        B_t = [list(col) for col in zip(*mat_a_ind(b,T))] # columnas de b
+        sol = [[0]*cb for i in range(fa)]
+        for i in range(fa):
+            for j in range(cb):
+                if T.n == 1: # acumulamos y reducimos módulo p una sola vez
+                    sol[i][j] = sum(x*y for x,y in zip(A[i],B_t[j])) % p
+                else:
+                    s = 0
+                    for x,y in zip(A[i],B_t[j]):
+                        s = f_q.suma_ind(s, f_q.mult_ind(x,y,T), T)
+                    sol[i][j] = s
+        return(mat_de_ind(sol,T))
+    cq = f_q.contexto(p,f)
     sol = [0] * fa # definimos el número de filas de sol
     
     for i in range(fa):
@@ -131,8 +277,8 @@ def mult_mat(a,b,p,f):
     for i in range(fa):
         for j in range(cb):
             for k in range(ca):
-                prod = f_q.mult(a[i][k], b[k][j], p, f)
-                sol[i][j] = f_q.suma(sol[i][j], prod, p, f)
+                prod = cq.mult(a[i][k], b[k][j])
+                sol[i][j] = cq.suma(sol[i][j], prod)
     
     return(sol)
 
@@ -153,9 +299,31 @@ def mat_inv(M,p,f):
     Returns
     -------
     M_inv, lista de listas de listas que representa la matriz inversa de m, 
-    definida por filas
+    definida por filas, o una MatrizBinaria o MatrizFq si M lo es
     '''
     n = len(M) # M es una matriz de dimensiones nxn
+    
+    if isinstance(M, MatrizBinaria) or isinstance(M, MatrizFq):
+        return(M.inversa())
+    if f_2_m.es_binario(p,f): # [M | Id] con filas como enteros, por el método de los cuatro rusos
+        return(mat_binaria(M).inversa().a_lista())
+    if usa_numpy(p,f): # reducción de Gauss-Jordan de [M | Id] por filas enteras
+        M_np = np.hstack([mat_a_np(M), np.eye(n, dtype=np.int64)])
+        if gauss_np(M_np,n,p) < n:
+            raise ValueError('No es invertible')
+        return(mat_de_np(M_np[:, n:]))
+    
+    T = f_q.tablas(p,f)
+    if T is not None: # reducción de Gauss-Jordan sobre índices de [M | Id]
+        M_i = mat_a_ind(M,T)
+        for i in range(n):
+            M_i[i] = M_i[i] + [0]*n
+            M_i[i][n+i] = 1
+        if gauss_ind(M_i,n,T) < n:
+            raise ValueError('No es invertible')
+        return(mat_de_ind([M_i[i][n:] for i in range(n)],T))
+    
+    cq = f_q.contexto(p,f)
     M_i = [0]*n # adjuntamos a M la matriz identidad nxn
                 # luego, M_i tendrá dimensiones nx(2n)
     
@@ -180,14 +348,14 @@ def mat_inv(M,p,f):
             continuar = False
             fi = fi - 1
             
-        elif M_i[fi][fi] == f_q.cero(p, f): # el elemento (fi,fi) de la 
-                                            # diagonal es el cero del cuerpo f_q                             
+        elif M_i[fi][fi] == cq.cero: # el elemento (fi,fi) de la 
+                                     # diagonal es el cero del cuerpo f_q                             
             # Vemos con un bucle si algún elemento de esa columna es dinstinto de cero
             # y precisamos hacer un intercambio de filas
             change = False # nos indicará si hay que hacer intercambio de filas
             r = fi + 1 
             while (r<n and (not change)):
-                if M_i[r][fi] != f_q.cero(p,f):
+                if M_i[r][fi] != cq.cero:
                     change = True
                 else:
                     r = r + 1
@@ -210,19 +378,19 @@ def mat_inv(M,p,f):
                                   # salimos de este primer bucle
 
         else: 
-            inv1 = f_q.inv_mult(M_i[fi][fi], p, f)
+            inv1 = cq.inv_mult(M_i[fi][fi])
             for i in range(fi,l): # multiplicamos la fila fi por el inverso 
                                   # del elemento M_i[fi][fi] para que 
                                   # su primer elemento sea = f_q.uno()
-                M_i[fi][i] = f_q.mult(M_i[fi][i], inv1, p, f)
+                M_i[fi][i] = cq.mult(M_i[fi][i], inv1)
                
             for i in range(fi+1,n): # eliminamos todos los elementos en 
                                     # la columna fi mediante resta de filas
-                if M_i[i][fi] != f_q.cero(p, f):
+                if M_i[i][fi] != cq.cero:
                     for j in range(l-1,fi-1,-1):
-                        mult = f_q.mult(M_i[fi][j], M_i[i][fi], p, f)
-                        inv_adit = f_q.inv_adit(mult, p, f)
-                        M_i[i][j] = f_q.suma(M_i[i][j], inv_adit, p, f)
+                        mult = cq.mult(M_i[fi][j], M_i[i][fi])
+                        inv_adit = cq.inv_adit(mult)
+                        M_i[i][j] = cq.suma(M_i[i][j], inv_adit)
                 
         # Seguimos con la reducción gaussiana:
         fi = fi + 1
@@ -232,9 +400,9 @@ def mat_inv(M,p,f):
         i = n-1-ix   
         for j in range(i): # todas las filas a las que les deberemos restar la fila i
             for k in range(l-1,i-1,-1):
-                mult = f_q.mult(M_i[i][k],M_i[j][i], p, f)
-                inv_adit = f_q.inv_adit(mult, p, f)
-                M_i[j][k] = f_q.suma(M_i[j][k], inv_adit, p, f) 
+                mult = cq.mult(M_i[i][k],M_i[j][i])
+                inv_adit = cq.inv_adit(mult)
+                M_i[j][k] = cq.suma(M_i[j][k], inv_adit) 
           
     M_inv = [M_i[i][n:] for i in range(n)]    
     return M_inv
@@ -282,3 +450,976 @@ def mat_a_vect(m):
         v[i] = v_i
  
     return(v)
+
+
+# Funciones auxiliares (modo tabla de f_q):
+def mat_a_ind(M,T):
+    '''
+    Parameters
+    ----------
+    M : LIST
+        Lista de listas de listas que representa una matriz, definida por filas, 
+        cuyos elementos pertenecen al cuerpo Fq
+    T : TablasFq
+        tablas del cuerpo Fq (véase f_q.tablas)
+
+    Returns
+    -------
+    Lista de listas de enteros, la matriz M con cada elemento sustituido por su índice
+    '''
+    return([[f_q.a_ind(x,T) for x in fila] for fila in M])
+
+
+def mat_de_ind(M,T):
+    '''
+    Parameters
+    ----------
+    M : LIST
+        Lista de listas de enteros que representa una matriz de índices de elementos 
+        del cuerpo Fq
+    T : TablasFq
+        tablas del cuerpo Fq (véase f_q.tablas)
+
+    Returns
+    -------
+    Lista de listas de listas que representa la misma matriz con elementos de Fq
+    '''
+    return([[f_q.de_ind(x,T) for x in fila] for fila in M])
+
+
+def suma_filas_ind(a,b,c,T):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        lista de índices de elementos de Fq, una fila de una matriz
+    b : LIST
+        lista de índices de elementos de Fq, de la misma longitud que a
+    c : INT
+        índice de un elemento de Fq
+    T : TablasFq
+        tablas del cuerpo Fq (véase f_q.tablas)
+
+    Returns
+    -------
+    La fila a + c*b, como lista de índices
+    '''
+    if T.n == 1:
+        if T.p == 2:
+            return([x ^ y for x,y in zip(a,b)]) # c = 1
+        return([(x + c*y) % T.p for x,y in zip(a,b)])
+    
+    return([f_q.suma_ind(x, f_q.mult_ind(c,y,T), T) for x,y in zip(a,b)])
+
+
+def gauss_ind(M,npiv,T,perm=None):
+    '''
+    Parameters
+    ----------
+    M : LIST
+        Lista de listas de enteros que representa una matriz de índices de elementos 
+        del cuerpo Fq. Se modifica en el propio argumento
+    npiv : INT
+        número de columnas (las primeras) en las que se buscan pivotes
+    T : TablasFq
+        tablas del cuerpo Fq (véase f_q.tablas)
+    perm : LIST, opcional
+        lista con la columna original de cada columna de M. Si se da, cuando una 
+        columna no tiene pivote se intercambia con la primera de las siguientes 
+        que lo tenga, y los intercambios se aplican también a perm
+
+    Returns
+    -------
+    r, número de pivotes obtenidos. Se aplica reducción de Gauss-Jordan a M, 
+    intercambiando filas pero no columnas (salvo si se da perm), de modo que sus 
+    r primeras filas y columnas forman la identidad y el resto de elementos de 
+    esas columnas son nulos. Si r < npiv, ninguna fila a partir de la r tiene un 
+    elemento no nulo en la columna r (ni, si se da perm, en ninguna otra)
+    '''
+    nf = len(M)
+    r = 0
+    while r < npiv and r < nf:
+        piv = r # buscamos una fila con elemento no nulo en la columna r
+        while piv < nf and M[piv][r] == 0:
+            piv = piv + 1
+        if piv == nf and perm is not None: # buscamos otra columna con pivote
+            c = r + 1
+            while c < len(perm) and piv == nf:
+                piv = r
+                while piv < nf and M[piv][c] == 0:
+                    piv = piv + 1
+                if piv == nf:
+                    c = c + 1
+            if piv < nf: # intercambiamos las columnas r y c
+                for fila in M:
+                    fila[r], fila[c] = fila[c], fila[r]
+                perm[r], perm[c] = perm[c], perm[r]
+        if piv == nf:
+            break
+        M[r], M[piv] = M[piv], M[r]
+        
+        inv1 = f_q.inv_mult_ind(M[r][r],T)
+        if inv1 != 1:
+            M[r] = [f_q.mult_ind(x,inv1,T) for x in M[r]]
+        
+        for i in range(nf): # eliminamos el resto de elementos de la columna r
+            if i != r and M[i][r] != 0:
+                M[i] = suma_filas_ind(M[i], M[r], f_q.inv_adit_ind(M[i][r],T), T)
+        r = r + 1
+    
+    return(r)
+
+
+# Funciones auxiliares (F2, filas como enteros):
+def mat_a_bits(M):
+    '''
+    Parameters
+    ----------
+    M : LIST
+        Lista de listas de listas que representa una matriz, definida por filas, 
+        cuyos elementos pertenecen al cuerpo F2 (cada uno es [] o [1])
+
+    Returns
+    -------
+    Lista de enteros, uno por fila de M, cuyo bit j es el elemento de la columna j
+    '''
+    return([int(''.join('1' if x else '0' for x in reversed(fila)) or '0', 2) for fila in M])
+
+
+def mat_de_bits(M,nc):
+    '''
+    Parameters
+    ----------
+    M : LIST
+        Lista de enteros que representa una matriz de F2 por filas (véase mat_a_bits)
+    nc : INT
+        número de columnas de la matriz
+
+    Returns
+    -------
+    Lista de listas de listas que representa la misma matriz con elementos de F2
+    '''
+    sol = [0]*len(M)
+    for i in range(len(M)):
+        sol[i] = [f_q.cero(2, [1,1])] * nc # como en mat_h, el cero es común a toda la fila
+        x = M[i]
+        while x:
+            j = x.bit_length() - 1
+            sol[i][j] = [1]
+            x ^= 1 << j
+    return(sol)
+
+
+def gauss_m4ri(M,npiv,perm=None):
+    '''
+    Parameters
+    ----------
+    M : LIST
+        Lista de enteros que representa una matriz de F2 por filas (véase 
+        mat_a_bits). Se modifica en el propio argumento
+    npiv : INT
+        número de columnas (las primeras) en las que se buscan pivotes
+    perm : LIST, opcional
+        lista con la columna original de cada columna de M, como en gauss_ind
+
+    Returns
+    -------
+    r, número de pivotes obtenidos, con el mismo resultado que gauss_ind, pero 
+    con el método de los cuatro rusos (M4RI): se buscan los pivotes de k columnas 
+    seguidas, se reducen entre sí las k filas de esos pivotes, se guardan en una 
+    tabla las 2^k sumas de esas filas, y cada una de las demás filas se reduce 
+    con un único XOR, el de la suma indicada por sus bits en esas k columnas
+    '''
+    nf = len(M)
+    k = max(1, min(8, nf.bit_length() - 2)) # columnas por bloque, en torno a log2(nf)
+    r = 0
+    fin = False
+    while not fin and r < npiv and r < nf:
+        # Pivotes de las columnas r, r+1, ..., en las filas r, r+1, ...
+        kk = 0
+        while kk < k and r + kk < npiv and r + kk < nf:
+            c = r + kk
+            piv = c
+            encontrado = False
+            while not encontrado and piv < nf:
+                x = M[piv]
+                for j in range(kk): # reducimos la fila con los pivotes del bloque
+                    if (x >> (r + j)) & 1:
+                        x ^= M[r + j]
+                M[piv] = x
+                if (x >> c) & 1:
+                    encontrado = True
+                else:
+                    piv = piv + 1
+            
+            if piv == nf and perm is not None: # buscamos otra columna con pivote
+                o = 0
+                for i in range(c, nf):
+                    o |= M[i]
+                o >>= c
+                if o: # intercambiamos las columnas c y c2, y repetimos la columna c
+                    c2 = c + (o & -o).bit_length() - 1
+                    cambio = (1 << c) | (1 << c2)
+                    for i in range(nf):
+                        if ((M[i] >> c) ^ (M[i] >> c2)) & 1:
+                            M[i] ^= cambio
+                    perm[c], perm[c2] = perm[c2], perm[c]
+                    continue
+            if piv == nf:
+                fin = True
+                break
+            
+            M[c], M[piv] = M[piv], M[c]
+            x = M[c]
+            for j in range(kk): # la columna c queda nula en los otros pivotes del bloque
+                if (M[r + j] >> c) & 1:
+                    M[r + j] ^= x
+            kk = kk + 1
+        
+        if kk == 0:
+            break
+        
+        # Tabla con las 2^kk sumas de las filas de los pivotes: la suma de índice s 
+        # tiene en la columna r + j el bit j de s
+        tabla = [0] * (1 << kk)
+        for s in range(1, 1 << kk):
+            b = s & -s
+            tabla[s] = tabla[s ^ b] ^ M[r + b.bit_length() - 1]
+        
+        mascara = (1 << kk) - 1
+        for i in range(nf): # eliminamos las columnas del bloque en el resto de filas
+            if i < r or i >= r + kk:
+                s = (M[i] >> r) & mascara
+                if s:
+                    M[i] ^= tabla[s]
+        r = r + kk
+    
+    return(r)
+
+
+def vect_a_bits(v):
+    '''
+    Parameters
+    ----------
+    v : LIST
+        lista de listas que representa un vector columna de elementos de F2
+
+    Returns
+    -------
+    Entero cuyo bit i es el elemento i de v
+    '''
+    return(int(''.join('1' if x else '0' for x in reversed(v)) or '0', 2))
+
+
+def vect_de_bits(x,l):
+    '''
+    Parameters
+    ----------
+    x : INT
+        entero que representa un vector de F2 (véase vect_a_bits)
+    l : INT
+        número de elementos del vector
+
+    Returns
+    -------
+    Lista de listas que representa el vector columna de F2 de tamaño l
+    '''
+    return([[1] if (x >> i) & 1 else [] for i in range(l)])
+
+
+def mat_binaria(M):
+    '''
+    Parameters
+    ----------
+    M : LIST
+        Lista de listas de listas que representa una matriz, definida por filas, 
+        cuyos elementos pertenecen al cuerpo F2
+
+    Returns
+    -------
+    La misma matriz como MatrizBinaria
+    '''
+    return(MatrizBinaria(mat_a_bits(M), len(M[0]) if M else 0))
+
+
+# Funciones auxiliares (Fq, elementos en un array):
+def cabe_en_array(p):
+    '''
+    Parameters
+    ----------
+    p : INT
+        número primo >= 2
+
+    Returns
+    -------
+    True si los coeficientes de los elementos de Fq, enteros entre 0 y p - 1, 
+    caben en un array de enteros de 64 bits con signo, como los de MatrizFq
+    '''
+    return(p - 1 < 2**63)
+
+
+def mat_fq(M,p,f):
+    '''
+    Parameters
+    ----------
+    M : LIST
+        Lista de listas de listas que representa una matriz, definida por filas, 
+        cuyos elementos pertenecen al cuerpo Fq
+    p : INT
+        número primo >= 2
+    f : LIST
+        polinomio de grado n >= 1 irreducible, mónico, con coeficientes en
+        el cuerpo Z/pZ
+
+    Returns
+    -------
+    La misma matriz como MatrizFq. Lanza ValueError si sus coeficientes no 
+    caben en el array (véase cabe_en_array)
+    '''
+    n = len(f) - 1
+    datos = []
+    for fila in M:
+        for x in fila:
+            datos += x
+            datos += [0]*(n - len(x))
+    return(MatrizFq(p, f, len(M), len(M[0]) if M else 0, array('q', datos)))
+
+
+# Funciones auxiliares (Z/pZ, con NumPy):
+def usa_numpy(p,f):
+    '''
+    Parameters
+    ----------
+    p : INT
+        número primo >= 2
+    f : LIST
+        polinomio de grado n >= 1 irreducible, mónico, con coeficientes en
+        el cuerpo Z/pZ
+
+    Returns
+    -------
+    True si las matrices sobre Fq se operan con NumPy: si está instalado, 
+    USAR_NUMPY es True, n = 1 (los elementos son enteros módulo p), p > 2 (F2 
+    tiene su propia representación, véase MatrizBinaria) y el producto de dos 
+    elementos cabe en un entero de 64 bits
+    '''
+    return(np is not None and USAR_NUMPY and len(f) == 2 and p > 2 and 
+           (p - 1)**2 + p < 2**63)
+
+
+def mat_a_np(M):
+    '''
+    Parameters
+    ----------
+    M : LIST
+        Lista de listas de listas que representa una matriz, definida por filas, 
+        cuyos elementos pertenecen al cuerpo Z/pZ
+
+    Returns
+    -------
+    Array de NumPy de enteros de 64 bits con los elementos de M como enteros
+    '''
+    nc = len(M[0]) if M else 0
+    A = np.array([[x[0] if x else 0 for x in fila] for fila in M], dtype=np.int64)
+    return(A.reshape(len(M), nc))
+
+
+def mat_de_np(A):
+    '''
+    Parameters
+    ----------
+    A : ARRAY
+        Array de NumPy de enteros entre 0 y p - 1
+
+    Returns
+    -------
+    Lista de listas de listas que representa la misma matriz con elementos de Z/pZ
+    '''
+    return([[[x] if x else [] for x in fila] for fila in A.tolist()])
+
+
+def mult_np(A,B,p):
+    '''
+    Parameters
+    ----------
+    A : ARRAY
+        Array de NumPy de enteros entre 0 y p - 1, de dimensión fa x ca
+    B : ARRAY
+        Array de NumPy de enteros entre 0 y p - 1, de dimensión ca x cb
+    p : INT
+        número primo > 2 (véase usa_numpy)
+
+    Returns
+    -------
+    Array de NumPy con el producto A*B módulo p. Se reduce módulo p una vez 
+    por cada bloque de columnas de A tan largo como permiten los enteros de 
+    64 bits sin desbordarse
+    '''
+    if A.shape[1] != B.shape[0]:
+        raise ValueError('Las dimensiones de las matrices no son compatibles')
+    paso = (2**63 - 1 - p) // (p - 1)**2 # sumandos que caben en el acumulador
+    sol = np.zeros((A.shape[0], B.shape[1]), dtype=np.int64)
+    for k in range(0, A.shape[1], paso):
+        sol = (sol + A[:, k:k+paso] @ B[k:k+paso]) % p
+    return(sol)
+
+
+def gauss_np(A,npiv,p,perm=None):
+    '''
+    Parameters
+    ----------
+    A : ARRAY
+        Array de NumPy de enteros entre 0 y p - 1. Se modifica en el propio 
+        argumento
+    npiv : INT
+        número de columnas (las primeras) en las que se buscan pivotes
+    p : INT
+        número primo > 2 (véase usa_numpy)
+    perm : LIST, opcional
+        lista con la columna original de cada columna de A. Si se da, cuando una 
+        columna no tiene pivote se intercambia con la primera de las siguientes 
+        que lo tenga, y los intercambios se aplican también a perm
+
+    Returns
+    -------
+    r, número de pivotes obtenidos, como gauss_ind. Cada pivote elimina su 
+    columna de todas las filas a la vez, restando a la matriz el producto 
+    exterior de esa columna por la fila del pivote
+    '''
+    nf = A.shape[0]
+    r = 0
+    while r < npiv and r < nf:
+        filas = np.flatnonzero(A[r:, r]) # filas con elemento no nulo en la columna r
+        if len(filas) == 0 and perm is not None: # buscamos otra columna con pivote
+            cols = np.flatnonzero(A[r:, r+1:len(perm)].any(axis=0))
+            if len(cols) > 0: # intercambiamos las columnas r y c
+                c = r + 1 + int(cols[0])
+                A[:, [r, c]] = A[:, [c, r]]
+                perm[r], perm[c] = perm[c], perm[r]
+                filas = np.flatnonzero(A[r:, r])
+        if len(filas) == 0:
+            break
+        piv = r + int(filas[0])
+        if piv != r:
+            A[[r, piv]] = A[[piv, r]]
+        
+        inv1 = pow(int(A[r, r]), -1, p)
+        if inv1 != 1: # las columnas anteriores a la r de la fila r son nulas
+            A[r, r:] = A[r, r:] * inv1 % p
+        
+        col = A[:, r].copy() # eliminamos el resto de elementos de la columna r
+        col[r] = 0
+        if col.any():
+            A[:, r:] = (A[:, r:] - np.outer(col, A[r, r:])) % p
+        r = r + 1
+    
+    return(r)
+
+
+# Matriz binaria:
+class MatrizBinaria:
+    '''
+    Matriz de dimensión nf x nc sobre F2 en la que cada fila es un entero, cuyo 
+    bit j es el elemento de la columna j (véase mat_a_bits):
+        filas = lista de nf enteros
+        nc = número de columnas
+    Sumar filas es un XOR, el producto escalar de dos filas es la paridad del 
+    número de unos de su AND, y el producto de matrices se hace por el método de 
+    los cuatro rusos. M[i] devuelve la fila i como FilaBinaria, una vista sobre 
+    el entero de la fila con elementos [] o [1], de modo que se puede leer y 
+    modificar como las matrices de listas de listas de listas
+    '''
+    __slots__ = ('filas', 'nc')
+
+    def __init__(self,filas,nc):
+        self.filas = filas
+        self.nc = nc
+
+    def __len__(self):
+        return(len(self.filas))
+
+    def __getitem__(self,i):
+        if i < 0:
+            i += len(self.filas)
+        if not 0 <= i < len(self.filas):
+            raise IndexError('Índice de fila fuera de la matriz')
+        return(FilaBinaria(self, i))
+
+    def __iter__(self):
+        for i in range(len(self.filas)):
+            yield FilaBinaria(self, i)
+
+    def __eq__(self,b):
+        return(isinstance(b, MatrizBinaria) and self.nc == b.nc and self.filas == b.filas)
+
+    def copia(self):
+        return(MatrizBinaria(self.filas + [], self.nc))
+
+    def elem(self,i,j):
+        '''
+        Elemento (i,j) de la matriz, como entero 0 o 1
+        '''
+        return((self.filas[i] >> j) & 1)
+
+    def suma_filas(self,i,j):
+        '''
+        Suma a la fila i la fila j
+        '''
+        self.filas[i] ^= self.filas[j]
+
+    def prod_escalar(self,i,x):
+        '''
+        Producto escalar de la fila i por el vector x, dado como entero 
+        (véase vect_a_bits)
+        '''
+        return((self.filas[i] & x).bit_count() & 1)
+
+    def mult_vect(self,v):
+        '''
+        Producto de la matriz por el vector columna v de elementos de F2, que se 
+        devuelve como lista de listas: cada elemento es un AND y su paridad
+        '''
+        x = vect_a_bits(v)
+        return([[1] if (fila & x).bit_count() & 1 else [] for fila in self.filas])
+
+    def traspuesta(self):
+        '''
+        Matriz traspuesta, obtenida intercambiando filas y columnas de las cadenas 
+        de bits de las filas
+        '''
+        nf = len(self.filas)
+        if nf == 0 or self.nc == 0:
+            return(MatrizBinaria([0]*self.nc, nf))
+        formato = '0' + str(self.nc) + 'b'
+        cadenas = [format(x, formato) for x in reversed(self.filas)] # el carácter nc-1-j es el bit j
+        columnas = zip(*cadenas)
+        return(MatrizBinaria([int(''.join(c), 2) for c in columnas][::-1], nf))
+
+    def mult(self,b):
+        '''
+        Producto de matrices self*b por el método de los cuatro rusos: para cada 
+        bloque de k filas de b se guardan sus 2^k sumas, y cada fila de self 
+        suma la indicada por sus bits en esas k columnas
+        '''
+        if self.nc != len(b.filas):
+            raise ValueError('Las dimensiones de las matrices no son compatibles')
+        nf = len(self.filas)
+        k = max(1, min(8, nf.bit_length() - 2))
+        sol = [0]*nf
+        for c in range(0, self.nc, k):
+            kk = min(k, self.nc - c)
+            tabla = [0] * (1 << kk)
+            for s in range(1, 1 << kk):
+                bit = s & -s
+                tabla[s] = tabla[s ^ bit] ^ b.filas[c + bit.bit_length() - 1]
+            mascara = (1 << kk) - 1
+            for i in range(nf):
+                s = (self.filas[i] >> c) & mascara
+                if s:
+                    sol[i] ^= tabla[s]
+        return(MatrizBinaria(sol, b.nc))
+
+    def inversa(self):
+        '''
+        Matriz inversa, por el método de los cuatro rusos sobre [M | Id] 
+        (gauss_m4ri). Lanza ValueError si la matriz no es invertible
+        '''
+        n = len(self.filas)
+        if self.nc != n:
+            raise ValueError('No es invertible')
+        M_b = [self.filas[i] | (1 << (n + i)) for i in range(n)]
+        if gauss_m4ri(M_b,n) < n:
+            raise ValueError('No es invertible')
+        return(MatrizBinaria([x >> n for x in M_b], n))
+
+    def a_lista(self):
+        '''
+        La matriz como lista de listas de listas
+        '''
+        return(mat_de_bits(self.filas, self.nc))
+
+
+class FilaBinaria:
+    '''
+    Vista de la fila i de una MatrizBinaria, sin copiarla: F[j] lee el bit j del 
+    entero de la fila, como [] o [1], y F[j] = x lo cambia en la propia matriz
+        matriz = MatrizBinaria a la que pertenece la fila
+        i = índice de la fila
+    '''
+    __slots__ = ('matriz', 'i')
+
+    def __init__(self,matriz,i):
+        self.matriz = matriz
+        self.i = i
+
+    def __len__(self):
+        return(self.matriz.nc)
+
+    def __getitem__(self,j):
+        if isinstance(j, slice):
+            return(self.a_lista()[j])
+        nc = self.matriz.nc
+        if j < 0:
+            j += nc
+        if not 0 <= j < nc:
+            raise IndexError('Índice de columna fuera de la matriz')
+        return([1] if (self.matriz.filas[self.i] >> j) & 1 else [])
+
+    def __setitem__(self,j,x):
+        nc = self.matriz.nc
+        if j < 0:
+            j += nc
+        if not 0 <= j < nc:
+            raise IndexError('Índice de columna fuera de la matriz')
+        if x and x[0]:
+            self.matriz.filas[self.i] |= 1 << j
+        else:
+            self.matriz.filas[self.i] &= ~(1 << j)
+
+    def __iter__(self):
+        x = self.matriz.filas[self.i]
+        for j in range(self.matriz.nc):
+            yield [1] if (x >> j) & 1 else []
+
+    def __eq__(self,b):
+        if isinstance(b, FilaBinaria):
+            return(len(self) == len(b) and self.matriz.filas[self.i] == b.matriz.filas[b.i])
+        return(self.a_lista() == b)
+
+    def __repr__(self):
+        return(repr(self.a_lista()))
+
+    def a_lista(self):
+        '''
+        La fila como lista de listas
+        '''
+        return(vect_de_bits(self.matriz.filas[self.i], self.matriz.nc))
+
+
+# Matriz sobre Fq:
+class MatrizFq:
+    '''
+    Matriz de dimensión nf x nc sobre Fq = (Z/pZ)[t]/<f> cuyos elementos se 
+    guardan en un único array de enteros, coeficiente a coeficiente: el 
+    coeficiente de t^k del elemento (i,j) está en la posición (i*nc + j)*n + k.
+        p, f = primo y polinomio que definen Fq
+        n = grado de f
+        nf, nc = número de filas y de columnas
+        datos = array de nf*nc*n enteros entre 0 y p - 1, por lo que p no 
+                puede pasar de 2^63 (véase cabe_en_array)
+    La fila i ocupa las posiciones de i*nc*n a (i+1)*nc*n, y sus coeficientes 
+    de t^k son el corte con paso n que empieza en i*nc*n + k. Como multiplicar 
+    por un elemento c es lineal sobre Z/pZ, las operaciones de filas se hacen en 
+    su sitio sobre esos cortes, sin crear una lista por elemento. M[i] devuelve 
+    la fila i como FilaFq, una vista sobre el array con elementos de Fq como 
+    listas de coeficientes, de modo que se puede leer y modificar como las 
+    matrices de listas de listas de listas
+    '''
+    __slots__ = ('p', 'f', 'n', 'nf', 'nc', 'datos')
+
+    def __init__(self,p,f,nf,nc,datos=None):
+        if not cabe_en_array(p):
+            raise ValueError('p demasiado grande para guardar los coeficientes en un array de enteros de 64 bits')
+        self.p = p
+        self.f = f
+        self.n = len(f) - 1
+        self.nf = nf
+        self.nc = nc
+        if datos is None:
+            datos = array('q', [0]) * (nf*nc*self.n)
+        self.datos = datos
+
+    def __len__(self):
+        return(self.nf)
+
+    def __getitem__(self,i):
+        if i < 0:
+            i += self.nf
+        if not 0 <= i < self.nf:
+            raise IndexError('Índice de fila fuera de la matriz')
+        return(FilaFq(self, i))
+
+    def __iter__(self):
+        for i in range(self.nf):
+            yield FilaFq(self, i)
+
+    def __eq__(self,b):
+        return(isinstance(b, MatrizFq) and self.p == b.p and self.f == b.f and 
+               self.nf == b.nf and self.nc == b.nc and self.datos == b.datos)
+
+    def copia(self):
+        return(MatrizFq(self.p, self.f, self.nf, self.nc, array('q', self.datos)))
+
+    def elem(self,i,j):
+        '''
+        Elemento (i,j) de la matriz, como lista de coeficientes
+        '''
+        pos = (i*self.nc + j)*self.n
+        return(z_pz_pol.vd_len(self.datos[pos:pos+self.n].tolist(), self.p))
+
+    def pon_elem(self,i,j,x):
+        '''
+        Sustituye el elemento (i,j) de la matriz por x, lista de coeficientes
+        '''
+        pos = (i*self.nc + j)*self.n
+        for k in range(self.n):
+            self.datos[pos+k] = x[k] if k < len(x) else 0
+
+    def es_cero(self,i,j):
+        '''
+        True si el elemento (i,j) de la matriz es nulo
+        '''
+        pos = (i*self.nc + j)*self.n
+        return(not any(self.datos[pos:pos+self.n]))
+
+    def vista_fila(self,i):
+        '''
+        La fila i como memoryview del array, sin copiarla: sus cambios 
+        modifican la matriz
+        '''
+        return(memoryview(self.datos)[i*self.nc*self.n:(i+1)*self.nc*self.n])
+
+    def planos(self,i,desde=0):
+        '''
+        Los n cortes de coeficientes de la fila i a partir de la columna desde: 
+        el k-ésimo es la lista de coeficientes de t^k de sus elementos
+        '''
+        n = self.n
+        ini = (i*self.nc + desde)*n
+        fin = (i + 1)*self.nc*n
+        return([self.datos[ini+k:fin:n].tolist() for k in range(n)])
+
+    def pon_planos(self,i,planos,desde=0):
+        '''
+        Sustituye la fila i, a partir de la columna desde, por la dada por sus 
+        cortes de coeficientes (véase planos), que se reducen módulo p
+        '''
+        n = self.n
+        p = self.p
+        ini = (i*self.nc + desde)*n
+        fin = (i + 1)*self.nc*n
+        for k in range(n):
+            self.datos[ini+k:fin:n] = array('q', [x % p for x in planos[k]])
+
+    def mult_por(self,c):
+        '''
+        Matriz n x n de enteros del producto por el elemento c en Fq como 
+        aplicación lineal sobre Z/pZ: la entrada (k,s) es el coeficiente de t^k 
+        de c*t^s
+        '''
+        n = self.n
+        sol = [[0]*n for k in range(n)]
+        for s in range(n):
+            x = f_q.mult(c, [0]*s + [1], self.p, self.f)
+            for k in range(len(x)):
+                sol[k][s] = x[k]
+        return(sol)
+
+    def intercambia_filas(self,i,j):
+        if i != j:
+            tam = self.nc*self.n
+            fila = self.datos[i*tam:(i+1)*tam]
+            self.datos[i*tam:(i+1)*tam] = self.datos[j*tam:(j+1)*tam]
+            self.datos[j*tam:(j+1)*tam] = fila
+
+    def intercambia_columnas(self,i,j):
+        n = self.n
+        d = self.datos
+        for fila in range(0, self.nf*self.nc*n, self.nc*n):
+            a = fila + i*n
+            b = fila + j*n
+            d[a:a+n], d[b:b+n] = d[b:b+n], d[a:a+n]
+
+    def mult_fila(self,i,c,desde=0):
+        '''
+        Multiplica la fila i, a partir de la columna desde, por el elemento c
+        '''
+        y = self.planos(i, desde)
+        Mc = self.mult_por(c)
+        sol = [[0]*len(y[0]) for k in range(self.n)]
+        for k in range(self.n):
+            for s in range(self.n):
+                m = Mc[k][s]
+                if m:
+                    sol[k] = [u + m*v for u,v in zip(sol[k], y[s])]
+        self.pon_planos(i, sol, desde)
+
+    def suma_filas(self,i,j,c,desde=0,b=None):
+        '''
+        Suma a la fila i, a partir de la columna desde, la fila j multiplicada 
+        por el elemento c; la fila j es de la matriz b si se da, con el mismo 
+        número de columnas, y si no de la propia matriz
+        '''
+        if b is None:
+            b = self
+        x = self.planos(i, desde)
+        y = b.planos(j, desde)
+        if self.n == 1: # una sola operación por elemento, sin matriz de c
+            c0 = c[0]
+            self.pon_planos(i, [[u + c0*v for u,v in zip(x[0], y[0])]], desde)
+            return
+        Mc = self.mult_por(c)
+        for k in range(self.n):
+            for s in range(self.n):
+                m = Mc[k][s]
+                if m:
+                    x[k] = [u + m*v for u,v in zip(x[k], y[s])]
+        self.pon_planos(i, x, desde)
+
+    def mult(self,b):
+        '''
+        Producto de matrices self*b: cada fila del producto acumula, sin 
+        reducir módulo p, los cortes de las filas de b multiplicados por los 
+        coeficientes de las matrices de sus elementos (véase mult_por)
+        '''
+        if self.nc != b.nf:
+            raise ValueError('Las dimensiones de las matrices no son compatibles')
+        n = self.n
+        sol = MatrizFq(self.p, self.f, self.nf, b.nc)
+        filas_b = [b.planos(k) for k in range(b.nf)]
+        for i in range(self.nf):
+            acc = [[0]*b.nc for k in range(n)]
+            for k in range(self.nc):
+                if self.es_cero(i,k):
+                    continue
+                y = filas_b[k]
+                if n == 1:
+                    c0 = self.datos[i*self.nc + k]
+                    acc[0] = [u + c0*v for u,v in zip(acc[0], y[0])]
+                    continue
+                Mc = self.mult_por(self.elem(i,k))
+                for s in range(n):
+                    for r in range(n):
+                        m = Mc[s][r]
+                        if m:
+                            acc[s] = [u + m*v for u,v in zip(acc[s], y[r])]
+            sol.pon_planos(i, acc)
+        return(sol)
+
+    def gauss(self,npiv,perm=None):
+        '''
+        Reducción de Gauss-Jordan en su sitio, como gauss_ind: devuelve el 
+        número r de pivotes obtenidos en las npiv primeras columnas, 
+        intercambiando columnas y aplicando los cambios a perm solo si se da
+        '''
+        nf = self.nf
+        r = 0
+        while r < npiv and r < nf:
+            piv = r # buscamos una fila con elemento no nulo en la columna r
+            while piv < nf and self.es_cero(piv,r):
+                piv = piv + 1
+            if piv == nf and perm is not None: # buscamos otra columna con pivote
+                c = r + 1
+                while c < len(perm) and piv == nf:
+                    piv = r
+                    while piv < nf and self.es_cero(piv,c):
+                        piv = piv + 1
+                    if piv == nf:
+                        c = c + 1
+                if piv < nf: # intercambiamos las columnas r y c
+                    self.intercambia_columnas(r,c)
+                    perm[r], perm[c] = perm[c], perm[r]
+            if piv == nf:
+                break
+            self.intercambia_filas(r,piv)
+
+            x = self.elem(r,r)
+            if x != [1]: # las columnas anteriores a la r de la fila r son nulas
+                self.mult_fila(r, f_q.inv_mult(x,self.p,self.f), r)
+
+            for i in range(nf): # eliminamos el resto de elementos de la columna r
+                if i != r and not self.es_cero(i,r):
+                    self.suma_filas(i, r, f_q.inv_adit(self.elem(i,r),self.p,self.f), r)
+            r = r + 1
+
+        return(r)
+
+    def inversa(self):
+        '''
+        Matriz inversa, por reducción de Gauss-Jordan sobre [M | Id]. Lanza 
+        ValueError si la matriz no es invertible
+        '''
+        k = self.nf
+        if self.nc != k:
+            raise ValueError('No es invertible')
+        n = self.n
+        tam = k*n
+        M_i = MatrizFq(self.p, self.f, k, 2*k)
+        for i in range(k):
+            M_i.datos[2*i*tam:(2*i+1)*tam] = self.datos[i*tam:(i+1)*tam]
+            M_i.datos[(2*i+1)*tam + i*n] = 1
+        if M_i.gauss(k) < k:
+            raise ValueError('No es invertible')
+        sol = MatrizFq(self.p, self.f, k, k)
+        for i in range(k):
+            sol.datos[i*tam:(i+1)*tam] = M_i.datos[(2*i+1)*tam:(2*i+2)*tam]
+        return(sol)
+
+    def primeras_filas(self,nf):
+        '''
+        Matriz con las nf primeras filas
+        '''
+        return(MatrizFq(self.p, self.f, nf, self.nc, self.datos[:nf*self.nc*self.n]))
+
+    def a_lista(self):
+        '''
+        La matriz como lista de listas de listas
+        '''
+        return([FilaFq(self, i).a_lista() for i in range(self.nf)])
+
+
+class FilaFq:
+    '''
+    Vista de la fila i de una MatrizFq, sin copiarla: F[j] lee el elemento j de 
+    la fila como lista de coeficientes, y F[j] = x lo cambia en el propio array
+        matriz = MatrizFq a la que pertenece la fila
+        i = índice de la fila
+    '''
+    __slots__ = ('matriz', 'i')
+
+    def __init__(self,matriz,i):
+        self.matriz = matriz
+        self.i = i
+
+    def __len__(self):
+        return(self.matriz.nc)
+
+    def __getitem__(self,j):
+        if isinstance(j, slice):
+            return(self.a_lista()[j])
+        nc = self.matriz.nc
+        if j < 0:
+            j += nc
+        if not 0 <= j < nc:
+            raise IndexError('Índice de columna fuera de la matriz')
+        return(self.matriz.elem(self.i, j))
+
+    def __setitem__(self,j,x):
+        nc = self.matriz.nc
+        if j < 0:
+            j += nc
+        if not 0 <= j < nc:
+            raise IndexError('Índice de columna fuera de la matriz')
+        self.matriz.pon_elem(self.i, j, x)
+
+    def __iter__(self):
+        return(iter(self.a_lista()))
+
+    def __eq__(self,b):
+        if isinstance(b, FilaFq):
+            return(len(self) == len(b) and self.matriz.p == b.matriz.p and 
+                   self.matriz.f == b.matriz.f and 
+                   self.matriz.vista_fila(self.i) == b.matriz.vista_fila(b.i))
+        return(self.a_lista() == b)
+
+    def __repr__(self):
+        return(repr(self.a_lista()))
+
+    def a_lista(self):
+        '''
+        La fila como lista de listas
+        '''
+        n = self.matriz.n
+        p = self.matriz.p
+        fila = self.matriz.vista_fila(self.i).tolist()
+        return([z_pz_pol.vd_len(fila[j:j+n], p) for j in range(0, len(fila), n)])
@@ -8,7 +8,7 @@ Contiene las siguientes funciones:
     mat_h(g,a,p,f,h)
     mult_mat(a,b,p,f,h)    
 """
-import f_q_m, f_q_m_pol
+import f_q_m, f_q_m_pol, f_2_m, f_2_m_pol, f_2_m_planos
 
 def mat_h(g,a,p,f,h):
     '''
@@ -40,23 +40,34 @@ def mat_h(g,a,p,f,h):
     '''
     t = len(g) - 1
     l = len(a)
+    cz = f_q_m.contexto(p,f,h)
+    cp = f_q_m_pol.contexto(p,f,h)
     
     H = [0]*t
     
-    g_a_inv = [0]*l
+    if cz.hb is not None and l >= f_2_m_planos.UMBRAL_PLANOS:
+        # q = 2: todas las columnas a la vez, con los planos de bits de f_2_m_planos
+        hb = cz.hb
+        U = f_2_m_planos.a_planos([f_2_m.elem_a_int(x) for x in a], hb.bit_length() - 1)
+        fila = f_2_m_planos.inv_mult(f_2_m_planos.eval_pol(f_2_m_pol.a_int(g), U, hb, l), hb)
+        for i in range(t):
+            if i > 0:
+                fila = f_2_m_planos.mult(fila, U, hb)
+            H[i] = [f_2_m.elem_de_int(x) for x in f_2_m_planos.de_planos(fila, l)]
+        
+        return(H)
     
-    for i in range(l):
-        g_ai = f_q_m_pol.eval_pol(g, a[i], p, f, h)
-        g_a_inv[i] = f_q_m.inv_mult(g_ai, p, f, h)
+    g_a = cp.eval_pol_multi(g, a)
+    g_a_inv = cz.inv_mult_batch(g_a) # un único inverso para los l elementos g(ai)
         
     # Vamos definiendo una a una las t filas de la matriz H
     for i in range(t):
-        H[i] = [0]*l
-        
-        # Los elementos de la fila i son los siguientes: 
-        for j in range(l):
-            pot_aj = f_q_m.pot(a[j], i, p, f, h)
-            H[i][j] = f_q_m.mult(g_a_inv[j], pot_aj, p, f, h)            
+        # Los elementos de la fila i son g(aj)^(-1) * aj^i, es decir, los de la 
+        # fila anterior multiplicados por aj: 
+        if i == 0:
+            H[i] = g_a_inv
+        else:
+            H[i] = [cz.mult(H[i-1][j], a[j]) for j in range(l)]
             
     return (H)
 
@@ -89,6 +100,7 @@ def mult_mat(a,b,p,f,h):
     fa = len(a) # número de filas de a
     ca = len(a[0]) # número de columnas de a
     cb = len(b[0]) # número de columnas de b
+    cz = f_q_m.contexto(p,f,h)
     sol = [0] * fa # definimos el número de filas de sol
     
     for i in range(fa):
@@ -97,7 +109,7 @@ def mult_mat(a,b,p,f,h):
     for i in range(fa):
         for j in range(cb):
             for k in range(ca):
-                prod = f_q_m.mult(a[i][k], b[k][j], p, f, h)
-                sol[i][j] = f_q_m.suma(sol[i][j], prod, p, f, h)
+                prod = cz.mult(a[i][k], b[k][j])
+                sol[i][j] = cz.suma(sol[i][j], prod)
     
     return(sol)
@@ -4,14 +4,14 @@ Diana Gómez Moreno
 
 Contiene las siguientes funciones: 
     gen(g,a,p,f,h)
-    enc(v,Gpu,t,p,f)
-    dec(v,P,S,a,g,p,f,h)    
+    enc(v,Gpu,t,p,f,patterson=False)
+    dec(v,P,S,a,g,p,f,h,patterson=False,codigo=None)    
 
 Funciones auxiliares: 
-    incluir_error(c,t,p,f)
+    incluir_error(c,t,p,f,patterson=False)
     permut(n,p,f)
 """
-import mat_f_q, goppa, f_q, random
+import mat_f_q, goppa, f_q, f_2_m, random
 
 def gen(g,a,p,f,h):
     '''
@@ -37,23 +37,36 @@ def gen(g,a,p,f,h):
     Returns
     -------
     sk y pk, donde sk es la clave secreta del criptosistema de McEliece definido
-    con los parámetros anteriores, y pk es la clave pública del mismo
+    con los parámetros anteriores, y pk es la clave pública del mismo. 
+    La matriz generadora se calcula intercambiando columnas si hace falta 
+    (goppa.mat_g_can con permutar=True), así que sk guarda los ai's en el 
+    orden de sus columnas. Si Fq = F2, G, P, S y la clave pública son de tipo 
+    mat_f_q.MatrizBinaria. sk = [G,P,S,g,a,codigo], donde codigo es el 
+    goppa.CodigoGoppa de g y esos ai's, que guarda los datos del código que 
+    usa dec, de modo que se calculan una única vez
     '''
-    G = goppa.mat_g_can(g, a, p, f, h)
+    binaria = f_2_m.es_binario(p,f)
+    G, perm = goppa.mat_g_can(g, a, p, f, h, True)
+    a = [a[i] for i in perm] # el código con los ai's en este orden tiene a G en forma canónica
+    if binaria:
+        G = mat_f_q.mat_binaria(G)
     P = permut(len(G),p,f)
     k = len(G[0]) # dimensión del código
-    S = mat_f_q.mat_cuad_al_inv(k, p, f)[0]
+    S = mat_f_q.mat_cuad_al_inv(k, p, f, binaria)[0]
     t = len(g) - 1
     
     Gpk_0 = mat_f_q.mult_mat(G,S,p,f)
     Gpk = mat_f_q.mult_mat(P,Gpk_0,p,f)
 
-    sk = [G,P,S,g,a]
+    codigo = goppa.CodigoGoppa(g,a,p,f,h)
+    codigo.inversos() # los (x - ai)^(-1) mod g con los que dec calcula el síndrome
+
+    sk = [G,P,S,g,a,codigo]
     pk = [Gpk,t]
     return(sk,pk)
     
 
-def enc(v,Gpu,t,p,f):
+def enc(v,Gpu,t,p,f,patterson=False):
     '''
     Parameters
     ----------
@@ -63,7 +76,7 @@ def enc(v,Gpu,t,p,f):
         es el mensaje que se quiere transmitir
     Gpu : LIST
         lista de listas de listas que representa una matriz cuyos elementos pertenecen
-        al cuerpo Fq.
+        al cuerpo Fq, o mat_f_q.MatrizBinaria si Fq = F2.
         es la clave pública del criptosistema de McEliece
     t : INT
         grado del polinomio g que define el código de Goppa en el que se basa
@@ -73,21 +86,27 @@ def enc(v,Gpu,t,p,f):
     f : LIST
         polinomio de grado n >= 1 irreducible, mónico, con coeficientes en
         el cuerpo Z/pZ
+    patterson : BOOL, opcional
+        si es True, el error tiene hasta t posiciones no nulas, las que corrige 
+        goppa.decode_patterson en un código binario; si es False (por defecto), 
+        hasta t/2, las que corrige goppa.decode
 
     Returns
     -------
     v3, lista de listas que representa un vector columna cuyos elementos pertenecen
     al cuerpo Fq. Es el mensaje que se quería transmitir, encriptado según McEliece
     '''
-    v_mat = mat_f_q.vect_a_mat(v)
-    v1 = mat_f_q.mult_mat(Gpu,v_mat,p,f) # v1 = (G clave pública) * v
-    
-    v2 = mat_f_q.mat_a_vect(v1)
-    v3 = incluir_error(v2,t,p,f)[0] # v encriptado = m + e, con e error aleatorio 
+    if isinstance(Gpu, mat_f_q.MatrizBinaria): # cada elemento de Gpu*v es un AND y su paridad
+        v2 = Gpu.mult_vect(v)
+    else:
+        v_mat = mat_f_q.vect_a_mat(v)
+        v1 = mat_f_q.mult_mat(Gpu,v_mat,p,f) # v1 = (G clave pública) * v
+        v2 = mat_f_q.mat_a_vect(v1)
+    v3 = incluir_error(v2,t,p,f,patterson)[0] # v encriptado = m + e, con e error aleatorio 
     return(v3)
 
 
-def dec(v,P,S,a,g,p,f,h):
+def dec(v,P,S,a,g,p,f,h,patterson=False,codigo=None):
     '''
     Parameters
     ----------
@@ -98,12 +117,12 @@ def dec(v,P,S,a,g,p,f,h):
     P : LIST
         lista de listas de listas que representa una matriz de dimensión lxl, con l
         longitud del código en el que se basa el encriptado, cuyos elementos pertenecen
-        al cuerpo Fq.
+        al cuerpo Fq, o mat_f_q.MatrizBinaria si Fq = F2.
         es una permutación
     S : LIST
         lista de listas de listas que representa una matriz de dimensión kxk, con k
         dimensión del código en el que se basa el encriptado, cuyos elementos pertenecen
-        al cuerpo Fq.
+        al cuerpo Fq, o mat_f_q.MatrizBinaria si Fq = F2.
         es una matriz invertible 
     a : LIST
         lista de listas de listas, donde cada elemento de la lista principal
@@ -121,6 +140,13 @@ def dec(v,P,S,a,g,p,f,h):
     h : LIST
         lista de listas que representa un polinomio de grado m >= 1 irreducible, 
         mónico con coeficientes en el cuerpo Fq
+    patterson : BOOL, opcional
+        si es True, se corrige el error con goppa.decode_patterson, que corrige 
+        hasta t errores en un código binario; si es False (por defecto), con 
+        goppa.decode
+    codigo : CodigoGoppa, opcional
+        el código de Goppa de g y a, el último elemento de la clave secreta 
+        (véase gen). Si no se da, se construye uno nuevo en cada llamada
 
     Returns
     -------
@@ -130,16 +156,24 @@ def dec(v,P,S,a,g,p,f,h):
     l = len(P)
     k = len(S)
     
-    P_inv = mat_f_q.mat_inv(P,p,f) # la inversa de la permutación P
+    binaria = isinstance(P, mat_f_q.MatrizBinaria)
     S_inv = mat_f_q.mat_inv(S,p,f) # la inversa de la matriz S
     
-    v0 = mat_f_q.vect_a_mat(v)
-    v1_0 = mat_f_q.mult_mat(P_inv, v0, p, f) # P^{-1}*v
-    v1 = mat_f_q.mat_a_vect(v1_0)
+    if binaria: # la inversa de la permutación P es su traspuesta
+        v1 = P.traspuesta().mult_vect(v) # P^{-1}*v
+    else:
+        P_inv = mat_f_q.mat_inv(P,p,f) # la inversa de la permutación P
+        v0 = mat_f_q.vect_a_mat(v)
+        v1_0 = mat_f_q.mult_mat(P_inv, v0, p, f) # P^{-1}*v
+        v1 = mat_f_q.mat_a_vect(v1_0)
     
     # Eliminamos el error (corregimos la palabra recibida para que pertenezca al código)
-    t = len(g) - 1 # grado del polinomio g 
-    v2_0,e = goppa.decode(v1,a,g,t,p,f,h)
+    if codigo is None:
+        codigo = goppa.CodigoGoppa(g,a,p,f,h)
+    if patterson:
+        v2_0,e = codigo.decode_patterson(v1)
+    else:
+        v2_0,e = codigo.decode(v1)
     
     # Debemos quedarnos con S*m, y por la estructura de la matriz G, 
     # sabemos qué coordenadas forman el mensaje original
@@ -147,6 +181,8 @@ def dec(v,P,S,a,g,p,f,h):
     for i in range(len(Sm_0)):
         Sm_0[i] = f_q.inv_adit(Sm_0[i], p, f)
     
+    if binaria:
+        return(S_inv.mult_vect(Sm_0))
     Sm = mat_f_q.vect_a_mat(Sm_0)
     corr_0 = mat_f_q.mult_mat(S_inv, Sm, p, f)
     corr = mat_f_q.mat_a_vect(corr_0)
@@ -154,7 +190,7 @@ def dec(v,P,S,a,g,p,f,h):
 
 
 # Funciones auxiliares:
-def incluir_error(c,t,p,f):
+def incluir_error(c,t,p,f,patterson=False):
     '''
     Parameters
     ----------
@@ -168,6 +204,8 @@ def incluir_error(c,t,p,f):
     f : LIST
         polinomio de grado n >= 1 irreducible, mónico, con coeficientes en
         el cuerpo Z/pZ
+    patterson : BOOL, opcional
+        si es True, el peso máximo del error es t, en lugar de t/2
 
     Returns
     -------
@@ -180,6 +218,8 @@ def incluir_error(c,t,p,f):
     error = [f_q.cero(p,f)] * l # aquí almacenaremos los términos de error
     max_err = (t) // 2 # máximo número de errores que podemos decodificar con 
                        # nuestro código
+    if patterson: # goppa.decode_patterson corrige hasta t errores
+        max_err = t
                        
     peso = 0
     
@@ -213,18 +253,23 @@ def permut(n,p,f):
     -------
     P, lista de listas de listas que representa una matriz de orden nxn, 
     definida por filas, cuyos elementos pertenecen al cuerpo Fq.
+    Si Fq = F2, es una mat_f_q.MatrizBinaria
     '''
+    binaria = f_2_m.es_binario(p,f)
     P = [0] * n
     
     for i in range(n):
-        P[i] = []
-        j = 0
-        while j < n:
-            if i==j:
-                P[i].append([1])
-            else:
-                P[i].append([])
-            j+=1
+        if binaria: # la fila i de la identidad como entero
+            P[i] = 1 << i
+        else:
+            P[i] = []
+            j = 0
+            while j < n:
+                if i==j:
+                    P[i].append([1])
+                else:
+                    P[i].append([])
+                j+=1
             
     for w in range(50*n):
         f1 = random.randint(0,n-1)
@@ -239,4 +284,6 @@ def permut(n,p,f):
         P[f1] = pf2
         P[f2] = pf1
 
+    if binaria:
+        return(mat_f_q.MatrizBinaria(P, n))
     return(P)
@@ -12,12 +12,24 @@ Contiene las siguientes funciones:
     mult(a,b,p)
     inv_mult(a,p)
     pot(a,k,p)
-    rand_elem(p)
+    rand_elem(p,azar=None)
+
+Contexto del cuerpo:
+    Contexto(p)
+    contexto(p)
     
 Funciones auxiliares: 
     gcd(a,b)
+    factores_primos(n)
+    tabla_inversos(p)
+
+inv_mult y pot usan la aritmética entera de Python (pow); si p <= TAM_MAX_INVERSOS,
+el inverso se consulta en una tabla de p elementos que se construye una única vez.
 """
-import random, sympy
+import random
+
+TAM_MAX_INVERSOS = 2**16 # mayor p para el que se construye la tabla de inversos
+_inversos = {} # tabla de inversos ya construida para cada p, o None si p es demasiado grande
 
 def cero(p):
     '''    
@@ -112,8 +124,13 @@ def inv_mult(a,p):
     -------
     El inverso multiplicativo de a en el cuerpo Z/pZ
     '''
-    inv = gcd(a,p)[1]
-    return(inv % p)
+    T = tabla_inversos(p)
+    if T is not None:
+        return(T[a % p])
+
+    if a % p == 0: # el cero no tiene inverso; como gcd(0,p), se devuelve 0
+        return(0)
+    return(pow(a,-1,p))
 
 
 def pot(a,k,p):
@@ -131,38 +148,88 @@ def pot(a,k,p):
     -------
     El elemento del cuerpo Z/pZ resultado de calcular a^k
     '''    
-    if k==0:
-        return(uno(p))
-    
-    elif k > 0:
-        
-        if k%2==0: #k es par
-            x = pot(a,k//2,p)
-            sol = mult(x,x,p)
-            return(sol)
-        
-        else: #k es impar
-            sol = mult(a,pot(a,k-1,p),p)
-            return(sol)
-    else: 
-        return(pot(inv_mult(a,p),(-1)*k,p))
-
-
-def rand_elem(p):
+    if k < 0:
+        a = inv_mult(a,p)
+        k = -k
+
+    return(pow(a,k,p))
+
+
+def rand_elem(p,azar=None):
     '''
     Parameters
     ----------
     p : INT
         número primo >= 2
+    azar : random.Random, opcional
+        generador de números aleatorios del que se toma el elemento; si no se 
+        da, se usa el del módulo random
 
     Returns
     -------
     Un elemento aleatorio del cuerpo Z/pZ 
     '''
-    a = random.randint(0,p-1)   
+    if azar is None:
+        azar = random
+    a = azar.randint(0,p-1)   
     return(a)
 
 
+# Contexto del cuerpo:
+class Contexto:
+    '''
+    Cuerpo Z/pZ con p fijado. Guarda p y los elementos cero y uno, y sus 
+    métodos equivalen a las funciones del módulo sin el argumento p
+    '''
+    __slots__ = ('p', 'cero', 'uno', 'inversos')
+
+    def __init__(self,p):
+        self.p = p
+        self.cero = cero(p)
+        self.uno = uno(p)
+        self.inversos = tabla_inversos(p) # None si p > TAM_MAX_INVERSOS
+
+    def suma(self,a,b):
+        return((a+b) % self.p)
+
+    def inv_adit(self,a):
+        return((-a) % self.p)
+
+    def mult(self,a,b):
+        return((a*b) % self.p)
+
+    def inv_mult(self,a):
+        if self.inversos is not None:
+            return(self.inversos[a % self.p])
+        return(inv_mult(a,self.p))
+
+    def pot(self,a,k):
+        return(pot(a,k,self.p))
+
+    def rand_elem(self):
+        return(rand_elem(self.p))
+
+
+_contextos = {} # contexto ya construido para cada p
+
+def contexto(p):
+    '''
+    Parameters
+    ----------
+    p : INT
+        número primo >= 2
+
+    Returns
+    -------
+    El objeto Contexto del cuerpo Z/pZ, que se construye una única vez por p
+    '''
+    sol = _contextos.get(p)
+    if sol is None:
+        sol = Contexto(p)
+        _contextos[p] = sol
+    return(sol)
+
+
 # Funciones auxiliares:
 def gcd(a,b):
     '''
@@ -176,10 +243,72 @@ def gcd(a,b):
     Returns
     -------
     Los números enteros g,x,y tal que gcd(a,b)=g, con 
-    a*x + y*b = g
+    a*x + y*b = g, calculados con el algoritmo de Euclides extendido
+    '''
+    r0, r1 = a, b
+    x0, x1 = 1, 0
+    y0, y1 = 0, 1
+    while r1 != 0:
+        c = r0 // r1
+        r0, r1 = r1, r0 - c*r1
+        x0, x1 = x1, x0 - c*x1
+        y0, y1 = y1, y0 - c*y1
+
+    return(r0,x0,y0)
+
+
+def factores_primos(n):
+    '''
+    Parameters
+    ----------
+    n : INT
+        número entero >= 1
+
+    Returns
+    -------
+    Lista con los factores primos distintos de n
+    '''
+    sol = []
+    d = 2
+    while d*d <= n:
+        if n % d == 0:
+            sol.append(d)
+            while n % d == 0:
+                n = n // d
+        d = d + 1
+
+    if n > 1:
+        sol.append(n)
+
+    return(sol)
+
+
+def tabla_inversos(p):
+    '''
+    Parameters
+    ----------
+    p : INT
+        número primo >= 2
+
+    Returns
+    -------
+    Lista T de p enteros tal que T[a] es el inverso multiplicativo de a en Z/pZ 
+    (T[0] = 0), o None si p > TAM_MAX_INVERSOS. Se construye una única vez por p, 
+    con la recurrencia inv(a) = -(p // a) * inv(p % a) (mod p)
     '''
-    x, y, g = sympy.gcdex(a,b)              
-    return(g,x,y)
+    if p in _inversos:
+        return(_inversos[p])
+
+    T = None
+    if p <= TAM_MAX_INVERSOS:
+        T = [0]*p
+        if p > 1:
+            T[1] = 1
+        for a in range(2,p):
+            T[a] = (-(p // a) * T[p % a]) % p
+
+    _inversos[p] = T
+    return(T)
 
 
 
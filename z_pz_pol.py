@@ -11,6 +11,7 @@ Contiene las siguientes funciones:
     suma(a,b,p)
     inv_adit(a,b,p)
     mult(a,b,p)
+    cuadrado(a,p)
     gcd(a,b,p)
     gcd_ext(a,b,p)
     pot_mod(a,k,p,g) 
@@ -19,9 +20,37 @@ Funciones auxiliares:
     vd_len(a,p)
     div_pol(f,g,p)
     gcd_ext_no_mon(a,b,p)
+    mult_escuela(a,b)
+    cuadrado_escuela(a)
+    mult_kronecker(a,b)
+    div_newton(a,b,p)
+    inv_serie(a,k,p)
+    gcd_ext_hgcd(a,b,p)
+    hgcd(a,b,p)
+    mult_mat(M,N,p)
+
+mult y cuadrado calculan el producto con coeficientes enteros (sin reducir) y 
+reducen módulo p una única vez. Si ambos factores tienen al menos 
+UMBRAL_KRONECKER coeficientes se usa la sustitución de Kronecker (un único 
+producto de enteros de Python), que en CPython es más rápida que el algoritmo 
+de Karatsuba sobre listas para cualquier longitud; por debajo, el producto escolar.
+
+div_pol divide sobre una copia del dividendo, restando cada paso en su sitio y 
+reduciendo módulo p sólo el coeficiente que se va a anular (si el divisor es 
+mónico no se multiplica por el inverso de su coeficiente principal). Si el 
+cociente y el divisor tienen al menos UMBRAL_NEWTON coeficientes, se usa la 
+división de Newton (div_newton).
+
+gcd_ext_no_mon es el algoritmo de Euclides extendido iterativo; si a y b tienen 
+al menos UMBRAL_HGCD coeficientes, usa el algoritmo half-GCD (gcd_ext_hgcd), que 
+obtiene el mismo resultado con un número subcuadrático de operaciones.
 """
 import z_pz
 
+UMBRAL_KRONECKER = 12 # longitud mínima de los factores para usar la sustitución de Kronecker
+UMBRAL_NEWTON = 160 # longitud mínima del cociente y del divisor para dividir con Newton
+UMBRAL_HGCD = 128 # longitud mínima de a y b para usar el algoritmo half-GCD en gcd_ext
+
 def cero(p):
     '''
     Parameters
@@ -126,18 +155,42 @@ def mult(a,b,p):
     if a==cero(p) or b==cero(p):
         return(cero(p))
     
+    if min(len(a),len(b)) >= UMBRAL_KRONECKER:
+        sol = mult_kronecker(a,b) # coeficientes enteros, sin reducir
     else:
-        la = len(a)
-        lb = len(b)
-        l = la + lb - 1
-        sol = l*[z_pz.cero(p)]
-    
-        for i in range(la):
-            for j in range(lb):
-                sol[i+j] = z_pz.suma(sol[i+j],z_pz.mult(a[i],b[j],p),p)
-        
+        sol = mult_escuela(a,b)
+    return([c % p for c in sol])
+
+
+def cuadrado(a,p):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        polinomio de grado arbitrario del anillo (Z/pZ)[x]
+    p : INT
+        número primo >= 2
+
+    Returns
+    -------
+    Lista que representa el polinomio a*a del anillo (Z/pZ)[x], calculado con 
+    aproximadamente la mitad de productos que mult(a,a,p). Si p = 2, es 
+    sum(ai * x^(2i))
+    '''
+    if a==cero(p):
+        return(cero(p))
+
+    if p == 2:
+        sol = [0]*(2*len(a) - 1)
+        sol[::2] = a
         return(sol)
 
+    if len(a) >= UMBRAL_KRONECKER:
+        sol = mult_kronecker(a,a) # coeficientes enteros, sin reducir
+    else:
+        sol = cuadrado_escuela(a)
+    return([c % p for c in sol])
+
 
 def gcd(a,b,p):
     '''
@@ -209,7 +262,7 @@ def pot_mod(a,k,p,g):
     elif (k>0):
         if k%2==0: #k es par
             x = pot_mod(a,k//2,p,g)
-            aux = mult(x,x,p)
+            aux = cuadrado(x,p)
             sol = div_pol(aux,g,p)[1]
         
         else: #k es impar
@@ -274,26 +327,26 @@ def div_pol(f,g,p):
         
         return(q,r)
     
-    else:
-        lq = len(f) - len(g) + 1 #longitud del coeficiente
-        
-        q = [z_pz.cero(p)]*(lq) 
-        
-        cg_i = z_pz.inv_mult(g[-1],p) # inverso del coeficiente principal de g
-        
-        while len(f)>=len(g): #mientras podamos dividir f entre g
-            cf = f[-1] # coeficiente principal de f
-            
-            paso = [z_pz.cero(p)]*lq
-            paso[len(f)-len(g)] = z_pz.mult(cf,cg_i,p)
-            q = suma(q,paso,p)
-            
-            sumar = inv_adit(mult(g,paso,p),p)
-            f = suma(f,sumar,p)
-                   
-        r = f + []
-
-        return(q,r)
+    r = vd_len(f + [],p) # se trabaja sobre una copia de f, que se modifica
+    d = len(g) - 1
+    lq = len(r) - d #longitud del cociente
+    if min(lq,len(g)) >= UMBRAL_NEWTON:
+        return(div_newton(r,g,p))
+
+    q = [z_pz.cero(p)]*max(lq,0)
+    cg_i = z_pz.inv_mult(g[-1],p) # inverso del coeficiente principal de g
+    gl = g[:-1]
+    for i in range(len(r)-1, d-1, -1):
+        c = r[i] % p # coeficiente principal de lo que queda por dividir
+        if c:
+            if cg_i != 1: # si g es mónico no hace falta multiplicar
+                c = (c*cg_i) % p
+            q[i-d] = c
+            # restamos c * x^(i-d) * g, sin reducir módulo p
+            r[i-d:i] = [x - c*y for x,y in zip(r[i-d:i],gl)]
+
+    r = [x % p for x in r[:d]]
+    return(vd_len(q,p),vd_len(r,p))
         
         
 def gcd_ext_no_mon(a,b,p):
@@ -312,13 +365,261 @@ def gcd_ext_no_mon(a,b,p):
     g,x,y listas que representan a los polinomio del anillo (Z/pZ)[x] tal que 
     gcd(a,b) = g, con a*x + b*y = g, con g no necesariamente mónico
     '''
-    if b == cero(p):
-        return(a+[],uno(p),cero(p))
-    
-    else: 
-        q,r = div_pol(a,b,p)
-        
-        g,a2,b2 = gcd_ext_no_mon(b,r,p)
-        
-        return(g, b2, suma(a2,inv_adit(mult(q,b2,p),p),p))
+    if min(len(a),len(b)) >= UMBRAL_HGCD:
+        return(gcd_ext_hgcd(a,b,p))
+
+    r0, r1 = a, b
+    x0, x1 = uno(p), cero(p)
+    y0, y1 = cero(p), uno(p)
+    while r1 != cero(p):
+        q, r = div_pol(r0,r1,p)
+        r0, r1 = r1, r
+        x0, x1 = x1, suma(x0,inv_adit(mult(q,x1,p),p),p)
+        y0, y1 = y1, suma(y0,inv_adit(mult(q,y1,p),p),p)
+
+    return(r0+[],x0,y0)
+
+
 
+def mult_escuela(a,b):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        lista de enteros, coeficientes de un polinomio de Z[x]
+    b : LIST
+        lista de enteros, coeficientes de un polinomio de Z[x]
+
+    Returns
+    -------
+    Lista de longitud len(a) + len(b) - 1 con los coeficientes enteros de a*b,
+    calculados con el producto escolar
+    '''
+    if a == [] or b == []:
+        return([])
+
+    sol = [0]*(len(a) + len(b) - 1)
+    for i in range(len(a)):
+        ai = a[i]
+        if ai:
+            for j in range(len(b)):
+                sol[i+j] += ai*b[j]
+
+    return(sol)
+
+
+def cuadrado_escuela(a):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        lista de enteros, coeficientes de un polinomio de Z[x]
+
+    Returns
+    -------
+    Lista de longitud 2*len(a) - 1 con los coeficientes enteros de a*a. Cada 
+    producto ai*aj con i != j se calcula una sola vez
+    '''
+    if a == []:
+        return([])
+
+    sol = [0]*(2*len(a) - 1)
+    for i in range(len(a)):
+        ai = a[i]
+        if ai:
+            sol[2*i] += ai*ai
+            ai2 = 2*ai
+            for j in range(i+1, len(a)):
+                sol[i+j] += ai2*a[j]
+
+    return(sol)
+
+
+def mult_kronecker(a,b):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        lista de enteros >= 0, coeficientes de un polinomio de Z[x]
+    b : LIST
+        lista de enteros >= 0, coeficientes de un polinomio de Z[x]
+
+    Returns
+    -------
+    Lista de longitud len(a) + len(b) - 1 con los coeficientes enteros de a*b,
+    calculados con la sustitución de Kronecker: a y b se evalúan en x = 2^(8*nb),
+    con nb bytes suficientes para que ningún coeficiente de a*b se desborde, se 
+    multiplican como enteros y el resultado se lee de nuevo en bloques de nb bytes
+    '''
+    if a == [] or b == []:
+        return([])
+
+    cota = max(a)*max(b)*min(len(a),len(b)) # mayor valor posible de un coeficiente
+    nb = cota.bit_length()//8 + 1
+    A = int.from_bytes(b''.join([c.to_bytes(nb,'little') for c in a]), 'little')
+    B = int.from_bytes(b''.join([c.to_bytes(nb,'little') for c in b]), 'little')
+    C = (A*B).to_bytes(nb*(len(a) + len(b) - 1), 'little')
+
+    return([int.from_bytes(C[i:i+nb], 'little') for i in range(0, len(C), nb)])
+
+
+def div_newton(a,b,p):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        polinomio no nulo del anillo (Z/pZ)[x], sin ceros al final
+    b : LIST
+        polinomio del anillo (Z/pZ)[x], con len(b) <= len(a)
+    p : INT
+        número primo >= 2
+
+    Returns
+    -------
+    q y r, listas que representan los polinomios del anillo (Z/pZ)[x] tal que
+    a = q*b + r, calculados con la iteración de Newton: si rev(c) es el polinomio 
+    c con los coeficientes en orden inverso, rev(q) = rev(a) * rev(b)^(-1) 
+    (mod x^(len(a)-len(b)+1))
+    '''
+    lq = len(a) - len(b) + 1
+    inv = inv_serie(b[::-1],lq,p)
+    rq = mult(a[::-1][:lq],inv,p)[:lq]
+    q = vd_len((rq + [z_pz.cero(p)]*(lq - len(rq)))[::-1],p)
+
+    qb = mult(q,b,p)
+    r = [(a[i] - qb[i]) % p for i in range(len(b)-1)]
+    return(q,vd_len(r,p))
+
+
+def inv_serie(a,k,p):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        polinomio del anillo (Z/pZ)[x] con a[0] no nulo
+    k : INT
+        número entero >= 1
+    p : INT
+        número primo >= 2
+
+    Returns
+    -------
+    Lista que representa el polinomio g de grado < k tal que a*g = 1 (mod x^k), 
+    calculado con la iteración de Newton g = g*(2 - a*g), que duplica en cada 
+    paso la precisión
+    '''
+    g = [z_pz.inv_mult(a[0],p)]
+    prec = 1
+    while prec < k:
+        prec = min(2*prec,k)
+        e = [(-x) % p for x in mult(a[:prec],g,p)[:prec]] # -a*g (mod x^prec)
+        e[0] = (e[0] + 2) % p
+        g = mult(g,e,p)[:prec]
+
+    return(vd_len(g,p))
+
+
+def gcd_ext_hgcd(a,b,p):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        polinomio de grado arbitrario del anillo (Z/pZ)[x]
+    b : LIST
+        polinomio no nulo del anillo (Z/pZ)[x]
+    p : INT
+        número primo >= 2
+
+    Returns
+    -------
+    g,x,y listas que representan a los polinomio del anillo (Z/pZ)[x] tal que 
+    gcd(a,b) = g, con a*x + b*y = g, con g no necesariamente mónico. Son los 
+    mismos que los de gcd_ext_no_mon, pero la sucesión de cocientes del algoritmo 
+    de Euclides se obtiene por bloques con hgcd
+    '''
+    q, r = div_pol(a,b,p) # primer paso, tras el que deg(r0) > deg(r1)
+    r0, r1 = b, r
+    M = (cero(p), uno(p), uno(p), inv_adit(q,p))
+    while r1 != cero(p):
+        H = hgcd(r0,r1,p)
+        r0, r1 = (suma(mult(H[0],r0,p),mult(H[1],r1,p),p), 
+                  suma(mult(H[2],r0,p),mult(H[3],r1,p),p))
+        M = mult_mat(H,M,p)
+        if r1 == cero(p):
+            break
+
+        q, r = div_pol(r0,r1,p)
+        r0, r1 = r1, r
+        M = (M[2], M[3], suma(M[0],inv_adit(mult(q,M[2],p),p),p), 
+             suma(M[1],inv_adit(mult(q,M[3],p),p),p))
+
+    return(r0+[],M[0],M[1])
+
+
+def hgcd(a,b,p):
+    '''
+    Parameters
+    ----------
+    a : LIST
+        polinomio no nulo del anillo (Z/pZ)[x]
+    b : LIST
+        polinomio del anillo (Z/pZ)[x] con deg(b) < deg(a)
+    p : INT
+        número primo >= 2
+
+    Returns
+    -------
+    Tupla (m00,m01,m10,m11) de polinomios del anillo (Z/pZ)[x], producto de las 
+    matrices de los pasos del algoritmo de Euclides sobre a y b, tal que 
+    c = m00*a + m01*b y d = m10*a + m11*b son los dos restos consecutivos con 
+    deg(c) >= k > deg(d), k = ceil(deg(a)/2). Los cocientes se calculan de forma 
+    recursiva sobre las mitades superiores de a y b (algoritmo half-GCD), y por 
+    debajo de UMBRAL_HGCD coeficientes con el algoritmo de Euclides
+    '''
+    k = len(a) // 2 # ceil(deg(a)/2)
+    if len(a) < UMBRAL_HGCD: # pasos del algoritmo de Euclides hasta bajar de grado k
+        R = (uno(p), cero(p), cero(p), uno(p))
+        while len(b) - 1 >= k:
+            q, r = div_pol(a,b,p)
+            a, b = b, r
+            R = (R[2], R[3], suma(R[0],inv_adit(mult(q,R[2],p),p),p), 
+                 suma(R[1],inv_adit(mult(q,R[3],p),p),p))
+        return(R)
+
+    R = hgcd(a[k:],b[k:],p)
+    c, d = (suma(mult(R[0],a,p),mult(R[1],b,p),p), 
+            suma(mult(R[2],a,p),mult(R[3],b,p),p))
+    if len(d) - 1 < k:
+        return(R)
+
+    q, r = div_pol(c,d,p)
+    c, d = d, r
+    R = (R[2], R[3], suma(R[0],inv_adit(mult(q,R[2],p),p),p), 
+         suma(R[1],inv_adit(mult(q,R[3],p),p),p))
+    if len(d) - 1 < k:
+        return(R)
+
+    l = 2*k - (len(c) - 1)
+    S = hgcd(c[l:],d[l:],p)
+    return(mult_mat(S,R,p))
+
+
+def mult_mat(M,N,p):
+    '''
+    Parameters
+    ----------
+    M : TUPLE
+        matriz 2x2 (m00,m01,m10,m11) de polinomios del anillo (Z/pZ)[x]
+    N : TUPLE
+        matriz 2x2 (n00,n01,n10,n11) de polinomios del anillo (Z/pZ)[x]
+    p : INT
+        número primo >= 2
+
+    Returns
+    -------
+    La matriz producto M*N, en el mismo formato
+    '''
+    return(suma(mult(M[0],N[0],p),mult(M[1],N[2],p),p),
+           suma(mult(M[0],N[1],p),mult(M[1],N[3],p),p),
+           suma(mult(M[2],N[0],p),mult(M[3],N[2],p),p),
+           suma(mult(M[2],N[1],p),mult(M[3],N[3],p),p))